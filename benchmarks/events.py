@@ -0,0 +1,173 @@
+"""Benchmark of decoding events received from the events server.
+
+Decodes a corpus of socket lines with the events factory, once with the compiled
+decoders and once with the schemas only, as the factory did before. The default
+corpus replays a game of four players: every move sends the burst of
+`board_changed`, `players_changed`, `rack_changed` and `pile_count_changed`
+events, with draws and turn changes in between. A corpus recorded from a real
+server, one event per line, can be given instead.
+
+For every event name it reports the number of events and the median time
+to create an event.
+
+    python benchmarks/events.py [--corpus events.jsonl]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import random
+import statistics
+import sys
+import time
+
+import tuicub.app  # noqa: F401 -- resolves the import order of the game package
+from tuicub.common.events.factory import EventSchemas, TuicubEventsFactory
+from tuicub.common.schemas import TuicubEventSchema
+from tuicub.game.events import (
+    BoardChangedEventSchema,
+    PileCountChangedEventSchema,
+    PlayerLeftEventSchema,
+    PlayersChangedEventSchema,
+    PlayerWonEventSchema,
+    RackChangedEventSchema,
+    TileDrawnEventSchema,
+)
+from tuicub.game.models import TILES
+from tuicub.gameroom.events import (
+    GameroomDeletedEventSchema,
+    GameStartedEventSchema,
+    UserJoinedEventSchema,
+    UserLeftEventSchema,
+)
+
+PLAYERS = 4
+RACK_SIZE = 14
+MIN_TILESET_SIZE = 3
+MAX_TILESET_SIZE = 5
+
+
+def _line(name: str, data: dict) -> str:
+    return json.dumps({"name": name, "data": data})
+
+
+def _players(turn: int, racks: list[list[int]]) -> list[dict]:
+    return [
+        {
+            "name": f"Player {index}",
+            "user_id": f"user-{index}",
+            "tiles_count": len(rack),
+            "has_turn": index == turn % PLAYERS,
+        }
+        for index, rack in enumerate(racks)
+    ]
+
+
+def _corpus(moves: int, seed: int) -> list[str]:
+    """Lines of a simulated game with the bursts of events of every move."""
+    rng = random.Random(seed)
+    pile = list(range(len(TILES)))
+    rng.shuffle(pile)
+    racks = [[pile.pop() for _ in range(RACK_SIZE)] for _ in range(PLAYERS)]
+    board: list[list[int]] = []
+    lines = []
+    for turn in range(moves):
+        rack = racks[turn % PLAYERS]
+        lines.append(_line("turn_started", {}))
+        count = rng.randint(MIN_TILESET_SIZE, MAX_TILESET_SIZE)
+        if len(rack) >= count:
+            played, rack[:] = rack[:count], rack[count:]
+            board.append(played)
+            lines.append(_line("board_changed", {"board": board, "new_tiles": played}))
+        elif pile:
+            tile = pile.pop()
+            rack.append(tile)
+            lines.append(_line("tile_drawn", {"tile": tile}))
+            lines.append(_line("pile_count_changed", {"pile_count": len(pile)}))
+        lines.append(_line("rack_changed", {"rack": rack}))
+        lines.append(_line("players_changed", {"players": _players(turn, racks)}))
+        lines.append(_line("turn_ended", {}))
+    return lines
+
+
+def _factory(strict: bool) -> TuicubEventsFactory:
+    return TuicubEventsFactory(
+        event_schemas=EventSchemas(
+            base_schema=TuicubEventSchema(),
+            board_changed=BoardChangedEventSchema(),
+            game_started=GameStartedEventSchema(),
+            gameroom_deleted=GameroomDeletedEventSchema(),
+            pile_count_changed=PileCountChangedEventSchema(),
+            player_left=PlayerLeftEventSchema(),
+            player_won=PlayerWonEventSchema(),
+            players_changed=PlayersChangedEventSchema(),
+            rack_changed=RackChangedEventSchema(),
+            tile_drawn=TileDrawnEventSchema(),
+            user_joined=UserJoinedEventSchema(),
+            user_left=UserLeftEventSchema(),
+        ),
+        strict=strict,
+    )
+
+
+def _measure(factory: TuicubEventsFactory, lines: list[str]) -> dict[str, list[float]]:
+    times: dict[str, list[float]] = {}
+    for line in lines:
+        start = time.perf_counter()
+        factory.create(line)
+        elapsed = time.perf_counter() - start
+        times.setdefault(json.loads(line)["name"], []).append(elapsed)
+    return times
+
+
+def run(lines: list[str], repeats: int) -> dict[str, dict[str, float]]:
+    """Decode the corpus and return the count and median times of every event."""
+    decoders, schemas = _factory(strict=False), _factory(strict=True)
+    decoded: dict[str, list[float]] = {}
+    loaded: dict[str, list[float]] = {}
+    for _ in range(repeats):
+        for name, times in _measure(decoders, lines).items():
+            decoded.setdefault(name, []).extend(times)
+        for name, times in _measure(schemas, lines).items():
+            loaded.setdefault(name, []).extend(times)
+
+    return {
+        name: {
+            "count": len(times) / repeats,
+            "schemas_us": statistics.median(loaded[name]) * 1e6,
+            "decoders_us": statistics.median(times) * 1e6,
+        }
+        for name, times in sorted(decoded.items())
+    }
+
+
+def report(cases: dict[str, dict[str, float]]) -> None:
+    """Print the results as a table."""
+    print(f"{'event':<20} {'count':>6} {'schemas':>12} {'decoders':>12}")
+    for name, metrics in cases.items():
+        print(
+            f"{name:<20} {metrics['count']:6.0f} {metrics['schemas_us']:9.1f} us "
+            f"{metrics['decoders_us']:9.1f} us"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=pathlib.Path, help="Recorded event lines.")
+    parser.add_argument("--moves", type=int, default=200, help="Moves of the game.")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs of the corpus.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the game.")
+    args = parser.parse_args()
+
+    lines = (
+        [line for line in args.corpus.read_text().splitlines() if line.strip()]
+        if args.corpus
+        else _corpus(moves=args.moves, seed=args.seed)
+    )
+    report(run(lines, repeats=args.repeats))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""Benchmark of the cache keys of the board and scroll services.
+
+Builds full boards of 106 tiles and measures the cost of the keys the services
+look their caches up with: hashes of the tilesets, as used before, and the
+fingerprints carried by boards and tilesets. Every board is freshly built,
+as boards received from the server are, so no hash is cached in advance.
+
+    python benchmarks/fingerprint.py
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable, Hashable
+
+import tuicub.app  # noqa: F401 -- resolves the import order of the game package
+from tuicub.game.models import TILES, Board, Tileset, join_fingerprints
+from tuicub.game.services.packing import Rows, pack_rows
+
+WIDTH = 120
+MIN_TILESET_SIZE = 3
+MAX_TILESET_SIZE = 5
+
+
+def _board(rng: random.Random) -> Board:
+    tile_ids = list(range(len(TILES)))
+    rng.shuffle(tile_ids)
+    tilesets = []
+    while tile_ids:
+        count = rng.randint(MIN_TILESET_SIZE, MAX_TILESET_SIZE)
+        tilesets.append(Tileset.from_tile_ids(tile_ids[:count]))
+        tile_ids = tile_ids[count:]
+    return Board(tilesets=frozenset(tilesets))
+
+
+def _rebuild(board: Board) -> Board:
+    return Board(
+        tilesets=frozenset(Tileset(tiles=tileset.tiles) for tileset in board.tilesets)
+    )
+
+
+def _board_hash(board: Board, _: Rows) -> Hashable:
+    return hash((board.tilesets, WIDTH))
+
+
+def _board_fingerprint(board: Board, _: Rows) -> Hashable:
+    return hash((board.fingerprint, WIDTH))
+
+
+def _rows_hash(board: Board, rows: Rows) -> Hashable:
+    return hash((rows, Tileset(), Tileset(), WIDTH))
+
+
+def _rows_fingerprint(board: Board, rows: Rows) -> Hashable:
+    return hash(
+        (
+            tuple(join_fingerprints(t.fingerprint for t in row) for row in rows),
+            b"",
+            b"",
+            WIDTH,
+        )
+    )
+
+
+def _measure(key: Callable[[Board, Rows], Hashable], boards: list[Board]) -> float:
+    times = []
+    for case in boards:
+        board = _rebuild(case)
+        rows = pack_rows(board.tilesets, width=WIDTH)
+        start = time.perf_counter()
+        key(board, rows)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1e6
+
+
+def _measure_construction(boards: list[Board]) -> float:
+    times = []
+    for board in boards:
+        tiles = [tileset.tiles for tileset in board.tilesets]
+        start = time.perf_counter()
+        Board(tilesets=frozenset(Tileset(tiles=t) for t in tiles))
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1e6
+
+
+def run(boards: int, seed: int) -> dict[str, float]:
+    """Run all cases and return the median time of each in microseconds."""
+    rng = random.Random(seed)
+    cases = [_board(rng) for _ in range(boards)]
+    return {
+        "board construction": _measure_construction(cases),
+        "board key, hash": _measure(_board_hash, cases),
+        "board key, fingerprint": _measure(_board_fingerprint, cases),
+        "scroll key, hash": _measure(_rows_hash, cases),
+        "scroll key, fingerprint": _measure(_rows_fingerprint, cases),
+    }
+
+
+def report(cases: dict[str, float]) -> None:
+    """Print the results as a table."""
+    print(f"{'case':<26} {'median':>12}")
+    for case, median in cases.items():
+        print(f"{case:<26} {median:9.1f} us")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--boards", type=int, default=500, help="Boards to key.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of random boards.")
+    args = parser.parse_args()
+
+    report(run(boards=args.boards, seed=args.seed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""Benchmark of the board navigation index.
+
+Builds full boards of 106 tiles and compares the array-backed scroll index of
+the scroll service with the object graph it replaced, which allocated an edge
+distance object per element and resolved the neighbours of every element
+up front.
+
+For every board size and terminal width it reports the time to build the index
+of tiles, the memory allocated while building it and the time of a scroll.
+
+    python benchmarks/navigation.py
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+
+import tuicub.app  # noqa: F401 -- resolves the import order of the game package
+from tuicub.game.consts import TILE_WIDTH
+from tuicub.game.models import TILES, ScrollDirection, Tile, Tileset
+from tuicub.game.services.packing import Rows, pack_rows
+from tuicub.game.services.scroll_service import create_tiles_index, leftmost_distance
+
+WIDTHS = (80, 120, 200)
+BOARD_SIZES = (30, 60, 92)
+RACK_SIZE = 14
+MIN_TILESET_SIZE = 3
+MAX_TILESET_SIZE = 5
+
+Scroll = Callable[[Tile, ScrollDirection], Tile | None]
+
+
+class _EdgeDistance:
+    __slots__ = ("distance", "value")
+
+    def __init__(self, distance: int, value: Tile):
+        self.distance = distance
+        self.value = value
+
+
+def _take_closest(
+    entries: Sequence[_EdgeDistance], value: _EdgeDistance
+) -> _EdgeDistance | None:
+    if not entries:
+        return None
+    distances = [entry.distance for entry in entries]
+    pos = bisect_left(distances, value.distance)
+    if pos == 0:
+        return entries[0]
+    if pos == len(distances):
+        return entries[-1]
+    if distances[pos] - value.distance < value.distance - distances[pos - 1]:
+        return entries[pos]
+    return entries[pos - 1]
+
+
+def _object_graph(rows: Rows, rack: Tileset, width: int) -> Scroll:
+    """The eager scroll map of tiles the scroll service used to build."""
+    matrix: list[list[_EdgeDistance]] = []
+    for row in ((rack,), *reversed(rows)):
+        distance = leftmost_distance(row, width)
+        entries = []
+        for tileset in row:
+            entries.extend(
+                _EdgeDistance(distance + index * TILE_WIDTH, tile)
+                for index, tile in enumerate(tileset.tiles)
+            )
+            distance += tileset.width()
+        matrix.append(entries)
+
+    nodes: dict[Tile, dict[ScrollDirection, Tile | None]] = {}
+    for row_index, row in enumerate(matrix):
+        for index, entry in enumerate(row):
+            up = (
+                _take_closest(matrix[row_index + 1], entry)
+                if row_index < len(matrix) - 1
+                else None
+            )
+            down = _take_closest(matrix[row_index - 1], entry) if row_index else None
+            nodes[entry.value] = {
+                ScrollDirection.LEFT: row[index - 1].value if index else None,
+                ScrollDirection.RIGHT: (
+                    row[index + 1].value if index < len(row) - 1 else None
+                ),
+                ScrollDirection.UP: up.value if up else None,
+                ScrollDirection.DOWN: down.value if down else None,
+            }
+
+    return lambda tile, direction: nodes[tile][direction]
+
+
+def _index(rows: Rows, rack: Tileset, width: int) -> Scroll:
+    return create_tiles_index(board=rows, rack=rack, screen_width=width).neighbour
+
+
+def _layout(size: int, width: int, rng: random.Random) -> tuple[Rows, Tileset]:
+    tile_ids = list(range(len(TILES)))
+    rng.shuffle(tile_ids)
+    rack = Tileset.from_tile_ids(tile_ids[:RACK_SIZE])
+    tile_ids = tile_ids[RACK_SIZE : RACK_SIZE + size]
+    tilesets = []
+    while tile_ids:
+        count = rng.randint(MIN_TILESET_SIZE, MAX_TILESET_SIZE)
+        tilesets.append(Tileset.from_tile_ids(tile_ids[:count]))
+        tile_ids = tile_ids[count:]
+    return pack_rows(tilesets, width=width), rack
+
+
+def _measure(
+    build: Callable[[Rows, Tileset, int], Scroll],
+    layouts: list[tuple[Rows, Tileset]],
+    width: int,
+    scrolls: int,
+    rng: random.Random,
+) -> dict[str, float]:
+    build_times = []
+    scroll_times = []
+    for rows, rack in layouts:
+        start = time.perf_counter()
+        scroll = build(rows, rack, width)
+        build_times.append(time.perf_counter() - start)
+
+        tile = rack.tiles[0]
+        for _ in range(scrolls):
+            direction = rng.choice(list(ScrollDirection))
+            start = time.perf_counter()
+            tile = scroll(tile, direction) or tile
+            scroll_times.append(time.perf_counter() - start)
+
+    rows, rack = layouts[0]
+    tracemalloc.start()
+    build(rows, rack, width)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "build_us": statistics.median(build_times) * 1e6,
+        "peak_alloc_kib": peak / 1024,
+        "scroll_us": statistics.median(scroll_times) * 1e6,
+    }
+
+
+def run(layouts: int, scrolls: int, seed: int) -> dict[str, dict[str, dict[str, float]]]:
+    """Run all cases and return the metrics of both implementations."""
+    cases: dict[str, dict[str, dict[str, float]]] = {}
+    for size in BOARD_SIZES:
+        for width in WIDTHS:
+            rng = random.Random(seed)
+            boards = [_layout(size, width, rng) for _ in range(layouts)]
+            cases[f"tiles_{size}@{width}"] = {
+                name: _measure(build, boards, width, scrolls, random.Random(seed))
+                for name, build in (("object graph", _object_graph), ("index", _index))
+            }
+    return cases
+
+
+def report(cases: dict[str, dict[str, dict[str, float]]]) -> None:
+    """Print the results as a table."""
+    print(f"{'case':<16} {'index':<14} {'build':>12} {'peak alloc':>14} {'scroll':>10}")
+    for case, implementations in cases.items():
+        for name, metrics in implementations.items():
+            print(
+                f"{case:<16} {name:<14} {metrics['build_us']:9.1f} us "
+                f"{metrics['peak_alloc_kib']:10.1f} KiB "
+                f"{metrics['scroll_us']:7.2f} us"
+            )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--layouts", type=int, default=100, help="Layouts per case.")
+    parser.add_argument("--scrolls", type=int, default=50, help="Scrolls per layout.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of random layouts.")
+    args = parser.parse_args()
+
+    report(run(layouts=args.layouts, scrolls=args.scrolls, seed=args.seed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""Benchmark of the strategies packing the board into rows.
+
+Builds synthetic boards of up to 106 tiles and replays a game of random tile
+moves between tilesets. Every move is packed with each packing strategy and,
+if installed, with the `binpacking` package the board service used before.
+
+For every board size and terminal width it reports the time per move, the
+number of rows used, the width left unused in all rows and how many unchanged
+tilesets moved to another place in the layout.
+
+    python benchmarks/packing.py
+
+Run with `nox -s packing_benchmark -- [arguments]` to use an isolated environment.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterator
+
+import tuicub.app  # noqa: F401 -- resolves the import order of the game package
+from tuicub.common.config import Packing
+from tuicub.game.models import TILES, Tileset
+from tuicub.game.services.packing import Rows, create_packing_strategy
+
+try:
+    import binpacking  # type: ignore[import]
+except ImportError:
+    binpacking = None
+
+WIDTHS = (80, 120, 200)
+BOARD_SIZES = (10, 30, 60, 106)
+MIN_TILESET_SIZE = 3
+MAX_TILESET_SIZE = 5
+
+Board = frozenset[Tileset]
+
+
+def _board(size: int, rng: random.Random) -> Board:
+    tile_ids = list(range(size))
+    tilesets = []
+    while tile_ids:
+        count = rng.randint(MIN_TILESET_SIZE, MAX_TILESET_SIZE)
+        tilesets.append(Tileset.from_tile_ids(tile_ids[:count]))
+        tile_ids = tile_ids[count:]
+    return frozenset(tilesets)
+
+
+def _moves(board: Board, count: int, rng: random.Random) -> Iterator[Board]:
+    """Yield boards after moving a random tile to another random tileset."""
+    for _ in range(count):
+        tilesets = sorted(board, key=lambda tileset: [t.id for t in tileset.tiles])
+        if len(tilesets) < 2:  # noqa: PLR2004
+            return
+
+        source, destination = rng.sample(tilesets, 2)
+        tile = rng.choice(source.tiles)
+        changed = {
+            Tileset(tiles=tuple(t for t in source.tiles if t != tile)),
+            Tileset(tiles=(*destination.tiles, tile)),
+        }
+        board = (board - {source, destination}) | {t for t in changed if t.tiles}
+        yield board
+
+
+def _binpacking(board: Board, width: int) -> Rows:
+    return tuple(
+        tuple(row.keys())
+        for row in binpacking.to_constant_volume(
+            {tileset: tileset.width() for tileset in board}, width
+        )
+    )
+
+
+def _positions(rows: Rows) -> dict[Tileset, tuple[int, int]]:
+    return {
+        tileset: (row_index, index)
+        for row_index, row in enumerate(rows)
+        for index, tileset in enumerate(row)
+    }
+
+
+def _measure(
+    pack: Callable[[Board, int], Rows], boards: list[Board], width: int
+) -> dict[str, float]:
+    times = []
+    rows_used = []
+    wasted = []
+    displaced = []
+    previous = pack(boards[0], width)
+    for board in boards[1:]:
+        start = time.perf_counter()
+        rows = pack(board, width)
+        times.append(time.perf_counter() - start)
+
+        before, after = _positions(previous), _positions(rows)
+        displaced.append(
+            sum(before[tileset] != after[tileset] for tileset in before.keys() & after)
+        )
+        rows_used.append(len(rows))
+        wasted.append(sum(width - sum(t.width() for t in row) for row in rows))
+        previous = rows
+
+    return {
+        "median_us": statistics.median(times) * 1e6,
+        "rows": statistics.mean(rows_used),
+        "wasted": statistics.mean(wasted),
+        "displaced": statistics.mean(displaced),
+    }
+
+
+def run(moves: int, seed: int) -> dict[str, dict[str, dict[str, float]]]:
+    """Run all cases and return the metrics of every packer."""
+    cases: dict[str, dict[str, dict[str, float]]] = {}
+    for size in BOARD_SIZES:
+        rng = random.Random(seed)
+        initial = _board(min(size, len(TILES)), rng)
+        boards = [initial, *_moves(initial, moves, rng)]
+        for width in WIDTHS:
+            packers: dict[str, Callable[[Board, int], Rows]] = {
+                packing.value: create_packing_strategy(packing).pack
+                for packing in Packing
+            }
+            if binpacking is not None:
+                packers["binpacking"] = _binpacking
+            cases[f"tiles_{size}@{width}"] = {
+                name: _measure(pack, boards, width) for name, pack in packers.items()
+            }
+    return cases
+
+
+def report(cases: dict[str, dict[str, dict[str, float]]]) -> None:
+    """Print the results as a table."""
+    print(
+        f"{'case':<16} {'packer':<12} {'median':>12} {'rows':>6} {'wasted':>8} "
+        f"{'displaced':>10}"
+    )
+    for case, packers in cases.items():
+        for name, metrics in packers.items():
+            print(
+                f"{case:<16} {name:<12} {metrics['median_us']:9.1f} us "
+                f"{metrics['rows']:6.2f} {metrics['wasted']:8.1f} "
+                f"{metrics['displaced']:10.2f}"
+            )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--moves", type=int, default=200, help="Moves per board.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of random moves.")
+    args = parser.parse_args()
+
+    if binpacking is None:
+        print("binpacking is not installed, measuring only the packing strategies.\n")
+
+    report(run(moves=args.moves, seed=args.seed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
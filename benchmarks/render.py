@@ -0,0 +1,325 @@
+"""Headless render benchmark of the game screen.
+
+Builds game states for synthetic boards, renders the game widget into
+an in-memory `prompt_toolkit` screen at several terminal widths and reports
+per-frame time, allocated memory and the number of cells written.
+
+Every case is measured in three modes:
+
+* `update` applies a new state to the viewmodel and builds the widget tree.
+* `full` renders every frame with a fresh renderer, i.e. a complete repaint.
+* `incremental` moves the highlight between two tiles and repaints only
+  the damaged regions with a retained renderer.
+
+Results can be saved as a JSON baseline and later compared against it:
+
+    python benchmarks/render.py --save benchmarks/baseline.json
+    python benchmarks/render.py --compare benchmarks/baseline.json
+
+Run with `nox -s benchmark -- [arguments]` to use an isolated environment.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from cacheout import Cache as Cacheout  # type: ignore
+from prompt_toolkit.application import DummyApplication
+from prompt_toolkit.application.current import set_app
+from prompt_toolkit.data_structures import Size
+from prompt_toolkit.layout.screen import Screen
+from prompt_toolkit.output import DummyOutput
+
+import tuicub.app  # noqa: F401 -- resolves the import order of the game package
+from tuicub.common.cache import Cache
+from tuicub.common.models import Player
+from tuicub.common.services.screen_size_service import ScreenSizeService
+from tuicub.common.views import Theme
+from tuicub.game.models import TILES, Board, SelectionMode, Tileset, VirtualTileset
+from tuicub.game.services.board_service import BoardService
+from tuicub.game.services.packing import PreservingPacking
+from tuicub.game.services.scroll_service import ScrollService
+from tuicub.game.state import GameScreenState
+from tuicub.game.view import GameWidgetFactory
+from tuicub.game.viewmodel import GameViewModel
+from tuicub.game.widgets.frame import Frame
+from tuicub.game.widgets.renderer import Renderer
+
+SCHEMA_VERSION = 1
+WIDTHS = (80, 120, 200)
+HEIGHT = 40
+RACK_SIZE = 14
+JOKER_IDS = (104, 105)
+USER_ID = "user"
+PLAYERS = (
+    Player(user_id=USER_ID, name="alice", tiles_count=RACK_SIZE, has_turn=True),
+    Player(user_id="other", name="bob", tiles_count=RACK_SIZE, has_turn=False),
+)
+
+
+class _FixedSizeOutput(DummyOutput):
+    def __init__(self, width: int):
+        self._width = width
+
+    def get_size(self) -> Size:
+        return Size(rows=HEIGHT, columns=self._width)
+
+
+def _tilesets(tile_ids: list[int]) -> frozenset[Tileset]:
+    return frozenset(
+        Tileset.from_tile_ids(tile_ids[i : i + 3]) for i in range(0, len(tile_ids), 3)
+    )
+
+
+def _state(
+    board_ids: list[int],
+    rack_ids: list[int],
+    selection_mode: SelectionMode = SelectionMode.TILES,
+    virtual_ids: tuple[int, ...] = (),
+) -> GameScreenState:
+    board = _tilesets(board_ids)
+    rack = Tileset.from_tile_ids(rack_ids)
+    return GameScreenState(
+        pile_count=106 - len(board_ids) - len(rack_ids),
+        selection_mode=selection_mode,
+        highlighted_tile=rack.tiles[0] if rack.tiles else None,
+        highlighted_tileset=min(board, key=str, default=None),
+        selected_tiles=frozenset(TILES[tile_id] for tile_id in virtual_ids),
+        players=PLAYERS,
+        board=Board(tilesets=board),
+        rack=rack,
+        virtual_tileset=VirtualTileset(
+            tiles=tuple(TILES[tile_id] for tile_id in virtual_ids)
+        ),
+    )
+
+
+def _board_of(count: int) -> GameScreenState:
+    board_ids = list(range(count))
+    rack_ids = list(range(count, min(count + RACK_SIZE, len(TILES))))
+    return _state(board_ids=board_ids, rack_ids=rack_ids)
+
+
+def _jokers() -> GameScreenState:
+    board_ids = [0, 1, JOKER_IDS[0], 26, JOKER_IDS[1], 28, *range(40, 64)]
+    return _state(board_ids=board_ids, rack_ids=list(range(64, 64 + RACK_SIZE)))
+
+
+def _virtual_tileset() -> GameScreenState:
+    return _state(
+        board_ids=list(range(30)),
+        rack_ids=list(range(30, 30 + RACK_SIZE)),
+        selection_mode=SelectionMode.TILESETS,
+        virtual_ids=(30, 31, 32),
+    )
+
+
+SCENARIOS: dict[str, Callable[[], GameScreenState]] = {
+    "empty": lambda: _board_of(0),
+    "tiles_10": lambda: _board_of(10),
+    "tiles_30": lambda: _board_of(30),
+    "tiles_106": lambda: _board_of(106),
+    "jokers": _jokers,
+    "virtual_tileset": _virtual_tileset,
+}
+
+
+def _moved_highlight(state: GameScreenState) -> GameScreenState:
+    tiles = state.rack.tiles or next(iter(state.board.tilesets)).tiles
+    highlighted = tiles[-1] if state.highlighted_tile != tiles[-1] else tiles[0]
+    return GameScreenState(
+        pile_count=state.pile_count,
+        selection_mode=SelectionMode.TILES,
+        highlighted_tile=highlighted,
+        highlighted_tileset=state.highlighted_tileset,
+        selected_tiles=state.selected_tiles,
+        new_tiles=state.new_tiles,
+        players=state.players,
+        winner=state.winner,
+        board=state.board,
+        rack=state.rack,
+        virtual_tileset=state.virtual_tileset,
+    )
+
+
+def _viewmodel(width: int) -> GameViewModel:
+    screen_size_service = ScreenSizeService(output=_FixedSizeOutput(width=width))
+    return GameViewModel(
+        board_service=BoardService(
+            cache=Cache(Cacheout()),
+            screen_size_service=screen_size_service,
+            strategy=PreservingPacking(),
+        ),
+        events_observer=None,  # type: ignore[arg-type]
+        scroll_service=ScrollService(
+            cache=Cache(Cacheout()), screen_size_service=screen_size_service
+        ),
+        screen_size_service=screen_size_service,
+        store=None,  # type: ignore[arg-type]
+        user_id=USER_ID,
+    )
+
+
+def _cells(screen: Screen) -> int:
+    return sum(len(row) for row in screen.data_buffer.values())
+
+
+def _measure(
+    render: Callable[[], int], frames: int, prepare: Callable[[], None] = lambda: None
+) -> dict[str, float]:
+    prepare()
+    render()
+    times = []
+    for _ in range(frames):
+        prepare()
+        start = time.perf_counter()
+        cells = render()
+        times.append(time.perf_counter() - start)
+
+    prepare()
+    tracemalloc.start()
+    render()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "median_ms": statistics.median(times) * 1e3,
+        "min_ms": min(times) * 1e3,
+        "peak_alloc_kib": peak / 1024,
+        "cells": cells,
+    }
+
+
+def run_case(scenario: str, width: int, frames: int) -> dict[str, dict[str, float]]:
+    """Measure all modes of one scenario at one width."""
+    theme = Theme.default()
+    frame = Frame(x=0, y=0, width=width, height=HEIGHT)
+    states = [SCENARIOS[scenario]()]
+    states.append(_moved_highlight(states[0]))
+    viewmodel = _viewmodel(width=width)
+    factory = GameWidgetFactory(viewmodel=viewmodel, theme=theme)
+    renderer = Renderer(theme=theme)
+    generation = 0
+
+    def next_state() -> None:
+        nonlocal generation
+        generation += 1
+        viewmodel.on_state(states[generation % 2])
+
+    def update() -> int:
+        next_state()
+        factory.create()
+        return 0
+
+    def full_frame() -> int:
+        screen = Screen()
+        Renderer(theme=theme).render_root(
+            widget=factory.create(), screen=screen, frame=frame
+        )
+        return _cells(screen)
+
+    def prepare_incremental_frame() -> None:
+        next_state()
+        factory.create()
+
+    def incremental_frame() -> int:
+        damage = renderer.render_root(
+            widget=factory.create(), screen=Screen(), frame=frame
+        )
+        return len(damage)
+
+    return {
+        "update": _measure(update, frames=frames),
+        "full": _measure(full_frame, frames=frames),
+        "incremental": _measure(
+            incremental_frame, frames=frames, prepare=prepare_incremental_frame
+        ),
+    }
+
+
+def run(frames: int) -> dict[str, Any]:
+    """Run all cases and return machine-readable results."""
+    cases = {}
+    with set_app(DummyApplication()):
+        for scenario in SCENARIOS:
+            for width in WIDTHS:
+                cases[f"{scenario}@{width}"] = run_case(scenario, width, frames=frames)
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "frames": frames,
+        "cases": cases,
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> int:
+    """Print the change against the baseline and return the number of regressions."""
+    regressions = 0
+    for case, modes in results["cases"].items():
+        for mode, metrics in modes.items():
+            base = baseline["cases"].get(case, {}).get(mode)
+            if base is None:
+                continue
+
+            ratio = metrics["median_ms"] / base["median_ms"]
+            regressed = ratio > 1 + tolerance
+            regressions += regressed
+            print(
+                f"{case:<24} {mode:<12} {base['median_ms']:8.3f} -> "
+                f"{metrics['median_ms']:8.3f} ms  x{ratio:5.2f}"
+                f"{'  REGRESSION' if regressed else ''}"
+            )
+    return regressions
+
+
+def report(results: dict[str, Any]) -> None:
+    """Print the results as a table."""
+    print(f"{'case':<24} {'mode':<12} {'median':>10} {'peak alloc':>12} {'cells':>8}")
+    for case, modes in results["cases"].items():
+        for mode, metrics in modes.items():
+            print(
+                f"{case:<24} {mode:<12} {metrics['median_ms']:7.3f} ms "
+                f"{metrics['peak_alloc_kib']:8.1f} KiB {metrics['cells']:8}"
+            )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=30, help="Frames per case.")
+    parser.add_argument("--save", type=Path, help="Write the results as JSON.")
+    parser.add_argument("--compare", type=Path, help="Compare with a JSON baseline.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative slowdown before a case counts as a regression.",
+    )
+    args = parser.parse_args()
+
+    results = run(frames=args.frames)
+    report(results)
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2) + "\n")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        print()
+        if compare(results, baseline, tolerance=args.tolerance):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
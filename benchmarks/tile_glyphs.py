@@ -0,0 +1,63 @@
+"""Benchmark of writing tiles with precompiled glyphs.
+
+Compares writing every tile flag combination on the screen from the viewmodel's
+text content, as tiles used to be rendered, with writing precompiled glyphs
+from the theme's atlas.
+
+Run with `python benchmarks/tile_glyphs.py`.
+"""
+import itertools
+import timeit
+
+from prompt_toolkit.layout.screen import Screen
+
+import tuicub.app  # noqa: F401 -- resolves the import order of the game package
+from tuicub.common.views import Color, Theme
+from tuicub.game.models import TILES
+from tuicub.game.viewmodels.tile import TileViewModel
+from tuicub.game.widgets.frame import Frame
+from tuicub.game.widgets.glyphs import TileGlyphAtlas
+from tuicub.game.widgets.renderer import Renderer
+
+REPEAT = 5
+NUMBER = 20
+FRAME = Frame(x=0, y=0, width=4, height=3)
+
+theme = Theme.default()
+renderer = Renderer(theme=theme)
+atlas = TileGlyphAtlas.for_theme(theme)
+viewmodels = [
+    TileViewModel(tile=tile, is_selected=selected, is_highlighted=highlighted, is_new=new)
+    for tile in TILES
+    for selected, highlighted, new in itertools.product((False, True), repeat=3)
+]
+
+
+def write_content() -> None:
+    screen = Screen()
+    for viewmodel in viewmodels:
+        renderer.write_content(
+            viewmodel.content(parent_background=Color.BG2, theme=theme), FRAME, screen
+        )
+
+
+def write_glyphs() -> None:
+    screen = Screen()
+    for viewmodel in viewmodels:
+        renderer.write_glyphs(
+            atlas.glyphs(viewmodel=viewmodel, parent_background=Color.BG2),
+            FRAME,
+            screen,
+        )
+
+
+def main() -> None:
+    write_glyphs()
+    for benchmark in (write_content, write_glyphs):
+        best = min(timeit.repeat(benchmark, repeat=REPEAT, number=NUMBER)) / NUMBER
+        per_tile = best / len(viewmodels) * 1e6
+        print(f"{benchmark.__name__:<16} {best * 1e3:8.3f} ms  {per_tile:6.2f} us/tile")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Benchmark of the per-tile attributes looked up on hot paths.
+
+Uses all 106 tiles and compares the tables of tile attributes indexed by tile id
+with the code they replaced:
+
+* sorting a rack with named tuples of ids and orders, and with sort keys by id,
+* looking up the number, joker flag and UI colors of tiles via properties of
+  tiles and colors, and via the tables,
+* creating tile viewmodels with flags looked up in sets of tiles, and in masks
+  of tile ids.
+
+    python benchmarks/tiles.py
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from typing import NamedTuple
+
+import tuicub.app  # noqa: F401 -- resolves the import order of the game package
+from tuicub.common.models import sorted_tileset
+from tuicub.common.views import Color as UIColor
+from tuicub.game.models import (
+    TILE_IS_JOKER,
+    TILE_NUMBERS,
+    TILE_UI_COLORS,
+    TILE_UI_SELECTED_COLORS,
+    TILES,
+    Color,
+    Tile,
+    mask_of,
+)
+from tuicub.game.viewmodels.tile import TileViewModel
+
+SELECTED_TILES = 5
+NEW_TILES = 3
+
+
+class _TileNode(NamedTuple):
+    id: int
+    order: int
+
+
+def _sort_nodes(tileset: list[int]) -> list[int]:
+    """The rack sort the game state used before."""
+    deck_size = 52
+    jokers = {104, 105}
+    return [
+        node.id
+        for node in sorted(
+            [
+                _TileNode(id=tile, order=tile)
+                if (tile < deck_size or tile in jokers)
+                else _TileNode(id=tile, order=tile - deck_size)
+                for tile in tileset
+            ],
+            key=lambda node: node.order,
+        )
+    ]
+
+
+def _ui_color(color: Color) -> UIColor:
+    match color:
+        case Color.RED:
+            return UIColor.TILE_RED
+        case Color.YELLOW:
+            return UIColor.TILE_YELLOW
+        case Color.BLUE:
+            return UIColor.TILE_BLUE
+        case Color.BLACK:
+            return UIColor.TILE_BLACK
+
+
+def _ui_selected_color(color: Color) -> UIColor:
+    match color:
+        case Color.RED | Color.YELLOW | Color.BLUE:
+            return _ui_color(color)
+        case Color.BLACK:
+            return UIColor.TILE_BLACK_SELECTED
+
+
+def _is_joker(tile: Tile) -> bool:
+    joker_ids = {104, 105}
+    return tile.id in joker_ids
+
+
+def _attributes_properties(tiles: list[Tile]) -> object:
+    return [
+        (
+            str(tile.number).ljust(2) if not _is_joker(tile) else "J ",
+            _ui_color(tile.color),
+            _ui_selected_color(tile.color),
+        )
+        for tile in tiles
+    ]
+
+
+def _attributes_tables(tiles: list[Tile]) -> object:
+    return [
+        (
+            str(TILE_NUMBERS[tile.id]).ljust(2) if not TILE_IS_JOKER[tile.id] else "J ",
+            TILE_UI_COLORS[tile.id],
+            TILE_UI_SELECTED_COLORS[tile.id],
+        )
+        for tile in tiles
+    ]
+
+
+def _viewmodels_sets(
+    tiles: list[Tile], selected: frozenset[Tile], new: frozenset[Tile]
+) -> object:
+    highlighted = tiles[0]
+    return tuple(
+        TileViewModel(
+            tile=tile,
+            is_selected=tile in selected,
+            is_highlighted=tile == highlighted,
+            is_new=tile in new,
+        )
+        for tile in tiles
+    )
+
+
+def _viewmodels_masks(
+    tiles: list[Tile], selected: frozenset[Tile], new: frozenset[Tile]
+) -> object:
+    highlighted_id = tiles[0].id
+    selected_mask, new_mask = mask_of(selected), mask_of(new)
+    return tuple(
+        TileViewModel(
+            tile=tile,
+            is_selected=bool(selected_mask >> tile.id & 1),
+            is_highlighted=tile.id == highlighted_id,
+            is_new=bool(new_mask >> tile.id & 1),
+        )
+        for tile in tiles
+    )
+
+
+def _measure(call: Callable[[], object], repeats: int) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1e6
+
+
+def run(repeats: int, seed: int) -> dict[str, dict[str, float]]:
+    """Run all cases and return the median time of both implementations in us."""
+    rng = random.Random(seed)
+    tiles = list(TILES)
+    rng.shuffle(tiles)
+    tile_ids = [tile.id for tile in tiles]
+    selected = frozenset(rng.sample(tiles, SELECTED_TILES))
+    new = frozenset(rng.sample(tiles, NEW_TILES))
+
+    return {
+        "rack sort": {
+            "before": _measure(lambda: _sort_nodes(tile_ids), repeats),
+            "tables": _measure(lambda: sorted_tileset(tile_ids), repeats),
+        },
+        "tile attributes": {
+            "before": _measure(lambda: _attributes_properties(tiles), repeats),
+            "tables": _measure(lambda: _attributes_tables(tiles), repeats),
+        },
+        "tile viewmodels": {
+            "before": _measure(lambda: _viewmodels_sets(tiles, selected, new), repeats),
+            "tables": _measure(lambda: _viewmodels_masks(tiles, selected, new), repeats),
+        },
+    }
+
+
+def report(cases: dict[str, dict[str, float]]) -> None:
+    """Print the results as a table."""
+    print(f"{'case':<18} {'before':>12} {'tables':>12}")
+    for case, medians in cases.items():
+        print(f"{case:<18} {medians['before']:9.1f} us {medians['tables']:9.1f} us")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeats", type=int, default=2000, help="Runs per case.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of tile order.")
+    args = parser.parse_args()
+
+    report(run(repeats=args.repeats, seed=args.seed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
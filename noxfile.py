@@ -25,6 +25,18 @@ def test(session: nox.Session) -> None:
     session.run("pytest", "tests/")
 
 
+@nox.session(python=PYTHON_DEFAULT_VERSION)
+def benchmark(session: nox.Session) -> None:
+    session.install("-e", ".")
+    session.run("python", "benchmarks/render.py", *session.posargs)
+
+
+@nox.session(python=PYTHON_DEFAULT_VERSION)
+def packing_benchmark(session: nox.Session) -> None:
+    session.install("-e", ".", "binpacking")
+    session.run("python", "benchmarks/packing.py", *session.posargs)
+
+
 @nox.session(python=PYTHON_DEFAULT_VERSION)
 def ci(session: nox.Session) -> None:
     REPORTS_OUTPUT_DIR.mkdir(exist_ok=True)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from attrs import frozen
+from prompt_toolkit.application import Application
+from prompt_toolkit.utils import Event
+
+DEFAULT_MAX_FPS = 60
+DEFAULT_RESIZE_DEBOUNCE = 0.15
+
+
+@frozen
+class RedrawStats:
+    """Counters of the application redraws.
+
+    Attributes:
+        requested (int): The number of redraws requested, with `invalidate` or
+            by a resize of the terminal. Requests made while a redraw is pending
+            are merged into it.
+        immediate (int): The number of redraws made immediately as feedback
+            to a key press.
+        performed (int): The number of redraws actually performed.
+    """
+
+    requested: int
+    immediate: int
+    performed: int
+
+
+class TuicubApplication(Application[None]):
+    """The `prompt_toolkit` application with a capped frame rate.
+
+    Redraws are at least a frame interval apart, see `min_redraw_interval`
+    of `prompt_toolkit.Application`, so a burst of state updates produces
+    a single redraw. Redraws requested while handling a key press skip the
+    interval, so the feedback to user input is never delayed. Resizes of
+    the terminal are debounced.
+    """
+
+    @property
+    def redraw_stats(self) -> RedrawStats:
+        """The current counters of requested and performed redraws."""
+        return RedrawStats(
+            requested=self._requested_redraws,
+            immediate=self._immediate_redraws,
+            performed=self._performed_redraws,
+        )
+
+    def __init__(
+        self,
+        *args: Any,
+        max_fps: int = DEFAULT_MAX_FPS,
+        resize_debounce: float = DEFAULT_RESIZE_DEBOUNCE,
+        **kwargs: Any,
+    ):
+        """Initialize new application.
+
+        Args:
+            max_fps (int): The maximum number of redraws per second. Zero disables
+                the limit.
+            resize_debounce (float): The number of seconds the size of the terminal
+                must not change before a resize is settled. Zero disables debouncing.
+            *args (Any): Positional arguments of the `prompt_toolkit.Application`.
+            **kwargs (Any): Keyword arguments of the `prompt_toolkit.Application`.
+        """
+        kwargs.setdefault("min_redraw_interval", 1 / max_fps if max_fps > 0 else None)
+        super().__init__(*args, **kwargs)
+        self._is_handling_key_press: bool = False
+        self._is_key_press_redraw_pending: bool = False
+        self._requested_redraws: int = 0
+        self._immediate_redraws: int = 0
+        self._performed_redraws: int = 0
+        self._resize_debounce: float = resize_debounce
+        self._pending_resize: asyncio.TimerHandle | None = None
+        self.after_resize: Event[TuicubApplication] = Event(self)
+
+        self.key_processor.before_key_press += self._on_before_key_press
+        self.key_processor.after_key_press += self._on_after_key_press
+        self.after_render += self._on_after_render
+
+    def invalidate(self) -> None:
+        """Request a redraw of the application.
+
+        Requests made while handling a key press are redrawn once all received
+        keys are processed, regardless of the frame interval. Other requests are
+        redrawn at least a frame interval after the previous redraw.
+        """
+        self._requested_redraws += 1
+        if not self._is_handling_key_press or self.loop is None:
+            super().invalidate()
+        elif not self._is_key_press_redraw_pending:
+            self._is_key_press_redraw_pending = True
+            self._immediate_redraws += 1
+            self.loop.call_soon_threadsafe(self._redraw_key_press)
+
+    def _on_resize(self) -> None:
+        if self._pending_resize is not None:
+            self._pending_resize.cancel()
+            self._pending_resize = None
+
+        if self._resize_debounce <= 0 or self.loop is None:
+            self.after_resize.fire()
+        else:
+            self._pending_resize = self.loop.call_later(
+                self._resize_debounce, self._settle_resize
+            )
+        self._requested_redraws += 1
+        super()._on_resize()
+
+    def _settle_resize(self) -> None:
+        self._pending_resize = None
+        self.after_resize.fire()
+        self.invalidate()
+
+    def _redraw_key_press(self) -> None:
+        self._is_key_press_redraw_pending = False
+        self._redraw()
+
+    def _on_before_key_press(self, _: object) -> None:
+        self._is_handling_key_press = True
+
+    def _on_after_key_press(self, _: object) -> None:
+        self._is_handling_key_press = False
+
+    def _on_after_render(self, _: object) -> None:
+        self._performed_redraws += 1
@@ -1,9 +1,7 @@
-from prompt_toolkit.application import Application
 from prompt_toolkit.filters import buffer_has_focus
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.layout import Layout
 from prompt_toolkit.output import Output
-from prompt_toolkit.renderer import ColorDepth
 
 from ..common.confirmation.module import ConfirmationModule
 from ..common.module import CommonModule
@@ -11,6 +9,7 @@ from ..common.screens import TuicubScreen
 from ..common.services.module import ServicesModule
 from ..common.state.module import StateModule
 from ..common.views.animation import TextAnimator
+from .application import TuicubApplication
 from .controller import AppController
 from .status import StatusView, StatusViewModel
 from .view import AppView
@@ -21,7 +20,7 @@ class AppModule:
     __slots__ = ("_app", "_view")
 
     @property
-    def app(self) -> Application:
+    def app(self) -> TuicubApplication:
         return self._app
 
     @property
@@ -62,10 +61,12 @@ class AppModule:
             theme=common_module.theme,
         )
 
-        self._app: Application = Application(
+        self._app: TuicubApplication = TuicubApplication(
             layout=Layout(self._view),
             key_bindings=bindings,
             full_screen=True,
-            color_depth=ColorDepth.TRUE_COLOR,
+            color_depth=common_module.config.render_profile.color_depth,
             output=output,
+            max_fps=common_module.config.max_fps,
         )
+        self._app.after_resize += services_module.screen_size_service.did_resize
@@ -3,7 +3,8 @@ import asyncio
 import pathlib
 import tempfile
 
-from .common.config import Config
+from .common.config import Config, Packing
+from .common.views.profile import RenderProfile
 from .tuicub import run
 
 
@@ -68,6 +69,59 @@ def main() -> int:
         default=None,
         type=pathlib.Path,
     )
+    parser.add_argument(
+        "--max-fps",
+        help="Maximum number of redraws per second. Use 0 to disable the limit.",
+        action="store",
+        required=False,
+        metavar="FPS",
+        type=int,
+        default=60,
+    )
+    parser.add_argument(
+        "--render-profile",
+        help=(
+            "Colors and glyphs to render with. The 256 and 16 color profiles "
+            "reduce the output size, e.g. for slow SSH connections."
+        ),
+        action="store",
+        required=False,
+        choices=[profile.value for profile in RenderProfile],
+        default=RenderProfile.TRUE_COLOR.value,
+    )
+    parser.add_argument(
+        "--packing",
+        help=(
+            "Strategy arranging tilesets of the board into rows. The preserve "
+            "strategy keeps unchanged tilesets in place."
+        ),
+        action="store",
+        required=False,
+        choices=[packing.value for packing in Packing],
+        default=Packing.PRESERVE.value,
+    )
+    parser.add_argument(
+        "--strict-events",
+        help=(
+            "Validate all incoming events with the full schemas instead of "
+            "the fast decoders, e.g. to debug malformed events."
+        ),
+        action="store_true",
+        required=False,
+        default=False,
+    )
+    parser.add_argument(
+        "--ingress-capacity",
+        help=(
+            "Maximum number of received events waiting to be processed. While "
+            "the queue is full, reading from the events server pauses."
+        ),
+        action="store",
+        required=False,
+        metavar="EVENTS",
+        type=int,
+        default=256,
+    )
     parsed = parser.parse_args()
 
     config = Config(
@@ -77,6 +131,11 @@ def main() -> int:
         events_port=parsed.events_port,
         logfile=parsed.logfile,
         theme_file=parsed.theme,
+        max_fps=parsed.max_fps,
+        render_profile=RenderProfile(parsed.render_profile),
+        packing=Packing(parsed.packing),
+        strict_events=parsed.strict_events,
+        ingress_capacity=parsed.ingress_capacity,
     )
 
     return asyncio.run(run(config=config))
@@ -1,8 +1,12 @@
 from collections.abc import Hashable
-from typing import Any
+from typing import Any, Generic, TypeVar
+from weakref import WeakValueDictionary
 
 from cacheout import Cache as Cacheout  # type: ignore
 
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
 
 class Cache:
     """An in-memory cache."""
@@ -30,3 +34,45 @@ class Cache:
     def set(self, key: Hashable, value: Any) -> None:
         """Cache a value for the given key."""
         self._cache.set(key=key, value=value)
+
+
+class InternTable(Generic[K, V]):
+    """A bounded table of shared instances of immutable values.
+
+    Equal values created through the table are the same instance, so comparing
+    them is an identity check. Values are referenced weakly and leave the table
+    as soon as nothing else uses them. A full table stops interning new values
+    until some of its values are released.
+    """
+
+    __slots__ = ("_values", "_max_size")
+
+    def __init__(self, max_size: int):
+        """Initialize new table.
+
+        Args:
+            max_size (int): The maximum number of interned values.
+        """
+        self._values: WeakValueDictionary[K, V] = WeakValueDictionary()
+        self._max_size: int = max_size
+
+    def get(self, key: K) -> V | None:
+        """Returns the interned value for the key, or None if there is none."""
+        return self._values.get(key)
+
+    def add(self, key: K, value: V) -> V:
+        """Intern the value for the key, unless the table is full.
+
+        Args:
+            key (K): The key of the value.
+            value (V): The value to intern.
+
+        Returns:
+            The given value.
+        """
+        if len(self._values) < self._max_size:
+            self._values[key] = value
+        return value
+
+    def __len__(self) -> int:
+        return len(self._values)
@@ -1,7 +1,19 @@
 import pathlib
+from enum import StrEnum
 
 from attrs import field, frozen
 
+from .views.profile import RenderProfile
+
+
+class Packing(StrEnum):
+    """Names of the strategies packing the game board into rows."""
+
+    PRESERVE = "preserve"
+    FIRST_FIT = "first-fit"
+    BEST_FIT = "best-fit"
+    EXACT = "exact"
+
 
 @frozen
 class Config:
@@ -14,6 +26,13 @@ class Config:
         events_port (str): The port of the events server.
         logfile (pathlib.Path): The path to the file to write logs to.
         theme_file (pathlib.Path): An optional path to a file with a custom color theme.
+        max_fps (int): The maximum number of redraws per second, zero for no limit.
+        render_profile (RenderProfile): The profile of colors and glyphs to render.
+        packing (Packing): The strategy packing the game board into rows.
+        strict_events (bool): Whether to deserialize all events with the schemas
+            instead of the compiled decoders.
+        ingress_capacity (int): The maximum number of received events waiting
+            to be processed.
     """
 
     api_url: str
@@ -22,3 +41,8 @@ class Config:
     events_port: int
     logfile: pathlib.Path
     theme_file: pathlib.Path | None = field(default=None)
+    max_fps: int = field(default=60)
+    render_profile: RenderProfile = field(default=RenderProfile.TRUE_COLOR)
+    packing: Packing = field(default=Packing.PRESERVE)
+    strict_events: bool = field(default=False)
+    ingress_capacity: int = field(default=256)
@@ -0,0 +1,159 @@
+from collections.abc import Sequence
+from contextlib import ExitStack
+from weakref import WeakSet
+
+from eventoolkit import Event, EventInputBridge, EventPublisher, EventsFactory
+
+from ...game.events import (
+    BoardChangedEvent,
+    PileCountChangedEvent,
+    PlayersChangedEvent,
+    RackChangedEvent,
+)
+from ..latency import LatencyTracer
+from ..logger import Logger
+from ..state.store import TuicubStore
+
+SNAPSHOT_EVENTS: frozenset[type[Event]] = frozenset(
+    (BoardChangedEvent, PileCountChangedEvent, PlayersChangedEvent, RackChangedEvent)
+)
+
+# Snapshot events whose effect depends on the state set by other snapshot events.
+# The new tiles of a board update keep the new tiles still in the rack, so board
+# and rack updates must be applied in the order they were received.
+DEPENDENT_SNAPSHOT_EVENTS: dict[type[Event], frozenset[type[Event]]] = {
+    BoardChangedEvent: frozenset((RackChangedEvent,)),
+    RackChangedEvent: frozenset((BoardChangedEvent,)),
+}
+
+
+class CoalescingEventBridge(EventInputBridge):
+    """Bridges text events producers and the publisher, dropping superseded events.
+
+    Events are created as soon as they are received, but published in batches
+    by `flush`, which the ingress queue calls once it is drained, so the burst of
+    events the server sends after every move is published at once, while a single
+    event is published without delay. Within a batch, events are coalesced with
+    `coalesce`, and the remaining events are published in a single transaction of
+    every added store, so that its subscribers are notified once per batch. An error
+    raised by a handler of an event is logged, and the rest of the batch is still
+    published.
+    """
+
+    __slots__ = ("_logger", "_tracer", "_pending", "_merged", "_stores")
+
+    def __init__(
+        self,
+        factory: EventsFactory,
+        publisher: EventPublisher,
+        logger: Logger,
+        tracer: LatencyTracer | None = None,
+    ):
+        """Initialize new bridge.
+
+        Args:
+            factory (EventsFactory): The events factory.
+            publisher (EventPublisher): The publisher.
+            logger (Logger): The logger of coalesced batches and of errors raised
+                by handlers.
+            tracer (LatencyTracer | None): The optional tracer stamping published
+                batches as dispatched.
+        """
+        super().__init__(factory=factory, publisher=publisher)
+        self._logger: Logger = logger
+        self._tracer: LatencyTracer | None = tracer
+        self._pending: list[Event] = []
+        self._merged: int = 0
+        self._stores: WeakSet[TuicubStore] = WeakSet()
+
+    @property
+    def merged(self) -> int:
+        """The number of superseded events dropped so far."""
+        return self._merged
+
+    def add_store(self, store: TuicubStore) -> None:
+        """Publish batches of events in a transaction of the store.
+
+        The bridge keeps only a weak reference to the store.
+
+        Args:
+            store (TuicubStore): The store updated by handlers of the events.
+        """
+        self._stores.add(store)
+
+    def on_message(self, message: str) -> None:
+        """Callback for incoming text events.
+
+        Creates a new `Event` using the factory, and adds it to the pending batch.
+
+        Args:
+            message (str): The text representation of an event.
+        """
+        self._pending.append(self._factory.create(raw=message))
+
+    def flush(self) -> None:
+        """Publish the pending batch of events, without superseded events."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        events = coalesce(pending)
+        if len(events) < len(pending):
+            self._merged += len(pending) - len(events)
+            self._logger.log_coalesced_events(
+                received=len(pending), published=len(events), merged=self._merged
+            )
+
+        stores = list(self._stores)
+        initial_states = [store.state for store in stores]
+        with ExitStack() as stack:
+            for store in stores:
+                stack.enter_context(store.transaction())
+            for event in events:
+                try:
+                    self._publisher.publish(event)
+                except Exception as e:
+                    self._logger.log_event_error(message=repr(event), error=e)
+            if self._tracer is not None:
+                self._tracer.dispatched(
+                    changed=any(
+                        store.state != state
+                        for store, state in zip(stores, initial_states, strict=True)
+                    )
+                )
+        if self._tracer is not None:
+            self._tracer.published()
+
+
+def coalesce(events: Sequence[Event]) -> list[Event]:
+    """Returns the events without snapshot events superseded by later ones.
+
+    Snapshot events carry the whole value of a part of the game state, so only
+    the last of consecutive snapshot events of the same type matters. Any other
+    event, e.g. `tile_drawn` or `player_won`, is never dropped and ends the run
+    of snapshot events it follows, so events before and after it are never merged.
+    A snapshot event also ends the runs of its `DEPENDENT_SNAPSHOT_EVENTS`, e.g.
+    `board_changed` events separated by `rack_changed` are all kept.
+
+    Args:
+        events (Sequence[Event]): The events in the order they were received.
+
+    Returns:
+        The remaining events in the order they were received.
+    """
+    kept: list[Event | None] = []
+    latest: dict[type[Event], int] = {}
+    for event in events:
+        event_type = type(event)
+        if event_type in SNAPSHOT_EVENTS:
+            index = latest.get(event_type)
+            if index is not None:
+                kept[index] = None
+            latest[event_type] = len(kept)
+            for dependent in DEPENDENT_SNAPSHOT_EVENTS.get(event_type, ()):
+                latest.pop(dependent, None)
+        else:
+            latest.clear()
+        kept.append(event)
+
+    return [event for event in kept if event is not None]
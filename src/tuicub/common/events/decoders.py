@@ -0,0 +1,133 @@
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from eventoolkit import Event
+
+from ...game.events import (
+    BoardChangedEvent,
+    PileCountChangedEvent,
+    PlayerLeftEvent,
+    PlayersChangedEvent,
+    PlayerWonEvent,
+    RackChangedEvent,
+    TileDrawnEvent,
+    TurnEndedEvent,
+    TurnStartedEvent,
+)
+from ..models import Player
+from .event import EventName
+
+EventDecoder = Callable[[dict[str, Any]], Event]
+
+_PLAYER_KEYS = frozenset(("name", "user_id", "tiles_count", "has_turn"))
+
+
+class DecodeError(ValueError):
+    """Raised when a payload does not have the exact shape a decoder expects."""
+
+
+def decode_board_changed(data: dict[str, Any]) -> BoardChangedEvent:
+    """Decode the payload of the `board_changed` event."""
+    return BoardChangedEvent(
+        board=_int_lists(_get(data, "board")), new_tiles=_ints(_get(data, "new_tiles"))
+    )
+
+
+def decode_pile_count_changed(data: dict[str, Any]) -> PileCountChangedEvent:
+    """Decode the payload of the `pile_count_changed` event."""
+    return PileCountChangedEvent(pile_count=_int(_get(data, "pile_count")))
+
+
+def decode_player_left(data: dict[str, Any]) -> PlayerLeftEvent:
+    """Decode the payload of the `player_left` event."""
+    return PlayerLeftEvent(player=_player(_get(data, "player")))
+
+
+def decode_player_won(data: dict[str, Any]) -> PlayerWonEvent:
+    """Decode the payload of the `player_won` event."""
+    return PlayerWonEvent(winner=_player(_get(data, "winner")))
+
+
+def decode_players_changed(data: dict[str, Any]) -> PlayersChangedEvent:
+    """Decode the payload of the `players_changed` event."""
+    players = _get(data, "players")
+    if type(players) is not list:
+        raise DecodeError("players")
+    return PlayersChangedEvent(players=[_player(player) for player in players])
+
+
+def decode_rack_changed(data: dict[str, Any]) -> RackChangedEvent:
+    """Decode the payload of the `rack_changed` event."""
+    return RackChangedEvent(rack=_ints(_get(data, "rack")))
+
+
+def decode_tile_drawn(data: dict[str, Any]) -> TileDrawnEvent:
+    """Decode the payload of the `tile_drawn` event."""
+    return TileDrawnEvent(tile=_int(_get(data, "tile")))
+
+
+def decode_turn_ended(_: dict[str, Any]) -> TurnEndedEvent:
+    """Decode the payload of the `turn_ended` event."""
+    return TurnEndedEvent()
+
+
+def decode_turn_started(_: dict[str, Any]) -> TurnStartedEvent:
+    """Decode the payload of the `turn_started` event."""
+    return TurnStartedEvent()
+
+
+DECODERS: Mapping[str, EventDecoder] = {
+    EventName.BOARD_CHANGED: decode_board_changed,
+    EventName.PILE_COUNT_CHANGED: decode_pile_count_changed,
+    EventName.PLAYER_LEFT: decode_player_left,
+    EventName.PLAYER_WON: decode_player_won,
+    EventName.PLAYERS_CHANGED: decode_players_changed,
+    EventName.RACK_CHANGED: decode_rack_changed,
+    EventName.TILE_DRAWN: decode_tile_drawn,
+    EventName.TURN_ENDED: decode_turn_ended,
+    EventName.TURN_STARTED: decode_turn_started,
+}
+
+
+def _get(data: dict[str, Any], key: str) -> Any:
+    try:
+        return data[key]
+    except KeyError as e:
+        raise DecodeError(key) from e
+
+
+def _int(value: Any) -> int:
+    if type(value) is not int:
+        raise DecodeError(value)
+    return value
+
+
+def _ints(value: Any) -> list[int]:
+    if type(value) is not list or any(type(item) is not int for item in value):
+        raise DecodeError(value)
+    return value
+
+
+def _int_lists(value: Any) -> list[list[int]]:
+    if type(value) is not list:
+        raise DecodeError(value)
+    for item in value:
+        _ints(item)
+    return value
+
+
+def _player(value: Any) -> Player:
+    if type(value) is not dict or value.keys() != _PLAYER_KEYS:
+        raise DecodeError(value)
+    if (
+        type(value["name"]) is not str
+        or type(value["user_id"]) is not str
+        or type(value["has_turn"]) is not bool
+    ):
+        raise DecodeError(value)
+    return Player(
+        name=value["name"],
+        user_id=value["user_id"],
+        tiles_count=_int(value["tiles_count"]),
+        has_turn=value["has_turn"],
+    )
@@ -1,3 +1,5 @@
+import json
+
 from attrs import frozen
 from eventoolkit import Event, EventsFactory
 from marshmallow_generic import EXCLUDE
@@ -19,7 +21,9 @@ from ...gameroom.events import (
     UserJoinedEventSchema,
     UserLeftEventSchema,
 )
+from ..latency import LatencyTracer
 from ..schemas import TuicubEventSchema
+from .decoders import DECODERS
 from .event import EventName, TuicubEvent
 
 
@@ -40,30 +44,72 @@ class EventSchemas:
 
 
 class TuicubEventsFactory(EventsFactory):
-    """A factory creating events based on the event name."""
+    """A factory creating events based on the event name.
+
+    Frequent game events are decoded in a single pass by the compiled decoders,
+    which build the application event directly from the parsed input. Events
+    without a decoder, and input not matching the exact shape a decoder expects,
+    are deserialized with the schemas, which report what is invalid.
+    """
 
-    __slots__ = ("_schemas",)
+    __slots__ = ("_schemas", "_strict", "_tracer")
 
-    def __init__(self, event_schemas: EventSchemas):
+    def __init__(
+        self,
+        event_schemas: EventSchemas,
+        strict: bool = False,
+        tracer: LatencyTracer | None = None,
+    ):
         """Initialize new factory.
 
         Args:
             event_schemas (EventSchemas): Schemas for all application events.
+            strict (bool): Whether to deserialize all events with the schemas.
+            tracer (LatencyTracer | None): The optional tracer of created events.
         """
         self._schemas: EventSchemas = event_schemas
+        self._strict: bool = strict
+        self._tracer: LatencyTracer | None = tracer
 
-    def create(self, raw: str) -> Event:  # noqa: PLR0911
+    def create(self, raw: str) -> Event:
         """Create a new event from the raw string.
 
-        First, the input is deserialized into a `TuicubEvent`. Then, the event's
-        data is deserialized into an application event based on the event's name.
-
         Args:
             raw (str): The raw representation of the event.
 
         Returns:
             The created application event.
         """
+        event = None if self._strict else self._decode(raw)
+        if event is None:
+            event = self._load(raw)
+        if self._tracer is not None:
+            self._tracer.decoded(type(event).__name__)
+        return event
+
+    def _decode(self, raw: str) -> Event | None:
+        """Decode the event with its compiled decoder.
+
+        Returns:
+            The created application event, or None if the event has to be
+            deserialized with the schemas.
+        """
+        try:
+            payload = json.loads(raw)
+            decoder = DECODERS.get(payload["name"])
+            data = payload["data"]
+            if decoder is None or type(data) is not dict:
+                return None
+            return decoder(data)
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def _load(self, raw: str) -> Event:  # noqa: PLR0911
+        """Deserialize the event with the schemas.
+
+        First, the input is deserialized into a `TuicubEvent`. Then, the event's
+        data is deserialized into an application event based on the event's name.
+        """
         event: TuicubEvent = self._schemas.base_schema.loads(raw, unknown=EXCLUDE)
 
         match event.name:
@@ -5,6 +5,7 @@ from pydepot import Store
 
 from ..services.alert_service import AlertService
 from ..state import State
+from ..state.store import dispatch_batch
 
 TEvent = TypeVar("TEvent", bound=Event)
 
@@ -17,3 +18,8 @@ class AlertingStoreEventHandler(Generic[TEvent], StoreEventHandler[TEvent, State
     def __init__(self, alert_service: AlertService, store: Store[State]):
         self._alert_service: AlertService = alert_service
         super().__init__(store=store)
+
+    def handle(self, event: TEvent) -> None:
+        """Dispatch the actions for the event in a batch, then perform side effects."""
+        dispatch_batch(self._store, self.actions(event))
+        self.side_effects(event)
@@ -0,0 +1,274 @@
+import asyncio
+import json
+from collections import deque
+from collections.abc import Callable
+
+import asockit
+from attrs import frozen
+
+from ..latency import LatencyTracer
+from ..logger import Logger
+from .event import EventName
+
+DEFAULT_INGRESS_CAPACITY = 256
+
+SNAPSHOT_EVENT_NAMES: frozenset[str] = frozenset(
+    (
+        EventName.BOARD_CHANGED,
+        EventName.PILE_COUNT_CHANGED,
+        EventName.PLAYERS_CHANGED,
+        EventName.RACK_CHANGED,
+    )
+)
+
+DEPENDENT_SNAPSHOT_EVENT_NAMES: dict[str, frozenset[str]] = {
+    EventName.BOARD_CHANGED: frozenset((EventName.RACK_CHANGED,)),
+    EventName.RACK_CHANGED: frozenset((EventName.BOARD_CHANGED,)),
+}
+
+
+@frozen
+class IngressStats:
+    """Counters of the ingress queue.
+
+    Attributes:
+        received (int): The number of lines received from the socket.
+        consumed (int): The number of lines passed to the delegate.
+        merged (int): The number of superseded snapshot lines dropped while
+            the queue was full.
+        failed (int): The number of consumed lines the delegate raised an error for.
+        depth (int): The number of lines currently waiting in the queue.
+        max_depth (int): The largest number of lines waiting in the queue.
+        total_wait (float): Seconds the consumed lines spent in the queue in total.
+        max_wait (float): The longest time a consumed line spent in the queue,
+            in seconds.
+    """
+
+    received: int
+    consumed: int
+    merged: int
+    failed: int
+    depth: int
+    max_depth: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def mean_wait(self) -> float:
+        """The mean time consumed lines spent in the queue, in seconds."""
+        return self.total_wait / self.consumed if self.consumed else 0.0
+
+
+class _Entry:
+    __slots__ = ("message", "received_at", "_name", "_is_parsed")
+
+    def __init__(self, message: str, received_at: float):
+        self.message: str = message
+        self.received_at: float = received_at
+        self._name: str | None = None
+        self._is_parsed: bool = False
+
+    @property
+    def name(self) -> str | None:
+        if not self._is_parsed:
+            self._is_parsed = True
+            try:
+                data = json.loads(self.message)
+            except ValueError:
+                return None
+            if isinstance(data, dict) and isinstance(data.get("name"), str):
+                self._name = data["name"]
+        return self._name
+
+
+class EventIngressQueue(asockit.SocketReaderDelegate):
+    """A bounded queue of text events between the socket reader and the bridge.
+
+    The socket reader only appends received lines to the queue, and a consumer
+    task passes them to the delegate one at a time, yielding to the event loop
+    after each, so a burst of events never blocks handling key presses. The task
+    is started when a line arrives and ends when the queue is drained, calling
+    the optional `on_drained` callback. An error the delegate raises for a line,
+    e.g. when decoding a malformed event, is logged even when not in debug mode,
+    and the task goes on with the next line.
+
+    When the queue is full, snapshot events superseded by later events of the same
+    name are dropped, by the rules `coalesce` applies after decoding. Only if none
+    can be dropped, reading from the socket waits for the consumer, see
+    `BackpressuredConnection`.
+    """
+
+    __slots__ = (
+        "_delegate",
+        "_loop",
+        "_logger",
+        "_capacity",
+        "_entries",
+        "_space",
+        "_consumer",
+        "_received",
+        "_consumed",
+        "_merged",
+        "_failed",
+        "_max_depth",
+        "_total_wait",
+        "_max_wait",
+        "_tracer",
+        "_on_drained",
+    )
+
+    def __init__(
+        self,
+        delegate: asockit.SocketReaderDelegate,
+        loop: asyncio.AbstractEventLoop,
+        logger: Logger,
+        capacity: int = DEFAULT_INGRESS_CAPACITY,
+        tracer: LatencyTracer | None = None,
+        on_drained: Callable[[], None] | None = None,
+    ):
+        """Initialize new queue.
+
+        Args:
+            delegate (asockit.SocketReaderDelegate): The delegate consuming lines.
+            loop (asyncio.AbstractEventLoop): The loop running the consumer task.
+            logger (Logger): The logger of errors raised by the delegate.
+            capacity (int): The maximum number of lines waiting in the queue,
+                at least one.
+            tracer (LatencyTracer | None): The optional tracer stamping lines
+                as read when they were received.
+            on_drained (Callable[[], None] | None): The optional callback called
+                by the consumer task once all lines are passed to the delegate.
+        """
+        self._delegate: asockit.SocketReaderDelegate = delegate
+        self._loop: asyncio.AbstractEventLoop = loop
+        self._logger: Logger = logger
+        self._capacity: int = max(capacity, 1)
+        self._entries: deque[_Entry] = deque()
+        self._space: asyncio.Event = asyncio.Event()
+        self._consumer: asyncio.Task | None = None
+        self._received: int = 0
+        self._consumed: int = 0
+        self._merged: int = 0
+        self._failed: int = 0
+        self._max_depth: int = 0
+        self._total_wait: float = 0.0
+        self._max_wait: float = 0.0
+        self._tracer: LatencyTracer | None = tracer
+        self._on_drained: Callable[[], None] | None = on_drained
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of lines waiting in the queue."""
+        return self._capacity
+
+    @property
+    def stats(self) -> IngressStats:
+        """The current counters of the queue."""
+        return IngressStats(
+            received=self._received,
+            consumed=self._consumed,
+            merged=self._merged,
+            failed=self._failed,
+            depth=len(self._entries),
+            max_depth=self._max_depth,
+            total_wait=self._total_wait,
+            max_wait=self._max_wait,
+        )
+
+    def on_message(self, message: str) -> None:
+        """Callback for lines read by the socket reader.
+
+        Appends the line to the queue, and starts the consumer task if it is not
+        running.
+
+        Args:
+            message (str): The text representation of an event.
+        """
+        self._entries.append(_Entry(message, received_at=self._loop.time()))
+        self._received += 1
+        self._max_depth = max(self._max_depth, len(self._entries))
+        if self._consumer is None:
+            self._consumer = self._loop.create_task(self._consume())
+
+    async def wait_for_space(self) -> None:
+        """Wait until the queue can take another line.
+
+        When the queue is full, superseded snapshot lines are dropped first,
+        and only if there are none, waits for the consumer.
+        """
+        while len(self._entries) >= self._capacity and not self._merge():
+            self._space.clear()
+            await self._space.wait()
+
+    def _merge(self) -> bool:
+        kept: deque[_Entry] = deque()
+        latest: set[str] = set()
+        for entry in reversed(self._entries):
+            name = entry.name
+            if name in SNAPSHOT_EVENT_NAMES:
+                if name in latest:
+                    continue
+                latest.add(name)
+                latest.difference_update(DEPENDENT_SNAPSHOT_EVENT_NAMES.get(name, ()))
+            else:
+                latest.clear()
+            kept.appendleft(entry)
+
+        merged = len(self._entries) - len(kept)
+        self._entries = kept
+        self._merged += merged
+        return merged > 0
+
+    async def _consume(self) -> None:
+        try:
+            while self._entries:
+                entry = self._entries.popleft()
+                self._space.set()
+                wait = self._loop.time() - entry.received_at
+                self._consumed += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+                if self._tracer is not None:
+                    self._tracer.read(entry.received_at)
+                try:
+                    self._delegate.on_message(entry.message)
+                except Exception as e:
+                    self._failed += 1
+                    self._logger.log_event_error(message=entry.message, error=e)
+                await asyncio.sleep(0)
+            if self._on_drained is not None:
+                self._on_drained()
+        finally:
+            self._consumer = None
+
+
+class BackpressuredConnection(asockit.ReadableConnection):
+    """A readable connection reading a line only when the ingress queue has space.
+
+    While the queue is full, the socket is not read, so the events server is slowed
+    down by the flow control of the connection instead of lines piling up in memory.
+    """
+
+    __slots__ = ("_connection", "_queue")
+
+    def __init__(self, connection: asockit.ReadableConnection, queue: EventIngressQueue):
+        """Initialize new connection.
+
+        Args:
+            connection (asockit.ReadableConnection): The connection to read lines from.
+            queue (EventIngressQueue): The queue the read lines are appended to.
+        """
+        self._connection: asockit.ReadableConnection = connection
+        self._queue: EventIngressQueue = queue
+
+    async def readline(self) -> str:
+        """Read a text line from the connection once the queue has space.
+
+        Returns:
+            The line read.
+
+        Raises:
+            ConnectionClosedError: Raised when the connection has closed.
+        """
+        await self._queue.wait_for_space()
+        return await self._connection.readline()
@@ -1,7 +1,7 @@
 import asyncio
 
 import asockit
-from eventoolkit import EventInputBridge, EventPublisher
+from eventoolkit import EventPublisher
 
 from ...game.events import (
     BoardChangedEventSchema,
@@ -18,12 +18,24 @@ from ...gameroom.events import (
     UserJoinedEventSchema,
     UserLeftEventSchema,
 )
+from ..latency import LatencyTracer
+from ..logger import Logger
 from ..schemas import TuicubEventSchema
+from .coalescing import CoalescingEventBridge
 from .factory import EventSchemas, TuicubEventsFactory
+from .ingress import DEFAULT_INGRESS_CAPACITY, BackpressuredConnection, EventIngressQueue
 
 
 class EventsModule:
-    __slots__ = ("_publisher", "_reader", "_writer", "_bridge")
+    __slots__ = ("_publisher", "_reader", "_writer", "_bridge", "_ingress")
+
+    @property
+    def bridge(self) -> CoalescingEventBridge:
+        return self._bridge
+
+    @property
+    def ingress(self) -> EventIngressQueue:
+        return self._ingress
 
     @property
     def publisher(self) -> EventPublisher:
@@ -38,7 +50,14 @@ class EventsModule:
         return self._writer
 
     def __init__(
-        self, stream_reader: asyncio.StreamReader, stream_writer: asyncio.StreamWriter
+        self,
+        stream_reader: asyncio.StreamReader,
+        stream_writer: asyncio.StreamWriter,
+        loop: asyncio.AbstractEventLoop,
+        logger: Logger,
+        strict_events: bool = False,
+        ingress_capacity: int = DEFAULT_INGRESS_CAPACITY,
+        latency_tracer: LatencyTracer | None = None,
     ):
         event_schemas = EventSchemas(
             base_schema=TuicubEventSchema(),
@@ -55,15 +74,32 @@ class EventsModule:
             user_left=UserLeftEventSchema(),
         )
         self._publisher = EventPublisher()
-        self._bridge = EventInputBridge(
-            factory=TuicubEventsFactory(event_schemas=event_schemas),
+        self._bridge = CoalescingEventBridge(
+            factory=TuicubEventsFactory(
+                event_schemas=event_schemas,
+                strict=strict_events,
+                tracer=latency_tracer,
+            ),
             publisher=self._publisher,
+            logger=logger,
+            tracer=latency_tracer,
+        )
+
+        self._ingress = EventIngressQueue(
+            delegate=self._bridge,
+            loop=loop,
+            logger=logger,
+            capacity=ingress_capacity,
+            tracer=latency_tracer,
+            on_drained=self._bridge.flush,
         )
 
         self._reader = asockit.SocketReader(
-            asockit.AsyncioReadableConnection(stream_reader)
+            BackpressuredConnection(
+                asockit.AsyncioReadableConnection(stream_reader), queue=self._ingress
+            )
         )
         self._writer = asockit.SocketWriter(
             asockit.AsyncioWritableConnection(stream_writer)
         )
-        self._reader.set_delegate(self._bridge)
+        self._reader.set_delegate(self._ingress)
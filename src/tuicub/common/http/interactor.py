@@ -5,6 +5,7 @@ from httperactor import AuthMiddleware, HttpInteractor
 
 from ..confirmation import ConfirmationService
 from ..state import State
+from ..state.store import dispatch_batch
 from .auth_middleware import BearerTokenAuthMiddleware
 
 TResponse = TypeVar("TResponse")
@@ -48,10 +49,15 @@ class BaseHttpInteractor(
         """Execute the request.
 
         If the confirmation text is not empty and the confirmation is rejected,
-        the request is not sent. Otherwise, the request is sent normally.
+        the request is not sent. Otherwise, the request is sent normally, and
+        the actions created from the response are dispatched in a batch.
         """
         if self.confirmation:
             answer = await self._confirmation_service.confirm(self.confirmation)
             if not answer:
                 return
-        await super().execute()
+
+        response = await self._http_client.send(self.request, auth=self.auth)
+        if response is not None:
+            await self.side_effects(response)
+            dispatch_batch(self._store, self.actions(response))
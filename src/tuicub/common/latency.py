@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
+from itertools import pairwise
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .logger import Logger
+
+LATENCY_BUCKETS_MS: tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+LATENCY_SEGMENTS: tuple[str, ...] = ("decode", "dispatch", "rebuild", "paint", "total")
+MAX_PENDING_TRACES = 256
+
+_READ, _DECODED, _DISPATCHED, _REBUILT, _PAINTED = range(5)
+
+
+class LatencyHistogram:
+    """A histogram of latencies in milliseconds with fixed buckets.
+
+    The upper bounds of the buckets are `LATENCY_BUCKETS_MS`, and the last bucket
+    counts all latencies above the largest bound.
+    """
+
+    __slots__ = ("_counts", "_count", "_total", "_max")
+
+    def __init__(self) -> None:
+        self._counts: list[int] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self._count: int = 0
+        self._total: float = 0.0
+        self._max: float = 0.0
+
+    @property
+    def counts(self) -> tuple[int, ...]:
+        """The number of latencies in every bucket."""
+        return tuple(self._counts)
+
+    @property
+    def count(self) -> int:
+        """The number of recorded latencies."""
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        """The mean of recorded latencies."""
+        return self._total / self._count if self._count else 0.0
+
+    @property
+    def max(self) -> float:
+        """The largest recorded latency."""
+        return self._max
+
+    def add(self, latency: float) -> None:
+        """Record a latency in milliseconds."""
+        self._counts[bisect_left(LATENCY_BUCKETS_MS, latency)] += 1
+        self._count += 1
+        self._total += latency
+        self._max = max(self._max, latency)
+
+    def quantile(self, q: float) -> float:
+        """Returns the upper bound of the bucket containing the quantile.
+
+        The bound is capped at the largest recorded latency, which is also
+        returned for quantiles in the last bucket.
+
+        Args:
+            q (float): The quantile between 0 and 1.
+        """
+        rank = q * self._count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self._counts, strict=False):
+            seen += count
+            if count and seen >= rank:
+                return min(bound, self._max)
+        return self._max
+
+
+class _Trace:
+    __slots__ = ("name", "times")
+
+    def __init__(self, name: str, times: list[float]):
+        self.name: str = name
+        self.times: list[float] = times
+
+
+class LatencyTracer:
+    """Traces events from the socket to the paint of the game screen.
+
+    Every event is stamped when its line is read from the socket and when it is
+    decoded. The events bridge stamps the decoded events as a dispatched batch when
+    it publishes them, and the batch is stamped as rebuilt only if the game
+    viewmodel is rebuilt while it is published, and then as painted at the next
+    paint of the game screen. Events merged into a batch, or superseded by a later
+    event, share the stamps of the batch. Batches leaving the state unchanged, or
+    not rebuilt, are dropped, so dispatches and rebuilds of key presses are never
+    stamped on traced events.
+
+    Completed traces are logged and recorded in histograms by event name and
+    segment between stages. Traces of events that never reach the game screen
+    are dropped once `MAX_PENDING_TRACES` newer events are traced.
+    """
+
+    __slots__ = (
+        "_logger",
+        "_clock",
+        "_read_at",
+        "_decoded",
+        "_batch",
+        "_rebuilt",
+        "_histograms",
+    )
+
+    def __init__(self, logger: Logger, clock: Callable[[], float] = time.monotonic):
+        """Initialize new tracer.
+
+        Args:
+            logger (Logger): The logger of completed traces.
+            clock (Callable[[], float]): The clock of stamps in seconds, the same
+                as the clock of the event loop.
+        """
+        self._logger: Logger = logger
+        self._clock: Callable[[], float] = clock
+        self._read_at: float | None = None
+        self._decoded: deque[_Trace] = deque(maxlen=MAX_PENDING_TRACES)
+        self._batch: list[_Trace] = []
+        self._rebuilt: deque[_Trace] = deque(maxlen=MAX_PENDING_TRACES)
+        self._histograms: dict[str, dict[str, LatencyHistogram]] = {}
+
+    @property
+    def histograms(self) -> Mapping[str, Mapping[str, LatencyHistogram]]:
+        """The histograms of completed traces by event name and segment."""
+        return self._histograms
+
+    def read(self, at: float) -> None:
+        """Stamp the line of the next decoded event as read at the given time."""
+        self._read_at = at
+
+    def decoded(self, name: str) -> None:
+        """Start the trace of a decoded event."""
+        now = self._clock()
+        read_at, self._read_at = self._read_at, None
+        self._decoded.append(
+            _Trace(name=name, times=[now if read_at is None else read_at, now])
+        )
+
+    def dispatched(self, changed: bool) -> None:
+        """Stamp the decoded events as a dispatched batch.
+
+        Args:
+            changed (bool): Whether dispatching the batch changed the state.
+                If not, the traces of the batch are dropped.
+        """
+        self._batch = self._stamp(self._decoded) if changed else []
+        self._decoded.clear()
+
+    def rebuilt(self) -> None:
+        """Stamp the dispatched batch as rebuilt into viewmodels."""
+        self._rebuilt.extend(self._stamp(self._batch))
+        self._batch = []
+
+    def published(self) -> None:
+        """End the dispatched batch, dropping its traces if it was not rebuilt."""
+        self._batch = []
+
+    def painted(self) -> None:
+        """Stamp rebuilt events as painted, and record the completed traces."""
+        for trace in self._stamp(self._rebuilt):
+            self._record(trace)
+        self._rebuilt.clear()
+
+    def _stamp(self, traces: Iterable[_Trace]) -> list[_Trace]:
+        now = self._clock()
+        stamped = list(traces)
+        for trace in stamped:
+            trace.times.append(now)
+        return stamped
+
+    def _record(self, trace: _Trace) -> None:
+        times = trace.times
+        latencies = [(end - start) * 1000 for start, end in pairwise(times)]
+        latencies.append((times[_PAINTED] - times[_READ]) * 1000)
+        histograms = self._histograms.setdefault(
+            trace.name, {segment: LatencyHistogram() for segment in LATENCY_SEGMENTS}
+        )
+        for segment, latency in zip(LATENCY_SEGMENTS, latencies, strict=True):
+            histograms[segment].add(latency)
+        self._logger.log_event_latency(
+            name=trace.name, latencies=dict(zip(LATENCY_SEGMENTS, latencies, strict=True))
+        )
@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 import atexit
+from collections.abc import Mapping
 from io import TextIOWrapper
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import httpx
 import structlog
@@ -8,6 +12,15 @@ from attr import asdict
 from attrs import has
 from pydepot import Action
 
+from .latency import LATENCY_BUCKETS_MS
+
+if TYPE_CHECKING:
+    from ..app.application import RedrawStats
+    from .events.ingress import IngressStats
+    from .latency import LatencyHistogram
+    from .output import FrameStats, OutputStats
+    from .views.profile import RenderProfile
+
 
 class Logger:
     """A logging interface wrapping the `structlog`."""
@@ -76,3 +89,141 @@ class Logger:
             path=response.request.url.path,
             code=response.status_code,
         )
+
+    def log_redraw_stats(self, stats: RedrawStats) -> None:
+        """Log the counters of requested and performed redraws."""
+        if not self._debug:
+            return
+
+        log = structlog.get_logger()
+        log.info(
+            "redraw_stats",
+            requested=stats.requested,
+            immediate=stats.immediate,
+            performed=stats.performed,
+        )
+
+    def log_coalesced_events(self, received: int, published: int, merged: int) -> None:
+        """Log the counters of a batch of events with superseded events dropped."""
+        if not self._debug:
+            return
+
+        log = structlog.get_logger()
+        log.info(
+            "events_coalesced", received=received, published=published, merged=merged
+        )
+
+    def log_event_error(self, message: str, error: Exception) -> None:
+        """Log an error raised by decoding an incoming event or by its handlers.
+
+        The event is dropped, so the error is logged even when not in debug mode.
+        """
+        log = structlog.get_logger()
+        log.error("event_error", message=message, exc_info=error)
+
+    def log_ingress_stats(self, stats: IngressStats) -> None:
+        """Log the counters of the events ingress queue and time spent in it."""
+        if not self._debug:
+            return
+
+        log = structlog.get_logger()
+        log.info(
+            "ingress_stats",
+            received=stats.received,
+            merged=stats.merged,
+            failed=stats.failed,
+            max_depth=stats.max_depth,
+            mean_wait_ms=round(stats.mean_wait * 1000, 3),
+            max_wait_ms=round(stats.max_wait * 1000, 3),
+        )
+
+    def log_event_latency(self, name: str, latencies: Mapping[str, float]) -> None:
+        """Log the latencies of an event from the socket to the paint, in ms."""
+        if not self._debug:
+            return
+
+        log = structlog.get_logger()
+        log.info(
+            "event_latency",
+            event_name=name,
+            **{
+                f"{segment}_ms": round(latency, 3)
+                for segment, latency in latencies.items()
+            },
+        )
+
+    def log_latency_summary(
+        self, histograms: Mapping[str, Mapping[str, LatencyHistogram]]
+    ) -> None:
+        """Log the histograms of event latencies by event name and segment."""
+        if not self._debug:
+            return
+
+        log = structlog.get_logger()
+        log.info(
+            "event_latency_summary",
+            bucket_bounds_ms=list(LATENCY_BUCKETS_MS),
+            events={
+                name: {
+                    segment: _histogram_fields(histogram)
+                    for segment, histogram in segments.items()
+                }
+                for name, segments in histograms.items()
+            },
+        )
+
+    def log_frame_output(self, frame: FrameStats) -> None:
+        """Log the counters of data written to the terminal for a frame."""
+        if not self._debug:
+            return
+
+        log = structlog.get_logger()
+        log.info(
+            "frame_output",
+            screen=frame.screen,
+            bytes_written=frame.bytes_written,
+            escapes=frame.escapes,
+            flushes=frame.flushes,
+        )
+
+    def log_output_stats(
+        self,
+        stats: OutputStats,
+        screen_stats: dict[str, OutputStats],
+        profile: RenderProfile,
+    ) -> None:
+        """Log the summary of data written to the terminal, in total and by screen."""
+        if not self._debug:
+            return
+
+        log = structlog.get_logger()
+        log.info(
+            "output_stats",
+            profile=profile.value,
+            **_output_stats_fields(stats),
+            screens={
+                screen: _output_stats_fields(totals)
+                for screen, totals in screen_stats.items()
+            },
+        )
+
+
+def _output_stats_fields(stats: OutputStats) -> dict[str, int | float]:
+    return {
+        "bytes_written": stats.bytes_written,
+        "escapes": stats.escapes,
+        "flushes": stats.flushes,
+        "frames": stats.frames,
+        "bytes_per_frame": round(stats.bytes_per_frame, 1),
+    }
+
+
+def _histogram_fields(histogram: LatencyHistogram) -> dict[str, int | float | list[int]]:
+    return {
+        "count": histogram.count,
+        "mean_ms": round(histogram.mean, 3),
+        "p50_ms": round(histogram.quantile(0.5), 3),
+        "p95_ms": round(histogram.quantile(0.95), 3),
+        "max_ms": round(histogram.max, 3),
+        "buckets": list(histogram.counts),
+    }
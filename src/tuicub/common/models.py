@@ -3,7 +3,6 @@ from __future__ import annotations
 from collections.abc import Awaitable, Callable, Generator
 from datetime import datetime
 from enum import IntEnum, StrEnum
-from typing import NamedTuple
 
 from attrs import field, frozen
 from more_itertools import first
@@ -16,6 +15,14 @@ from .views import Color, Text, TextPart
 from .views.animation import TextAnimation
 from .views.text import EMPTY_TEXT
 
+_DECK_SIZE = 52
+_JOKER_IDS = frozenset((104, 105))
+# Sort keys by tile id placing both figures of a tile next to each other.
+_TILE_SORT_KEYS: tuple[int, ...] = tuple(
+    tile if tile < _DECK_SIZE or tile in _JOKER_IDS else tile - _DECK_SIZE
+    for tile in range(2 * _DECK_SIZE + len(_JOKER_IDS))
+)
+
 
 @frozen
 class User:
@@ -233,23 +240,5 @@ def remove_gameroom(
     return tuple(_gamerooms)
 
 
-class _TileNode(NamedTuple):
-    id: int
-    order: int
-
-
 def sorted_tileset(tileset: list[int]) -> list[int]:
-    deck_size = 52
-    jokers = {104, 105}
-    return [
-        node.id
-        for node in sorted(
-            [
-                _TileNode(id=tile, order=tile)
-                if (tile < deck_size or tile in jokers)
-                else _TileNode(id=tile, order=tile - deck_size)
-                for tile in tileset
-            ],
-            key=lambda node: node.order,
-        )
-    ]
+    return sorted(tileset, key=_TILE_SORT_KEYS.__getitem__)
@@ -2,12 +2,13 @@ from cacheout import Cache as Cacheout  # type: ignore
 
 from .cache import Cache
 from .config import Config
+from .latency import LatencyTracer
 from .logger import Logger
 from .views.color import Theme
 
 
 class CommonModule:
-    __slots__ = ("_config", "_logger", "_theme")
+    __slots__ = ("_config", "_logger", "_theme", "_latency_tracer")
 
     @property
     def config(self) -> Config:
@@ -17,6 +18,10 @@ class CommonModule:
     def logger(self) -> Logger:
         return self._logger
 
+    @property
+    def latency_tracer(self) -> LatencyTracer | None:
+        return self._latency_tracer
+
     @property
     def theme(self) -> Theme:
         return self._theme
@@ -28,6 +33,9 @@ class CommonModule:
         logger = Logger(logfile_path=config.logfile, debug=config.debug)
         logger.configure()
         self._logger: Logger = logger
+        self._latency_tracer: LatencyTracer | None = (
+            LatencyTracer(logger=logger) if config.debug else None
+        )
 
     def cache(self) -> Cache:
         return Cache(cache_engine=Cacheout(maxsize=1024))
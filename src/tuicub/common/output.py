@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Callable
+from typing import TextIO
+
+from attrs import frozen
+from prompt_toolkit.data_structures import Size
+from prompt_toolkit.output import ColorDepth
+from prompt_toolkit.output.vt100 import Vt100_Output
+
+ESCAPE = "\x1b"
+
+
+@frozen
+class FrameStats:
+    """Counters of the data written to the terminal for a single frame.
+
+    Attributes:
+        screen (str): The name of the screen the frame was rendered for.
+        bytes_written (int): The number of encoded bytes written.
+        escapes (int): The number of escape sequences written.
+        flushes (int): The number of flushes that wrote any data.
+    """
+
+    screen: str
+    bytes_written: int
+    escapes: int
+    flushes: int
+
+
+@frozen
+class OutputStats:
+    """Counters of the data written to the terminal over many frames.
+
+    Attributes:
+        bytes_written (int): The number of encoded bytes written.
+        escapes (int): The number of escape sequences written.
+        flushes (int): The number of flushes that wrote any data.
+        frames (int): The number of frames that wrote any data.
+    """
+
+    bytes_written: int = 0
+    escapes: int = 0
+    flushes: int = 0
+    frames: int = 0
+
+    @property
+    def bytes_per_frame(self) -> float:
+        """The average number of bytes written per frame."""
+        return self.bytes_written / self.frames if self.frames else 0.0
+
+    def add(self, frame: FrameStats) -> OutputStats:
+        """Returns the counters with the frame's counters added."""
+        return OutputStats(
+            bytes_written=self.bytes_written + frame.bytes_written,
+            escapes=self.escapes + frame.escapes,
+            flushes=self.flushes + frame.flushes,
+            frames=self.frames + 1,
+        )
+
+
+class CountingOutput(Vt100_Output):
+    """A VT100 output counting the data it writes to the terminal.
+
+    Bytes, escape sequences and flushes are counted for the current frame until
+    it is ended with `end_frame`, after which the frame's counters are added
+    to the totals of its screen.
+    """
+
+    def __init__(
+        self,
+        stdout: TextIO,
+        get_size: Callable[[], Size],
+        term: str | None = None,
+        default_color_depth: ColorDepth | None = None,
+        enable_bell: bool = True,
+        enable_cpr: bool = True,
+    ) -> None:
+        super().__init__(
+            stdout,
+            get_size,
+            term=term,
+            default_color_depth=default_color_depth,
+            enable_bell=enable_bell,
+            enable_cpr=enable_cpr,
+        )
+        self._encoding: str = stdout.encoding or "utf-8"
+        self._has_pending_data: bool = False
+        self._frame_bytes: int = 0
+        self._frame_escapes: int = 0
+        self._frame_flushes: int = 0
+        self._screen_stats: dict[str, OutputStats] = {}
+
+    @property
+    def stats(self) -> OutputStats:
+        """The counters of all ended frames."""
+        return OutputStats(
+            bytes_written=sum(s.bytes_written for s in self._screen_stats.values()),
+            escapes=sum(s.escapes for s in self._screen_stats.values()),
+            flushes=sum(s.flushes for s in self._screen_stats.values()),
+            frames=sum(s.frames for s in self._screen_stats.values()),
+        )
+
+    @property
+    def screen_stats(self) -> dict[str, OutputStats]:
+        """The counters of all ended frames by the name of their screen."""
+        return dict(self._screen_stats)
+
+    def end_frame(self, screen: str) -> FrameStats | None:
+        """End the current frame and add its counters to the totals of the screen.
+
+        Args:
+            screen (str): The name of the screen the frame was rendered for.
+
+        Returns:
+            The counters of the frame, or `None` if the frame wrote no data.
+        """
+        if not self._frame_bytes:
+            return None
+
+        frame = FrameStats(
+            screen=screen,
+            bytes_written=self._frame_bytes,
+            escapes=self._frame_escapes,
+            flushes=self._frame_flushes,
+        )
+        self._frame_bytes = self._frame_escapes = self._frame_flushes = 0
+        self._screen_stats[screen] = self._screen_stats.get(screen, OutputStats()).add(
+            frame
+        )
+        return frame
+
+    def write(self, data: str) -> None:
+        self._count(data)
+        super().write(data)
+
+    def write_raw(self, data: str) -> None:
+        self._count(data)
+        self._frame_escapes += data.count(ESCAPE)
+        super().write_raw(data)
+
+    def flush(self) -> None:
+        if self._has_pending_data:
+            self._frame_flushes += 1
+            self._has_pending_data = False
+        super().flush()
+
+    def _count(self, data: str) -> None:
+        self._has_pending_data = True
+        self._frame_bytes += (
+            len(data) if data.isascii() else len(data.encode(self._encoding, "replace"))
+        )
+
+
+def create_output(color_depth: ColorDepth) -> CountingOutput:
+    """Create a counting output writing to the standard output.
+
+    Args:
+        color_depth (ColorDepth): The default color depth of the output.
+
+    Returns:
+        The counting output.
+    """
+    return CountingOutput.from_pty(  # type: ignore[return-value]
+        sys.stdout, term=os.environ.get("TERM"), default_color_depth=color_depth
+    )
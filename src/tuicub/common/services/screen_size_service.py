@@ -1,14 +1,61 @@
+from abc import abstractmethod
+from typing import Protocol
+from weakref import WeakSet
+
 from prompt_toolkit.renderer import Output
 
 
+class ScreenSizeSubscriber(Protocol):
+    """A subscriber to settled changes of the screen width."""
+
+    @abstractmethod
+    def on_resize(self, width: int) -> None:
+        """Called when the width of the screen has changed and settled.
+
+        Args:
+            width (int): The new width of the screen in characters.
+        """
+
+
 class ScreenSizeService:
-    """A service for getting the size of the screen."""
+    """A service for getting the size of the screen.
+
+    The width is read from the output once and kept until the service is notified
+    of a settled resize, so layouts are not recomputed at every intermediate width
+    while the terminal is being resized. Once a resize settles with a new width,
+    subscribers are notified, so they can recompute their layouts.
+    """
 
-    __slots__ = ("_output",)
+    __slots__ = ("_output", "_width", "_subscribers")
 
     def __init__(self, output: Output):
         self._output: Output = output
+        self._width: int | None = None
+        self._subscribers: WeakSet[ScreenSizeSubscriber] = WeakSet()
 
     def width(self) -> int:
-        """Returns the current width of the screen in characters."""
-        return self._output.get_size().columns
+        """Returns the width of the screen in characters at the last settled size."""
+        if self._width is None:
+            self._width = self._output.get_size().columns
+        return self._width
+
+    def did_resize(self, _: object = None) -> None:
+        """Read the width again, after the size of the screen settled.
+
+        Subscribers are notified if the width has changed.
+        """
+        previous_width, self._width = self._width, self._output.get_size().columns
+        if self._width != previous_width:
+            for subscriber in self._subscribers.copy():
+                subscriber.on_resize(self._width)
+
+    def subscribe(self, subscriber: ScreenSizeSubscriber) -> None:
+        """Subscribe to settled changes of the width.
+
+        The service keeps only a weak reference to the subscriber.
+        """
+        self._subscribers.add(subscriber)
+
+    def unsubscribe(self, subscriber: ScreenSizeSubscriber) -> None:
+        """Unsubscribe from settled changes of the width."""
+        self._subscribers.discard(subscriber)
@@ -1,3 +1,5 @@
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from typing import Generic, TypeVar
 
 from pydepot import Action, Store
@@ -8,14 +10,68 @@ _TState = TypeVar("_TState")
 
 
 class TuicubStore(Generic[_TState], Store[_TState]):
-    """A state store that logs dispatched actions."""
+    """A state store that logs dispatched actions.
 
-    __slots__ = ("_logger",)
+    Actions dispatched within a transaction are applied immediately, but
+    subscribers are notified only once, with the final state, when the outermost
+    transaction ends.
+    """
+
+    __slots__ = ("_logger", "_transaction_depth", "_transaction_state", "__weakref__")
 
     def __init__(self, initial_state: _TState, logger: Logger):
         self._logger: Logger = logger
+        self._transaction_depth: int = 0
+        self._transaction_state: _TState | None = None
         super().__init__(initial_state=initial_state)
 
     def dispatch(self, action: Action) -> None:
         self._logger.log_action(action=action)
-        super().dispatch(action=action)
+        if not self._transaction_depth:
+            super().dispatch(action=action)
+        elif reducer := self._reducers.get(type(action), None):
+            self._state = reducer.apply(action=action, state=self._state)
+
+    def dispatch_batch(self, actions: Iterable[Action]) -> None:
+        """Dispatch actions in a single transaction.
+
+        Args:
+            actions (Iterable[Action]): The actions to dispatch in order.
+        """
+        with self.transaction():
+            for action in actions:
+                self.dispatch(action)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Defer notifying subscribers until the end of the transaction.
+
+        Transactions can be nested, in which case subscribers are notified at the end
+        of the outermost one, if the state has changed since its start.
+        """
+        if not self._transaction_depth:
+            self._transaction_state = self._state
+        self._transaction_depth += 1
+        try:
+            yield
+        finally:
+            self._transaction_depth -= 1
+            if not self._transaction_depth:
+                initial_state, self._transaction_state = self._transaction_state, None
+                if self._state != initial_state:
+                    for subscriber in self._subscribers.copy():
+                        subscriber.on_state(self._state)
+
+
+def dispatch_batch(store: Store[_TState], actions: Iterable[Action]) -> None:
+    """Dispatch actions to the store, notifying subscribers once if it supports it.
+
+    Args:
+        store (Store[_TState]): The store to dispatch actions to.
+        actions (Iterable[Action]): The actions to dispatch in order.
+    """
+    if isinstance(store, TuicubStore):
+        store.dispatch_batch(actions)
+    else:
+        for action in actions:
+            store.dispatch(action)
@@ -63,10 +63,15 @@ GAME_MOVE_MODE_KEY_TOOLTIP = "move"
 GAME_TOGGLE_SELECTED_KEY_TOOLTIP = "toggle selected"
 GAME_MOVE_TILES_KEY_TOOLTIP = "submit"
 GAME_FINISH_GAME_KEY_TOOLTIP = "continue"
+GAME_JUMP_KEY_TOOLTIP = "jump to tile"
+GAME_JUMP_TYPE_KEY_TOOLTIP = "color and number, or joker"
+GAME_JUMP_CONFIRM_KEY_TOOLTIP = "jump"
+GAME_JUMP_CANCEL_KEY_TOOLTIP = "cancel"
 
 GAME_STATUS_SELECT_MODE = "SELECT MODE"
 GAME_STATUS_MOVE_MODE = "MOVE MODE"
 GAME_STATUS_TURN_DONE = "TURN DONE"
+GAME_STATUS_JUMP_MODE = "JUMP TO {}_"
 
 GAME_WINNER_PART_WINNER = "\n\nWinner!\n"
 GAME_WINNER_PART_PLAYER = "Player "
@@ -2,6 +2,7 @@ from .center import HCenterView, VCenterView
 from .color import AnyBackgroundColor, Color, Theme, to_color, to_framework_bg
 from .focus import FocusWindow
 from .list import ListRow, ListView, ScrollDirection
+from .profile import RenderProfile
 from .separator import SeparatorView
 from .stack import Padding, StackView
 from .text import AnyText, Text, TextPart
@@ -25,6 +26,7 @@ __all__ = [
     "AnyText",
     "Color",
     "Theme",
+    "RenderProfile",
     "TextfieldView",
     "TextfieldViewDelegate",
     "Padding",
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable
 from enum import StrEnum
+from functools import cache
+from itertools import product
 from typing import Any, TypeGuard
 
+from .profile import RenderProfile
+
 
 class Color(StrEnum):
     """Names of all colors."""
@@ -62,19 +67,30 @@ class Color(StrEnum):
 
 
 class Theme:
-    """A color theme for coloring the application views."""
+    """A color theme for coloring the application views.
+
+    All `prompt_toolkit` style strings of the theme are precomputed and interned
+    at construction, so every lookup returns the same string object.
+
+    With a reduced render profile the colors are mapped onto the terminal palette
+    of the profile beforehand. A foreground color mapped onto its background is
+    replaced by the next closest palette color, so text stays readable.
+    """
 
-    __slots__ = ("_colors_to_hex",)
+    __slots__ = ("_profile", "_fg_styles", "_bg_styles", "_styles", "__weakref__")
+
+    @property
+    def profile(self) -> RenderProfile:
+        """The render profile the theme's styles are computed for."""
+        return self._profile
 
     def to_framework_bg(self, color: Color) -> str:
         """Converts a color to its `prompt_toolkit` background hex representation."""
-        bg_hex = self._colors_to_hex.get(color, None) or DEFAULT_COLORS_MAP[color]
-        return f"bg:{bg_hex} "
+        return self._bg_styles[color]
 
     def to_framework_fg(self, color: Color) -> str:
         """Converts a color to its `prompt_toolkit` foreground hex representation."""
-        fg_hex = self._colors_to_hex.get(color, None) or DEFAULT_COLORS_MAP[color]
-        return f"fg:{fg_hex} "
+        return self._fg_styles[color]
 
     def style(self, fg: Color, bg: Color, bold: bool = False) -> str:
         """Return a full `prompt_toolkit` style string.
@@ -90,22 +106,48 @@ class Theme:
         Returns:
             The `prompt_toolkit` style string.
         """
-        bold_ = "" if not bold else "bold"
-        fg_hex = self._colors_to_hex.get(fg, None) or DEFAULT_COLORS_MAP[fg]
-        bg_hex = self._colors_to_hex.get(bg, None) or DEFAULT_COLORS_MAP[bg]
-        return f"fg:{fg_hex} bg:{bg_hex} {bold_}"
+        return self._styles[fg, bg, bold]
 
-    def __init__(self, colors_map: dict[Color, str] | None = None):
+    def __init__(
+        self,
+        colors_map: dict[Color, str] | None = None,
+        profile: RenderProfile = RenderProfile.TRUE_COLOR,
+    ):
         """Initialize new theme.
 
         Args:
             colors_map (dict[Color, str] | None): Dictionary mapping color names
                 to their hex values.
+            profile (RenderProfile): The render profile to compute styles for.
+                Defaults to true color.
         """
-        self._colors_to_hex: dict[Color, str] = colors_map or DEFAULT_COLORS_MAP
+        self._profile: RenderProfile = profile
+        colors_to_hex: dict[Color, str] = colors_map or DEFAULT_COLORS_MAP
+        hexes = {
+            color: colors_to_hex.get(color) or DEFAULT_COLORS_MAP[color]
+            for color in Color
+        }
+        palette = {color: profile.quantize(hex_) for color, hex_ in hexes.items()}
+        self._fg_styles: dict[Color, str] = {
+            color: sys.intern(f"fg:{value} ") for color, value in palette.items()
+        }
+        self._bg_styles: dict[Color, str] = {
+            color: sys.intern(f"bg:{value} ") for color, value in palette.items()
+        }
+        self._styles: dict[tuple[Color, Color, bool], str] = {}
+        for fg, bg in product(palette, palette):
+            fg_value, bg_value = palette[fg], palette[bg]
+            if fg_value == bg_value and hexes[fg] != hexes[bg]:
+                fg_value = profile.quantize(hexes[fg], exclude=bg_value)
+            for bold in (False, True):
+                self._styles[fg, bg, bold] = sys.intern(
+                    f"fg:{fg_value} bg:{bg_value} {'bold' if bold else ''}"
+                )
 
     @classmethod
+    @cache
     def default(cls) -> Theme:
+        """Returns the shared theme with the default colors."""
         return Theme()
 
 
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from enum import StrEnum
+
+from prompt_toolkit.output import ColorDepth
+from prompt_toolkit.output.vt100 import ANSI_COLORS_TO_RGB
+
+RGB = tuple[int, int, int]
+
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+_GRAY_LEVELS = tuple(8 + 10 * i for i in range(24))
+
+_PALETTE_256: dict[str, RGB] = {
+    f"#{r:02x}{g:02x}{b:02x}": (r, g, b)
+    for r, g, b in (
+        *((r, g, b) for r in _CUBE_LEVELS for g in _CUBE_LEVELS for b in _CUBE_LEVELS),
+        *((level, level, level) for level in _GRAY_LEVELS),
+    )
+}
+_PALETTE_16: dict[str, RGB] = {
+    name: rgb for name, rgb in ANSI_COLORS_TO_RGB.items() if name != "ansidefault"
+}
+
+
+class RenderProfile(StrEnum):
+    """Rendering profiles trading colors and decorations for output size.
+
+    The reduced profiles map colors of the theme onto a terminal palette,
+    draw tiles with ASCII characters and skip decorative background fills,
+    which shrinks the escape sequences written for every frame.
+    """
+
+    TRUE_COLOR = "truecolor"
+    COLORS_256 = "256"
+    COLORS_16 = "16"
+
+    @property
+    def color_depth(self) -> ColorDepth:
+        """The color depth of the `prompt_toolkit` output."""
+        match self:
+            case RenderProfile.COLORS_256:
+                return ColorDepth.DEPTH_8_BIT
+            case RenderProfile.COLORS_16:
+                return ColorDepth.DEPTH_4_BIT
+            case _:
+                return ColorDepth.TRUE_COLOR
+
+    @property
+    def is_reduced(self) -> bool:
+        """Whether the profile is a reduced, low-bandwidth one."""
+        return self != RenderProfile.TRUE_COLOR
+
+    def quantize(self, hex_: str, exclude: str | None = None) -> str:
+        """Map a hex color onto the closest color of the profile's palette.
+
+        Args:
+            hex_ (str): The hex color, e.g. `#ebdbb2`.
+            exclude (str | None): A palette color that must not be returned,
+                e.g. the background of a foreground color.
+
+        Returns:
+            The `prompt_toolkit` color of the palette, or the unchanged hex color
+            if the profile is not reduced.
+        """
+        match self:
+            case RenderProfile.COLORS_256:
+                palette = _PALETTE_256
+            case RenderProfile.COLORS_16:
+                palette = _PALETTE_16
+            case _:
+                return hex_
+
+        rgb = _to_rgb(hex_)
+        return min(
+            (color for color in palette if color != exclude),
+            key=lambda color: _distance(rgb, palette[color]),
+        )
+
+
+def _to_rgb(hex_: str) -> RGB:
+    value = int(hex_.removeprefix("#"), 16)
+    return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
+
+
+def _distance(a: RGB, b: RGB) -> int:
+    return sum((x - y) ** 2 for x, y in zip(a, b, strict=True))
@@ -6,6 +6,12 @@ from .set_highlighted_tileset import (
     SetHighlightedTilesetAction,
     SetHighlightedTilesetReducer,
 )
+from .set_jump_query import (
+    EndJumpAction,
+    EndJumpReducer,
+    SetJumpQueryAction,
+    SetJumpQueryReducer,
+)
 from .set_tiles_selection import SetTilesSelectionAction, SetTilesSelectionReducer
 from .set_tilesets_selection import (
     SetTilesetsSelectionAction,
@@ -22,6 +28,8 @@ from .update_rack import UpdateRackAction, UpdateRackReducer
 __all__ = [
     "AddDrawnTileAction",
     "AddDrawnTileReducer",
+    "EndJumpAction",
+    "EndJumpReducer",
     "EndTurnAction",
     "EndTurnReducer",
     "ResetStateAction",
@@ -30,6 +38,8 @@ __all__ = [
     "SetHighlightedTileReducer",
     "SetHighlightedTilesetAction",
     "SetHighlightedTilesetReducer",
+    "SetJumpQueryAction",
+    "SetJumpQueryReducer",
     "SetTilesSelectionAction",
     "SetTilesSelectionReducer",
     "SetTilesetsSelectionAction",
@@ -38,4 +38,5 @@ class EndTurnReducer(Reducer[EndTurnAction, GameScreenState]):
             selection_mode=SelectionMode.TILES,
             selected_tiles=frozenset(),
             virtual_tileset=Tileset(),
+            jump_query=None,
         )
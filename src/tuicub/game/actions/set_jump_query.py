@@ -0,0 +1,81 @@
+from attrs import evolve, frozen
+from pydepot import Action, Reducer
+
+from ..models import Tile
+from ..state import GameScreenState
+
+
+@frozen
+class SetJumpQueryAction(Action):
+    """An intent to set the tile spec typed in the jump mode.
+
+    Attributes:
+        query (str): The typed part of the tile spec. Empty starts the jump mode.
+    """
+
+    query: str
+
+
+class SetJumpQueryReducer(Reducer[SetJumpQueryAction, GameScreenState]):
+    """The reducer for the set jump query action."""
+
+    __slots__ = ()
+
+    @property
+    def action_type(self) -> type[SetJumpQueryAction]:
+        return SetJumpQueryAction
+
+    def apply(
+        self, action: SetJumpQueryAction, state: GameScreenState
+    ) -> GameScreenState:
+        """Apply the set jump query action.
+
+        Updates the jump query to the one from the action.
+
+        Args:
+            action (SetJumpQueryAction): The action to apply.
+            state (GameScreenState): The current state.
+
+        Returns:
+            The updated state.
+        """
+        return evolve(state, jump_query=action.query)
+
+
+@frozen
+class EndJumpAction(Action):
+    """An intent to end the jump mode.
+
+    Attributes:
+        tile (Tile | None): The tile to highlight, or None to keep the current one.
+    """
+
+    tile: Tile | None = None
+
+
+class EndJumpReducer(Reducer[EndJumpAction, GameScreenState]):
+    """The reducer for the end jump action."""
+
+    __slots__ = ()
+
+    @property
+    def action_type(self) -> type[EndJumpAction]:
+        return EndJumpAction
+
+    def apply(self, action: EndJumpAction, state: GameScreenState) -> GameScreenState:
+        """Apply the end jump action.
+
+        Unsets the jump query and highlights the tile from the action, if any.
+
+        Args:
+            action (EndJumpAction): The action to apply.
+            state (GameScreenState): The current state.
+
+        Returns:
+            The updated state.
+        """
+        return evolve(
+            state,
+            jump_query=None,
+            highlighted_tile=action.tile or state.highlighted_tile,
+        )
@@ -42,4 +42,5 @@ class StartTurnReducer(Reducer[StartTurnAction, GameScreenState]):
             selected_tiles=frozenset(),
             virtual_tileset=Tileset(),
             new_tiles=frozenset(),
+            jump_query=None,
         )
@@ -40,7 +40,9 @@ class UpdateBoardReducer(Reducer[UpdateBoardAction, GameScreenState]):
         Returns:
             The updated state.
         """
-        new_tiles_from_rack = state.new_tiles.intersection(state.rack.tiles)
+        new_tiles_from_rack = frozenset(
+            tile for tile in state.new_tiles if tile in state.rack
+        )
         return evolve(
             state,
             board=action.board,
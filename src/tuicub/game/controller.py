@@ -60,6 +60,46 @@ class GameController:
         """
         self._scroll_interactor.scroll(direction=direction)
 
+    def start_jump(self, event: KeyPressEvent) -> None:
+        """Handler for the jump keybind.
+
+        Starts the jump mode of the game board.
+
+        Args:
+            event (KeyPressEvent): The triggering event.
+        """
+        self._scroll_interactor.start_jump()
+
+    def type_jump(self, event: KeyPressEvent) -> None:
+        """Handler for the keybinds typing a tile spec in the jump mode.
+
+        Types the pressed key into the spec of the tile to jump to.
+
+        Args:
+            event (KeyPressEvent): The triggering event.
+        """
+        self._scroll_interactor.type_jump(text=event.data)
+
+    def confirm_jump(self, event: KeyPressEvent) -> None:
+        """Handler for the confirm jump keybind.
+
+        Jumps to the tile matching the typed spec.
+
+        Args:
+            event (KeyPressEvent): The triggering event.
+        """
+        self._scroll_interactor.confirm_jump()
+
+    def cancel_jump(self, event: KeyPressEvent) -> None:
+        """Handler for the cancel jump keybind.
+
+        Ends the jump mode without jumping.
+
+        Args:
+            event (KeyPressEvent): The triggering event.
+        """
+        self._scroll_interactor.cancel_jump()
+
     def toggle_tile_selected(self, event: KeyPressEvent) -> None:
         """Handler for the toggle tile selected keybind.
 
@@ -2,6 +2,7 @@ from typing import Generic, TypeVar
 
 from eventoolkit import Event, StoreEventHandler
 
+from ...common.state.store import dispatch_batch
 from ..state import GameScreenState
 
 TEvent = TypeVar("TEvent", bound=Event)
@@ -11,3 +12,8 @@ class GameEventHandler(Generic[TEvent], StoreEventHandler[TEvent, GameScreenStat
     """Base handler for game events."""
 
     __slots__ = ("__weakref__",)
+
+    def handle(self, event: TEvent) -> None:
+        """Dispatch the actions for the event in a batch, then perform side effects."""
+        dispatch_batch(self._store, self.actions(event))
+        self.side_effects(event)
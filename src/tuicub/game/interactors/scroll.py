@@ -1,7 +1,12 @@
 from pydepot import Store
 
-from ..actions import SetHighlightedTileAction, SetHighlightedTilesetAction
-from ..models import ScrollDirection, SelectionMode
+from ..actions import (
+    EndJumpAction,
+    SetHighlightedTileAction,
+    SetHighlightedTilesetAction,
+    SetJumpQueryAction,
+)
+from ..models import ScrollDirection, SelectionMode, TileSpec
 from ..services.scroll_service import ScrollService
 from ..state import GameScreenState
 
@@ -30,6 +35,42 @@ class ScrollInteractor:
         else:
             self._scroll_tilesets(direction=direction)
 
+    def start_jump(self) -> None:
+        """Start the jump mode, in which the player types a spec of a tile to jump to."""
+        self._store.dispatch(action=SetJumpQueryAction(query=""))
+
+    def type_jump(self, text: str) -> None:
+        """Type the text into the spec of the tile to jump to.
+
+        Once the spec is complete and cannot be extended any further, e.g. `b7`
+        but not `b1`, jumps to the closest matching tile and ends the jump mode.
+        Text that does not lead to a valid spec is ignored.
+
+        Args:
+            text (str): The typed text.
+        """
+        query = (self._store.state.jump_query or "") + text
+        if TileSpec.is_prefix(query):
+            self._store.dispatch(action=SetJumpQueryAction(query=query))
+        elif spec := TileSpec.parse(query):
+            self._jump(spec)
+
+    def confirm_jump(self) -> None:
+        """Jump to the tile matching the typed spec, e.g. `b1`, and end the jump mode."""
+        spec = TileSpec.parse(self._store.state.jump_query or "")
+        if spec:
+            self._jump(spec)
+        else:
+            self.cancel_jump()
+
+    def cancel_jump(self) -> None:
+        """End the jump mode without jumping."""
+        self._store.dispatch(action=EndJumpAction())
+
+    def _jump(self, spec: TileSpec) -> None:
+        tile = self._scroll_service.jump_to_tile(spec=spec, state=self._store.state)
+        self._store.dispatch(action=EndJumpAction(tile=tile))
+
     def _scroll_tiles(self, direction: ScrollDirection) -> None:
         if tile := self._scroll_service.scroll_tiles(
             direction=direction, state=self._store.state
@@ -15,6 +15,10 @@ from ..common.strings import (
     GAME_DRAW_KEY_TOOLTIP,
     GAME_END_TURN_KEY_TOOLTIP,
     GAME_FINISH_GAME_KEY_TOOLTIP,
+    GAME_JUMP_CANCEL_KEY_TOOLTIP,
+    GAME_JUMP_CONFIRM_KEY_TOOLTIP,
+    GAME_JUMP_KEY_TOOLTIP,
+    GAME_JUMP_TYPE_KEY_TOOLTIP,
     GAME_MOVE_MODE_KEY_TOOLTIP,
     GAME_MOVE_TILES_KEY_TOOLTIP,
     GAME_REDO_KEY_TOOLTIP,
@@ -23,7 +27,7 @@ from ..common.strings import (
     GAME_UNDO_KEY_TOOLTIP,
 )
 from .controller import GameController
-from .models import ScrollDirection, SelectionMode
+from .models import JOKER_SPEC, TILE_SPEC_COLORS, ScrollDirection, SelectionMode
 from .state import GameScreenState
 
 
@@ -70,7 +74,14 @@ class GameKeybindsContainer(KeybindsContainer):
             * "m": sets the move tiles mode,
             * "space": toggles the select state of the currently highlighted tile,
             * "enter": performs the move tiles game action if the game is running,
-                or finished the game if the game has ended.
+                or finished the game if the game has ended,
+            * "/": starts the jump mode in the select mode.
+
+        In the jump mode, only the following keybinds are active:
+            * "r", "y", "b", "k", "j" and digits: type the spec of the tile,
+                e.g. "b7" for a blue seven or "j" for a joker,
+            * "enter": jumps to the tile of the typed spec, e.g. "b1",
+            * "escape": ends the jump mode.
 
         Returns:
             The list of keybinds.
@@ -85,6 +96,7 @@ class GameKeybindsContainer(KeybindsContainer):
         has_turn_no_winner_tilesets_selection = HasTurnNoWinnerTilesetsSelectionMode(
             store=self._store, local_store=self._local_store
         )
+        is_jumping = IsJumping(store=self._store, local_store=self._local_store)
 
         return [
             Keybind(
@@ -182,6 +194,34 @@ class GameKeybindsContainer(KeybindsContainer):
                 action=self._controller.finish_game,
                 condition=has_winner,
             ),
+            Keybind(
+                key="/",
+                display_key="/",
+                tooltip=GAME_JUMP_KEY_TOOLTIP,
+                action=self._controller.start_jump,
+                condition=has_turn_no_winner_tiles_selection,
+            ),
+            Keybind(
+                key=(*TILE_SPEC_COLORS, JOKER_SPEC, *"0123456789"),
+                display_key="b7",
+                tooltip=GAME_JUMP_TYPE_KEY_TOOLTIP,
+                action=self._controller.type_jump,
+                condition=is_jumping,
+            ),
+            Keybind(
+                key="c-m",
+                display_key="enter",
+                tooltip=GAME_JUMP_CONFIRM_KEY_TOOLTIP,
+                action=self._controller.confirm_jump,
+                condition=is_jumping,
+            ),
+            Keybind(
+                key="escape",
+                display_key="esc",
+                tooltip=GAME_JUMP_CANCEL_KEY_TOOLTIP,
+                action=self._controller.cancel_jump,
+                condition=is_jumping,
+            ),
         ]
 
 
@@ -209,10 +249,19 @@ class HasTurnNoWinner(Condition):
     __slots__ = ()
 
     def __call__(self) -> bool:
-        has_winner = self._local_store.state.winner is not None
+        return (
+            _has_turn_no_winner(local_store=self._local_store, store=self._store)
+            and self._local_store.state.jump_query is None
+        )
+
+
+class IsJumping(Condition):
+    __slots__ = ()
 
+    def __call__(self) -> bool:
         return (
-            _has_turn(local_store=self._local_store, store=self._store) and not has_winner
+            _has_turn_no_winner(local_store=self._local_store, store=self._store)
+            and self._local_store.state.jump_query is not None
         )
 
 
@@ -243,6 +292,12 @@ class HasTurnNoWinnerTilesetsSelectionMode(HasTurnNoWinner):
         )
 
 
+def _has_turn_no_winner(local_store: Store[GameScreenState], store: Store[State]) -> bool:
+    has_winner = local_store.state.winner is not None
+
+    return _has_turn(local_store=local_store, store=store) and not has_winner
+
+
 def _has_turn(local_store: Store[GameScreenState], store: Store[State]) -> bool:
     user_id = store.state.current_user.id if store.state.current_user else ""
     players = local_store.state.players
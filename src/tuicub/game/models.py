@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from enum import IntEnum, StrEnum
 
-from attrs import field, frozen
+from attrs import Factory, field, frozen
 
+from ..common.cache import InternTable
 from ..common.views import Color as UIColor
 from .consts import TILE_WIDTH
 
+FINGERPRINT_SEPARATOR = b"\xff"
+MAX_NUMBER = 13
+JOKER_SPEC = "j"
+JOKER_IDS = frozenset((104, 105))
+MAX_INTERNED_TILESETS = 1024
+
 
 class ScrollDirection(IntEnum):
     """The scrolling direction of the game board."""
@@ -28,24 +36,24 @@ class Color(IntEnum):
     @property
     def ui_color(self) -> UIColor:
         """Returns the UI tile color."""
-        match self:
-            case Color.RED:
-                return UIColor.TILE_RED
-            case Color.YELLOW:
-                return UIColor.TILE_YELLOW
-            case Color.BLUE:
-                return UIColor.TILE_BLUE
-            case Color.BLACK:
-                return UIColor.TILE_BLACK
+        return _UI_COLORS[self]
 
     @property
     def ui_selected_color(self) -> UIColor:
         """Returns the UI tile color for the selected state."""
-        match self:
-            case Color.RED | Color.YELLOW | Color.BLUE:
-                return self.ui_color
-            case Color.BLACK:
-                return UIColor.TILE_BLACK_SELECTED
+        return _UI_SELECTED_COLORS[self]
+
+
+_UI_COLORS = {
+    Color.RED: UIColor.TILE_RED,
+    Color.YELLOW: UIColor.TILE_YELLOW,
+    Color.BLUE: UIColor.TILE_BLUE,
+    Color.BLACK: UIColor.TILE_BLACK,
+}
+_UI_SELECTED_COLORS = {
+    **_UI_COLORS,
+    Color.BLACK: UIColor.TILE_BLACK_SELECTED,
+}
 
 
 class SelectionMode(StrEnum):
@@ -78,8 +86,7 @@ class Tile:
 
     def is_joker(self) -> bool:
         """Returns true if the tile is a joker."""
-        joker_ids = {104, 105}
-        return self.id in joker_ids
+        return TILE_IS_JOKER[self.id]
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Tile):
@@ -93,15 +100,90 @@ class Tile:
         return f"[{self.id}] {self.number} {self.color.name}({self.figure})"
 
 
+@frozen
+class TileSpec:
+    """A specification of tiles typed by the player.
+
+    A spec is a color letter followed by a number, e.g. `b7` for a blue seven,
+    or `j` for a joker. Color letters are `r` for red, `y` for yellow, `b`
+    for blue and `k` for black.
+
+    Attributes:
+        color (Color | None): The color of the tiles, or None for jokers.
+        number (int | None): The numerical value of the tiles, or None for jokers.
+    """
+
+    color: Color | None = field(default=None)
+    number: int | None = field(default=None)
+
+    @classmethod
+    def parse(cls, text: str) -> TileSpec | None:
+        """Returns the spec for the text, or None if the text is not a complete spec."""
+        if text == JOKER_SPEC:
+            return TileSpec()
+
+        color = TILE_SPEC_COLORS.get(text[:1])
+        digits = text[1:]
+        if color is None or not digits.isdigit() or digits.startswith("0"):
+            return None
+        number = int(digits)
+        return TileSpec(color=color, number=number) if number <= MAX_NUMBER else None
+
+    @classmethod
+    def is_prefix(cls, text: str) -> bool:
+        """Returns true if the text can be extended into a longer spec."""
+        return any(cls.parse(text + digit) for digit in "0123456789")
+
+    def tile_ids(self) -> tuple[int, ...]:
+        """Returns the ids of all tiles matching the spec."""
+        if self.color is None:
+            return tuple(sorted(JOKER_IDS))
+        return tuple(
+            tile_id
+            for tile_id, (color, number) in enumerate(
+                zip(TILE_COLORS, TILE_NUMBERS, strict=True)
+            )
+            if color == self.color
+            and number == self.number
+            and not TILE_IS_JOKER[tile_id]
+        )
+
+
 @frozen
 class Tileset:
     """A set of played game tiles.
 
+    Besides the tiles, a tileset holds a compact representation computed once:
+    the ids of its tiles as bytes, and a mask with the bit of every tile id set,
+    computed on first use, which makes membership tests and set algebra single
+    integer operations.
+
     Attributes:
         tiles (tuple[Tile, ...]): The tiles making this set.
+        fingerprint (bytes): The ids of the tiles in order, one byte per tile.
+            It identifies the tileset without hashing its tiles.
     """
 
     tiles: tuple[Tile, ...] = field(default=())
+    fingerprint: bytes = field(
+        init=False,
+        eq=False,
+        repr=False,
+        default=Factory(lambda self: bytes([t.id for t in self.tiles]), takes_self=True),
+    )
+    _mask: int | None = field(init=False, default=None, eq=False, repr=False)
+
+    @property
+    def mask(self) -> int:
+        """The mask of the ids of the tiles."""
+        if self._mask is None:
+            object.__setattr__(self, "_mask", mask_of_ids(self.fingerprint))
+        return self._mask  # type: ignore[return-value]
+
+    @property
+    def tile_ids(self) -> tuple[int, ...]:
+        """The ids of the tiles in order."""
+        return tuple(self.fingerprint)
 
     def width(self) -> int:
         """Returns the width (number of terminal characters) of the set."""
@@ -110,13 +192,29 @@ class Tileset:
 
     @classmethod
     def from_tile_ids(cls, tiles: list[int]) -> Tileset:
-        """Returns a tileset for the given list of tiles ids."""
-        return Tileset(tiles=tuple(Tile.from_id(tile) for tile in tiles))
+        """Returns a tileset for the given list of tiles ids.
+
+        Tilesets are interned, so equal lists of ids give the same instance
+        for as long as it is in use.
+        """
+        key = bytes(tiles)
+        tileset = _TILESETS.get(key)
+        if tileset is None:
+            tileset = _TILESETS.add(
+                key, Tileset(tiles=tuple(Tile.from_id(tile) for tile in tiles))
+            )
+        return tileset
+
+    def __contains__(self, tile: object) -> bool:
+        return isinstance(tile, Tile) and bool(self.mask >> tile.id & 1)
 
     def __str__(self) -> str:
         return str([str(tile) for tile in self.tiles])
 
 
+_TILESETS: InternTable[bytes, Tileset] = InternTable(max_size=MAX_INTERNED_TILESETS)
+
+
 @frozen(repr=False)
 class VirtualTileset(Tileset):
     """Represents a tileset that will be created by moving selected tiles."""
@@ -126,11 +224,98 @@ class VirtualTileset(Tileset):
 class Board:
     """A game board containing all played tilesets.
 
+    The mask of all tiles on the board and the tileset of every tile are computed
+    on first use, making "which tileset contains the tile" a single lookup.
+
     Attributes:
         tilesets (frozenset[Tileset]): All played sets of tiles.
+        fingerprint (bytes): The sorted fingerprints of all tilesets.
+            Computed once, it is a canonical key of the board, equal for
+            equal boards and different for any other.
     """
 
     tilesets: frozenset[Tileset] = field(default=frozenset())
+    fingerprint: bytes = field(
+        init=False,
+        eq=False,
+        repr=False,
+        default=Factory(
+            lambda self: join_fingerprints(sorted(t.fingerprint for t in self.tilesets)),
+            takes_self=True,
+        ),
+    )
+    _tilesets_by_tile_id: dict[int, Tileset] | None = field(
+        init=False, default=None, eq=False, repr=False
+    )
+    _mask: int | None = field(init=False, default=None, eq=False, repr=False)
+
+    @property
+    def mask(self) -> int:
+        """The mask of the ids of all tiles on the board."""
+        if self._mask is None:
+            object.__setattr__(self, "_mask", mask_of_ids(self._tileset_index()))
+        return self._mask  # type: ignore[return-value]
+
+    def tileset_of(self, tile: Tile) -> Tileset | None:
+        """Returns the tileset containing the tile, or None if it is not on the board.
+
+        The tilesets are indexed by the ids of their tiles on first use.
+        """
+        return self._tileset_index().get(tile.id)
+
+    def _tileset_index(self) -> dict[int, Tileset]:
+        if self._tilesets_by_tile_id is None:
+            object.__setattr__(
+                self,
+                "_tilesets_by_tile_id",
+                {
+                    tile_id: tileset
+                    for tileset in self.tilesets
+                    for tile_id in tileset.fingerprint
+                },
+            )
+        return self._tilesets_by_tile_id  # type: ignore[return-value]
+
+    def __contains__(self, tile: object) -> bool:
+        return isinstance(tile, Tile) and tile.id in self._tileset_index()
+
+
+def join_fingerprints(fingerprints: Iterable[bytes]) -> bytes:
+    """Join fingerprints of tilesets into a single fingerprint.
+
+    Tile ids never reach the separator byte, so joined fingerprints
+    are equal only if all their parts are equal.
+
+    Args:
+        fingerprints (Iterable[bytes]): The fingerprints of tilesets.
+
+    Returns:
+        The joined fingerprint.
+    """
+    return FINGERPRINT_SEPARATOR.join(fingerprints)
+
+
+def mask_of_ids(tile_ids: Iterable[int]) -> int:
+    """Returns the mask with the bits of the given tile ids set."""
+    mask = 0
+    for tile_id in tile_ids:
+        mask |= 1 << tile_id
+    return mask
+
+
+def mask_of(tiles: Iterable[Tile]) -> int:
+    """Returns the mask with the bits of ids of the given tiles set."""
+    return mask_of_ids(tile.id for tile in tiles)
+
+
+def tile_ids_of(mask: int) -> list[int]:
+    """Returns the ids of tiles whose bits are set in the mask, in ascending order."""
+    tile_ids = []
+    while mask:
+        lowest = mask & -mask
+        tile_ids.append(lowest.bit_length() - 1)
+        mask ^= lowest
+    return tile_ids
 
 
 @frozen
@@ -150,6 +335,13 @@ class Player:
     has_turn: bool = field(default=False)
 
 
+TILE_SPEC_COLORS = {
+    "r": Color.RED,
+    "y": Color.YELLOW,
+    "b": Color.BLUE,
+    "k": Color.BLACK,
+}
+
 TILES = [
     Tile(0, 1, Color.RED, 1),
     Tile(1, 2, Color.RED, 1),
@@ -258,3 +450,13 @@ TILES = [
     Tile(104, 14, Color.RED, 1),
     Tile(105, 14, Color.BLACK, 1),
 ]
+
+# Attributes of all tiles by tile id, computed once for lookups on hot paths.
+TILE_NUMBERS: tuple[int, ...] = tuple(tile.number for tile in TILES)
+TILE_COLORS: tuple[Color, ...] = tuple(tile.color for tile in TILES)
+TILE_FIGURES: tuple[int, ...] = tuple(tile.figure for tile in TILES)
+TILE_IS_JOKER: tuple[bool, ...] = tuple(tile.id in JOKER_IDS for tile in TILES)
+TILE_UI_COLORS: tuple[UIColor, ...] = tuple(tile.color.ui_color for tile in TILES)
+TILE_UI_SELECTED_COLORS: tuple[UIColor, ...] = tuple(
+    tile.color.ui_selected_color for tile in TILES
+)
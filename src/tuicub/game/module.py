@@ -3,7 +3,6 @@ from __future__ import annotations
 from collections.abc import Callable
 
 from eventoolkit import EventsObserver
-from pydepot import Store
 
 from ..common.events.module import EventsModule
 from ..common.http.module import HttpModule
@@ -15,10 +14,12 @@ from ..common.state.store import TuicubStore
 from ..common.views import FocusWindow
 from .actions import (
     AddDrawnTileReducer,
+    EndJumpReducer,
     EndTurnReducer,
     ResetStateReducer,
     SetHighlightedTileReducer,
     SetHighlightedTilesetReducer,
+    SetJumpQueryReducer,
     SetTilesetsSelectionReducer,
     SetTilesSelectionReducer,
     SetWinnerReducer,
@@ -51,6 +52,7 @@ from .requests.move import MoveRequestInteractor
 from .requests.redo import RedoRequestInteractor
 from .requests.undo import UndoRequestInteractor
 from .services.board_service import BoardService
+from .services.packing import create_packing_strategy
 from .services.scroll_service import ScrollService
 from .state import GameScreenState
 from .view import GameRootView, GameScreen, GameView, GameWidgetFactory
@@ -77,15 +79,17 @@ class GameModule:
             if not user:
                 raise NoCurrentUserError()
 
-            local_store: Store[GameScreenState] = TuicubStore(
+            local_store: TuicubStore[GameScreenState] = TuicubStore(
                 initial_state=GameScreenState.from_game(user_id=user.id, game=game),
                 logger=common_module.logger,
             )
             local_store.register(AddDrawnTileReducer())
+            local_store.register(EndJumpReducer())
             local_store.register(EndTurnReducer())
             local_store.register(ResetStateReducer())
             local_store.register(SetHighlightedTileReducer())
             local_store.register(SetHighlightedTilesetReducer())
+            local_store.register(SetJumpQueryReducer())
             local_store.register(SetTilesetsSelectionReducer())
             local_store.register(SetTilesSelectionReducer())
             local_store.register(SetWinnerReducer())
@@ -96,6 +100,8 @@ class GameModule:
             local_store.register(UpdatePlayersReducer())
             local_store.register(UpdateRackReducer())
 
+            events_module.bridge.add_store(local_store)
+
             scroll_service = ScrollService(
                 cache=common_module.cache(),
                 screen_size_service=services_module.screen_size_service,
@@ -106,6 +112,7 @@ class GameModule:
                 board_service=BoardService(
                     cache=common_module.cache(),
                     screen_size_service=services_module.screen_size_service,
+                    strategy=create_packing_strategy(common_module.config.packing),
                 ),
                 events_observer=EventsObserver(
                     BoardChangedEventHandler(store=local_store),
@@ -122,7 +129,9 @@ class GameModule:
                     publisher=events_module.publisher,
                 ),
                 scroll_service=scroll_service,
+                screen_size_service=services_module.screen_size_service,
                 user_id=user.id,
+                tracer=common_module.latency_tracer,
             )
 
             scroll_interactor = ScrollInteractor(
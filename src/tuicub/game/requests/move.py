@@ -2,7 +2,7 @@ from httperactor import Request
 
 from ...common.models import GameState
 from ..actions import ResetStateAction
-from ..models import Tileset
+from ..models import Tileset, mask_of, tile_ids_of
 from ..state import GameScreenState
 from .base import BaseGameRequestInteractor, GameRequest
 
@@ -46,30 +46,19 @@ class MoveRequestInteractor(BaseGameRequestInteractor):
         Returns:
             The move request.
         """
-        selected_tile_ids: frozenset[int] = frozenset(
-            tile.id for tile in state.selected_tiles
-        )
+        selected_mask = mask_of(state.selected_tiles)
         highlighted_tileset: Tileset = state.highlighted_tileset or Tileset()
 
-        not_highlighted_tilesets: frozenset[Tileset] = frozenset(
-            tileset for tileset in state.board.tilesets if tileset != highlighted_tileset
-        )
-
-        board: set[frozenset[int]] = set()
-        for tileset in not_highlighted_tilesets:
-            board.add(
-                frozenset(
-                    tile.id for tile in tileset.tiles if tile.id not in selected_tile_ids
-                )
-            )
-
-        highlighted_tile_ids: frozenset[int] = frozenset(
-            tile.id for tile in highlighted_tileset.tiles
-        )
-        board.add(selected_tile_ids.union(highlighted_tile_ids))
+        masks = [
+            tileset.mask & ~selected_mask
+            for tileset in state.board.tilesets
+            if tileset != highlighted_tileset
+        ]
+        masks.append(selected_mask | highlighted_tileset.mask)
 
         return MoveRequest(
-            game_id=game_id, board=[list(tileset) for tileset in board if tileset]
+            game_id=game_id,
+            board=[tile_ids_of(mask) for mask in dict.fromkeys(masks) if mask],
         )
 
     async def side_effects(self, response: GameState) -> None:
@@ -1,53 +1,51 @@
-import binpacking  # type: ignore[import]
-
 from ...common.cache import Cache
 from ...common.services.screen_size_service import ScreenSizeService
-from ..models import Tileset
+from ..models import Board, Tileset
+from .packing import PackingStrategy
 
 
 class BoardService:
-    """A service for creating game boards.
-
-    aa
-    """
+    """A service for creating game boards."""
 
-    __slots__ = ("_cache", "_screen_size_service")
+    __slots__ = ("_cache", "_screen_size_service", "_strategy")
 
-    def __init__(self, cache: Cache, screen_size_service: ScreenSizeService):
+    def __init__(
+        self,
+        cache: Cache,
+        screen_size_service: ScreenSizeService,
+        strategy: PackingStrategy,
+    ):
         """Initialize new service.
 
         Args:
             cache (Cache): The cache for game boards.
             screen_size_service (ScreenSizeService): The screen size service.
+            strategy (PackingStrategy): The strategy packing tilesets into rows.
         """
         self._cache: Cache = cache
         self._screen_size_service: ScreenSizeService = screen_size_service
+        self._strategy: PackingStrategy = strategy
 
-    def create_rows(self, board: frozenset[Tileset]) -> tuple[tuple[Tileset, ...], ...]:
+    def create_rows(self, board: Board) -> tuple[tuple[Tileset, ...], ...]:
         """Create rows from the board.
 
         Returns a sequence of rows, which themselves are sequences of tilesets.
-        Rows are calculated using a bin packing algorithm to minimize the number of rows
-        needed to fit all tilesets on the screen.
+        Rows are packed by the packing strategy of the service.
 
-        Results are cached based on a hash of the board and the screen width.
+        Results are cached based on the fingerprint of the board and the screen width.
 
         Args:
-            board (frozenset[Tileset]): The board to create rows for.
+            board (Board): The board to create rows for.
 
         Returns:
             The rows of tilesets created from the board.
         """
         width = self._screen_size_service.width()
-        if cached := self._cache.get(hash((board, width)), default=None):
-            return cached
+        key = (board.fingerprint, width)
+        if cached := self._cache.get(key, default=None):
+            return self._strategy.remember(rows=cached, width=width)
         else:
-            rows = tuple(
-                tuple(bin.keys())
-                for bin in binpacking.to_constant_volume(
-                    {tileset: tileset.width() for tileset in board}, width
-                )
-            )
-            self._cache.set(hash((board, width)), rows)
+            rows = self._strategy.pack(board.tilesets, width=width)
+            self._cache.set(key, rows)
 
             return rows
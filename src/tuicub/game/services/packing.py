@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+from ...common.config import Packing
+from ..models import Tileset
+
+Rows = tuple[tuple[Tileset, ...], ...]
+
+MAX_EXACT_STATES = 5000
+
+
+class PackingStrategy(ABC):
+    """Base class for strategies packing tilesets of the board into rows."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def pack(self, board: frozenset[Tileset], width: int) -> Rows:
+        """Pack the board into rows.
+
+        Args:
+            board (frozenset[Tileset]): The tilesets to pack.
+            width (int): The maximum width of a row.
+
+        Returns:
+            The rows of tilesets.
+        """
+
+    def remember(self, rows: Rows, width: int) -> Rows:
+        """Use the rows as the current layout, e.g. when they come from a cache.
+
+        Strategies that do not depend on the previous layout ignore it.
+
+        Args:
+            rows (Rows): The rows of the current layout.
+            width (int): The width the rows were packed for.
+
+        Returns:
+            The remembered rows.
+        """
+        return rows
+
+
+class FirstFitPacking(PackingStrategy):
+    """Packs the widest tilesets first, each into the first row it fits in."""
+
+    __slots__ = ()
+
+    def pack(self, board: frozenset[Tileset], width: int) -> Rows:
+        return pack_rows(board, width=width)
+
+
+class BestFitPacking(PackingStrategy):
+    """Packs the widest tilesets first, each into the fullest row it fits in."""
+
+    __slots__ = ()
+
+    def pack(self, board: frozenset[Tileset], width: int) -> Rows:
+        rows: list[list[Tileset]] = []
+        widths: list[int] = []
+        for tileset in _ordered(board):
+            tileset_width = tileset.width()
+            fitting = [
+                index
+                for index, row_width in enumerate(widths)
+                if row_width + tileset_width <= width
+            ]
+            if fitting:
+                index = max(fitting, key=lambda i: widths[i])
+                rows[index].append(tileset)
+                widths[index] += tileset_width
+            else:
+                rows.append([tileset])
+                widths.append(tileset_width)
+
+        return tuple(tuple(row) for row in rows)
+
+
+class ExactPacking(PackingStrategy):
+    """Packs the board into the least possible number of rows.
+
+    Tilesets of equal width are interchangeable, so the search runs over counts
+    of packed tilesets of every width rather than over subsets of tilesets.
+    Boards with too many combinations of widths are packed with first fit.
+    """
+
+    __slots__ = ("_max_states",)
+
+    def __init__(self, max_states: int = MAX_EXACT_STATES):
+        """Initialize new strategy.
+
+        Args:
+            max_states (int): The maximum number of searched states before
+                falling back to first fit.
+        """
+        self._max_states: int = max_states
+
+    def pack(self, board: frozenset[Tileset], width: int) -> Rows:
+        groups: dict[int, list[Tileset]] = {}
+        for tileset in _ordered(board):
+            groups.setdefault(tileset.width(), []).append(tileset)
+
+        widths = tuple(groups)
+        counts = tuple(len(tilesets) for tilesets in groups.values())
+        if (
+            any(tileset_width > width for tileset_width in widths)
+            or math.prod(count + 1 for count in counts) > self._max_states
+        ):
+            return pack_rows(board, width=width)
+
+        order = _search_exact(widths=widths, counts=counts, width=width)
+        rows: list[list[Tileset]] = []
+        row_width = width
+        for index in order:
+            tileset = groups[widths[index]].pop(0)
+            if row_width + tileset.width() > width:
+                rows.append([])
+                row_width = 0
+            rows[-1].append(tileset)
+            row_width += tileset.width()
+
+        return tuple(tuple(_ordered(row)) for row in rows)
+
+
+class PreservingPacking(PackingStrategy):
+    """Packs the board by updating the previous layout.
+
+    Changing one tileset leaves all other tilesets in place:
+
+    * a removed tileset leaves a gap in its row,
+    * a tileset replacing a removed one, i.e. sharing tiles with it, takes its place,
+    * other new tilesets are appended to the first row they fit in,
+      or to a new row at the bottom.
+
+    The whole board is repacked with first fit only if the width changes
+    or an updated row overflows. Packing is deterministic, so equal updates
+    of equal layouts always give equal rows.
+    """
+
+    __slots__ = ("_rows", "_tilesets", "_width")
+
+    def __init__(self) -> None:
+        self._rows: Rows = ()
+        self._tilesets: frozenset[Tileset] = frozenset()
+        self._width: int | None = None
+
+    def pack(self, board: frozenset[Tileset], width: int) -> Rows:
+        if width != self._width:
+            return self.remember(pack_rows(board, width=width), width=width)
+
+        if board == self._tilesets:
+            return self._rows
+
+        rows = self._update(board, width=width)
+        if rows is None:
+            rows = pack_rows(board, width=width)
+
+        # The rows keep the instances of unchanged tilesets from the previous
+        # layout, which `_update` looks up by identity, so those are remembered
+        # instead of the equal instances of the board.
+        return self.remember(rows, width=width)
+
+    def remember(self, rows: Rows, width: int) -> Rows:
+        tilesets = frozenset(tileset for row in rows for tileset in row)
+        return self._remember(rows, tilesets, width=width)
+
+    def _remember(self, rows: Rows, tilesets: frozenset[Tileset], width: int) -> Rows:
+        self._rows = rows
+        self._tilesets = tilesets
+        self._width = width
+        return rows
+
+    def _update(self, board: frozenset[Tileset], width: int) -> Rows | None:
+        removed = self._tilesets - board
+        added = board - self._tilesets
+        # Tilesets of the previous layout are looked up by identity, since hashing
+        # them is far more expensive than the packing itself.
+        replacements = {
+            id(previous): tileset
+            for previous, tileset in _match_replacements(removed, added).items()
+        }
+        removed_ids = {id(tileset) for tileset in removed}
+        rows: list[list[Tileset]] = []
+        widths: list[int] = []
+        for previous_row in self._rows:
+            row = [
+                replacements.get(id(tileset), tileset)
+                for tileset in previous_row
+                if id(tileset) not in removed_ids or id(tileset) in replacements
+            ]
+            row_width = _row_width(row)
+            if len(row) > 1 and row_width > width:
+                return None
+            rows.append(row)
+            widths.append(row_width)
+
+        placed = {id(tileset) for tileset in replacements.values()}
+        for tileset in _ordered(t for t in added if id(t) not in placed):
+            tileset_width = tileset.width()
+            for index, row_width in enumerate(widths):
+                if row_width + tileset_width <= width:
+                    rows[index].append(tileset)
+                    widths[index] += tileset_width
+                    break
+            else:
+                rows.append([tileset])
+                widths.append(tileset_width)
+
+        return tuple(tuple(row) for row in rows if row)
+
+
+def create_packing_strategy(packing: Packing) -> PackingStrategy:
+    """Create the packing strategy of the given name."""
+    match packing:
+        case Packing.FIRST_FIT:
+            return FirstFitPacking()
+        case Packing.BEST_FIT:
+            return BestFitPacking()
+        case Packing.EXACT:
+            return ExactPacking()
+        case _:
+            return PreservingPacking()
+
+
+def pack_rows(board: Iterable[Tileset], width: int) -> Rows:
+    """Pack tilesets into rows using first fit decreasing.
+
+    Tilesets wider than the row are put in rows of their own.
+
+    Args:
+        board (Iterable[Tileset]): The tilesets to pack.
+        width (int): The maximum width of a row.
+
+    Returns:
+        The rows of tilesets.
+    """
+    rows: list[list[Tileset]] = []
+    widths: list[int] = []
+    for tileset in _ordered(board):
+        tileset_width = tileset.width()
+        for index, row_width in enumerate(widths):
+            if row_width + tileset_width <= width:
+                rows[index].append(tileset)
+                widths[index] += tileset_width
+                break
+        else:
+            rows.append([tileset])
+            widths.append(tileset_width)
+
+    return tuple(tuple(row) for row in rows)
+
+
+def _search_exact(
+    widths: tuple[int, ...], counts: tuple[int, ...], width: int
+) -> list[int]:
+    """Returns the order of width indices packing into the least rows.
+
+    Every state is a count of packed tilesets of each width, encoded as a mixed
+    radix number, and is scored by the number of rows and the width of the last
+    row. Packing tilesets in the returned order, opening a new row whenever
+    the next one does not fit, is optimal.
+    """
+    strides = [math.prod(count + 1 for count in counts[:i]) for i in range(len(counts))]
+    states = math.prod(count + 1 for count in counts)
+    scores: list[tuple[int, int]] = [(0, width)] * states
+    choices = [0] * states
+    for state in range(1, states):
+        best: tuple[int, int] | None = None
+        for index, (tileset_width, stride) in enumerate(
+            zip(widths, strides, strict=True)
+        ):
+            if not (state // stride) % (counts[index] + 1):
+                continue
+
+            rows, row_width = scores[state - stride]
+            score = (
+                (rows, row_width + tileset_width)
+                if row_width + tileset_width <= width
+                else (rows + 1, tileset_width)
+            )
+            if best is None or score < best:
+                best, choices[state] = score, index
+        scores[state] = best  # type: ignore[assignment]
+
+    order = []
+    state = states - 1
+    while state:
+        order.append(choices[state])
+        state -= strides[choices[state]]
+
+    return order[::-1]
+
+
+def _ordered(tilesets: Iterable[Tileset]) -> list[Tileset]:
+    return sorted(tilesets, key=_order_key)
+
+
+def _order_key(tileset: Tileset) -> tuple[int, bytes]:
+    return -tileset.width(), tileset.fingerprint
+
+
+def _row_width(row: Iterable[Tileset]) -> int:
+    return sum(tileset.width() for tileset in row)
+
+
+def _match_replacements(
+    removed: frozenset[Tileset], added: frozenset[Tileset]
+) -> dict[Tileset, Tileset]:
+    replacements: dict[Tileset, Tileset] = {}
+    candidates = [(tileset, tileset.mask) for tileset in _ordered(removed)]
+    for tileset in _ordered(added):
+        mask = tileset.mask
+        best, best_shared = None, 0
+        for candidate, candidate_mask in candidates:
+            shared = (mask & candidate_mask).bit_count()
+            if shared > best_shared:
+                best, best_shared = candidate, shared
+        if best is not None:
+            replacements[best] = tileset
+            candidates = [c for c in candidates if c[0] is not best]
+
+    return replacements
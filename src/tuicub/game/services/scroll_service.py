@@ -1,28 +1,37 @@
 from __future__ import annotations
 
+from array import array
 from bisect import bisect_left
-from collections.abc import Callable, Hashable, Iterable, MutableSequence, Sequence
+from collections.abc import Hashable, Iterable, Sequence
 from typing import Generic, TypeVar
 
-from attrs import field, frozen
+from attrs import frozen
 
 from ...common.cache import Cache
 from ...common.services.screen_size_service import ScreenSizeService
-from ..consts import TILE_WIDTH
-from ..models import ScrollDirection, Tile, Tileset
+from ..consts import TILE_WIDTH, TILESET_HEIGHT
+from ..models import (
+    TILES,
+    ScrollDirection,
+    Tile,
+    Tileset,
+    TileSpec,
+    VirtualTileset,
+    join_fingerprints,
+)
 from ..state import GameScreenState
 
-T = TypeVar("T", covariant=True)
 THashable = TypeVar("THashable", bound=Hashable)
 
 
 class ScrollService:
     """A service for scrolling tiles and tilesets on the game board."""
 
-    __slot__ = (
+    __slots__ = (
         "_cache",
-        "_tiles_scroll_map",
-        "_tilesets_scroll_map",
+        "_layout",
+        "_tiles_index",
+        "_tilesets_index",
         "_screen_size_service",
     )
 
@@ -30,11 +39,12 @@ class ScrollService:
         """Initialize new service.
 
         Args:
-            cache (Cache): The cache for scroll maps.
+            cache (Cache): The cache for scroll indices.
             screen_size_service (ScreenSizeService): The screen size service.
         """
-        self._tiles_scroll_map: dict[Tile, ScrollNode[Tile]] = {}
-        self._tilesets_scroll_map: dict[Tileset, ScrollNode[Tileset]] = {}
+        self._layout: Layout | None = None
+        self._tiles_index: ScrollIndex[Tile] | None = None
+        self._tilesets_index: ScrollIndex[Tileset] | None = None
         self._screen_size_service: ScreenSizeService = screen_size_service
         self._cache: Cache = cache
 
@@ -46,27 +56,25 @@ class ScrollService:
     ) -> None:
         """Update scroll maps for new board and rack.
 
-        Every tile on the board and rack, and every played tileset has a corresponding
-        scroll node, which holds neighbouring tiles/tilesets for up, down, left and right
-        scrolling directions.
+        Every tile on the board and rack, and every played tileset has neighbouring
+        tiles/tilesets for up, down, left and right scrolling directions.
+        Only the new layout is remembered here; its scroll indices are created
+        on the first scroll, and neighbours are resolved only when scrolled to.
 
         Args:
             board (tuple[tuple[Tileset, ...], ...]): The new board.
             virtual_tileset (Tileset): The current virtual tileset.
             rack (Tileset): The new rack.
         """
-        width = self._screen_size_service.width()
-        key = hash((board, virtual_tileset, rack, width))
-        if maps := self._cache.get(key, None):
-            self._tiles_scroll_map, self._tilesets_scroll_map = maps
-        else:
-            self._tiles_scroll_map = create_tiles_scroll_map(
-                board=board, rack=rack, screen_width=width
-            )
-            self._tilesets_scroll_map = create_tilesets_scroll_map(
-                board=board, virtual_tileset=virtual_tileset, screen_width=width
-            )
-            self._cache.set(key, (self._tiles_scroll_map, self._tilesets_scroll_map))
+        layout = Layout(
+            board=board,
+            virtual_tileset=virtual_tileset,
+            rack=rack,
+            width=self._screen_size_service.width(),
+        )
+        if self._layout is None or not self._layout.is_same(layout):
+            self._layout = layout
+            self._tiles_index = self._tilesets_index = None
 
     def scroll_tiles(
         self, direction: ScrollDirection, state: GameScreenState
@@ -75,7 +83,7 @@ class ScrollService:
 
         Returns a tile that should be highlighted after performing the scroll
         in the given direction, or None if there is no possible tile to scroll to.
-        The next tile is chosen based on the current scroll map and the direction.
+        The next tile is chosen based on the current layout and the direction.
 
         Args:
             direction (ScrollDirection): The direction of the scroll.
@@ -84,10 +92,14 @@ class ScrollService:
         Returns:
             The next tile to higlight, or None if scrolling is not possible.
         """
-        return self._scroll(
-            current=state.highlighted_tile,
-            direction=direction,
-            scroll_map=self._tiles_scroll_map,
+        if not state.highlighted_tile:
+            return None
+
+        self._create_indices()
+        return (
+            self._tiles_index.neighbour(state.highlighted_tile, direction=direction)
+            if self._tiles_index
+            else None
         )
 
     def scroll_tilesets(
@@ -97,7 +109,7 @@ class ScrollService:
 
         Returns a tileset that should be highlighted after performing the scroll
         in the given direction, or None if there is no possible tileset to scroll to.
-        The next tileset is chosen based on the current scroll map and the direction.
+        The next tileset is chosen based on the current layout and the direction.
 
         Args:
             direction (ScrollDirection): The direction of the scroll.
@@ -106,161 +118,270 @@ class ScrollService:
         Returns:
             The next tileset to higlight, or None if scrolling is not possible.
         """
-        return self._scroll(
-            current=state.highlighted_tileset,
-            direction=direction,
-            scroll_map=self._tilesets_scroll_map,
+        if not state.highlighted_tileset:
+            return None
+
+        self._create_indices()
+        return (
+            self._tilesets_index.neighbour(state.highlighted_tileset, direction=direction)
+            if self._tilesets_index
+            else None
         )
 
-    def _scroll(
-        self,
-        current: THashable | None,
-        direction: ScrollDirection,
-        scroll_map: dict[THashable, ScrollNode[THashable]],
-    ) -> THashable | None:
-        if not current:
-            return None
+    def jump_to_tile(self, spec: TileSpec, state: GameScreenState) -> Tile | None:
+        """Find the tile matching the spec closest to the highlighted tile.
 
-        node: ScrollNode[THashable] | None = scroll_map.get(current, None)
-        if not node:
-            return None
+        Tiles are looked up by their ids in the index of the current layout,
+        so finding them costs the same regardless of the size of the board.
 
-        _next: THashable | None = None
-        if direction == ScrollDirection.LEFT:
-            _next = node.left
-        elif direction == ScrollDirection.RIGHT:
-            _next = node.right
-        elif direction == ScrollDirection.UP:
-            _next = node.top
-        elif direction == ScrollDirection.DOWN:
-            _next = node.bottom
-        if not _next:
+        Args:
+            spec (TileSpec): The spec of the tile to jump to.
+            state (GameScreenState): The current state of the game screen.
+
+        Returns:
+            The tile to highlight, or None if no tile on the board or rack
+            matches the spec.
+        """
+        self._create_indices()
+        if not self._tiles_index:
             return None
 
-        return _next
+        return self._tiles_index.nearest(
+            (TILES[tile_id] for tile_id in spec.tile_ids()),
+            origin=state.highlighted_tile,
+        )
+
+    def _create_indices(self) -> None:
+        if self._layout is None or self._tiles_index is not None:
+            return
+
+        layout = self._layout
+        if indices := self._cache.get(layout.key(), None):
+            self._tiles_index, self._tilesets_index = indices
+        else:
+            self._tiles_index = create_tiles_index(
+                board=layout.board, rack=layout.rack, screen_width=layout.width
+            )
+            self._tilesets_index = create_tilesets_index(
+                board=layout.board,
+                virtual_tileset=layout.virtual_tileset,
+                screen_width=layout.width,
+            )
+            self._cache.set(layout.key(), (self._tiles_index, self._tilesets_index))
 
 
 @frozen
-class ScrollNode(Generic[THashable]):
-    """A scroll map node holding neighbouring elements."""
+class Layout:
+    """The board, virtual tileset and rack as laid out on the screen.
+
+    Attributes:
+        board (tuple[tuple[Tileset, ...], ...]): The rows of the board.
+        virtual_tileset (Tileset): The current virtual tileset.
+        rack (Tileset): The rack.
+        width (int): The width of the screen.
+    """
+
+    board: tuple[tuple[Tileset, ...], ...]
+    virtual_tileset: Tileset
+    rack: Tileset
+    width: int
+
+    def is_same(self, other: Layout) -> bool:
+        """Returns true if the other layout is made of the very same objects.
+
+        Comparing identities is constant time, unlike comparing the rows,
+        and holds for all state changes that leave the layout unchanged,
+        e.g. moving the highlight.
+        """
+        return (
+            self.board is other.board
+            and self.virtual_tileset is other.virtual_tileset
+            and self.rack is other.rack
+            and self.width == other.width
+        )
 
-    value: THashable
-    top: THashable | None = field(default=None)
-    right: THashable | None = field(default=None)
-    bottom: THashable | None = field(default=None)
-    left: THashable | None = field(default=None)
+    def key(self) -> Hashable:
+        """Returns a cache key made of the fingerprints of the layout.
 
+        The fingerprint of the virtual tileset is paired with whether it is
+        virtual, since an empty virtual tileset and an empty tileset have the same
+        fingerprint, but are different values in the tilesets index.
+        """
+        return (
+            tuple(join_fingerprints(t.fingerprint for t in row) for row in self.board),
+            (
+                isinstance(self.virtual_tileset, VirtualTileset),
+                self.virtual_tileset.fingerprint,
+            ),
+            self.rack.fingerprint,
+            self.width,
+        )
 
-TKey = TypeVar("TKey", bound=Hashable)
-TVal = TypeVar("TVal")
 
+class ScrollIndex(Generic[THashable]):
+    """A positional index of tiles or tilesets of a single layout.
 
-class EdgeDistance(Generic[T]):
-    """A distance of a tile/tileset from the left edge of the screen."""
+    Every row, from the bottom row up, is a pair of parallel arrays holding
+    the horizontal positions of elements and their ids in the table of values.
+    Left and right neighbours are the adjacent entries of the row, up and down
+    neighbours are found by bisecting the positions of the adjacent row.
 
-    __slots__ = ("_distance", "_value")
+    Neighbours are resolved on demand and memoized, so scrolling costs the same
+    regardless of the size of the board.
+    """
 
-    @property
-    def distance(self) -> int:
-        """The distance from the left edge of the screen in characters."""
-        return self._distance
+    __slots__ = ("_ids", "_neighbours", "_positions", "_values", "_xs")
 
-    @property
-    def value(self) -> T:
-        """The tile or tileset."""
-        return self._value
+    def __init__(
+        self,
+        xs: Sequence[array[int]],
+        ids: Sequence[array[int]],
+        values: Sequence[THashable],
+    ):
+        """Initialize new index.
 
-    def __init__(self, distance: int, value: T):
-        self._distance: int = distance
-        self._value: T = value
+        Args:
+            xs (Sequence[array[int]]): The horizontal positions of elements
+                in every row, in ascending order.
+            ids (Sequence[array[int]]): The ids of elements in every row.
+            values (Sequence[THashable]): The elements by their ids.
+        """
+        self._xs: Sequence[array[int]] = xs
+        self._ids: Sequence[array[int]] = ids
+        self._values: Sequence[THashable] = values
+        self._positions: dict[THashable, tuple[int, int]] = {
+            values[id_]: (row_index, column)
+            for row_index, row in enumerate(ids)
+            for column, id_ in enumerate(row)
+        }
+        self._neighbours: dict[tuple[THashable, ScrollDirection], THashable | None] = {}
+
+    def position(self, value: THashable) -> tuple[int, int] | None:
+        """Returns the row and column of the element, counting rows from the bottom.
 
-    def __eq__(self, other: object) -> bool:  # pragma: no cover
-        if not isinstance(other, EdgeDistance):
-            return NotImplemented
+        Args:
+            value (THashable): The tile or tileset.
 
-        return self.distance == other.distance and self.value == other.value
+        Returns:
+            The position, or None if the element is not indexed.
+        """
+        return self._positions.get(value)
 
-    def __hash__(self) -> int:  # pragma: no cover
-        return hash((self.value, self.distance))
+    def nearest(
+        self, values: Iterable[THashable], origin: THashable | None
+    ) -> THashable | None:
+        """Returns the indexed element closest to the origin on the screen.
 
+        Args:
+            values (Iterable[THashable]): The candidate elements.
+            origin (THashable | None): The element to measure distances from.
+                If None or not indexed, the lowest, leftmost candidate is returned.
 
-@frozen
-class AdjacentEdges(Generic[T]):
-    """A container for adjacent edge distances of a tile or tileset."""
+        Returns:
+            The closest candidate, or None if no candidate is indexed.
+        """
+        candidates = [
+            (position, value)
+            for value in values
+            if (position := self._positions.get(value)) is not None
+        ]
+        if not candidates:
+            return None
 
-    bottom: EdgeDistance[T] | None
-    left: EdgeDistance[T] | None
-    right: EdgeDistance[T] | None
-    top: EdgeDistance[T] | None
+        origin_position = self._positions.get(origin) if origin is not None else None
+        if origin_position is None:
+            return min(candidates, key=lambda candidate: candidate[0])[1]
 
+        row_index, column = origin_position
+        x = self._xs[row_index][column]
 
-def create_tiles_scroll_map(
-    board: tuple[tuple[Tileset, ...], ...],
-    rack: Tileset,
-    screen_width: int,
-) -> dict[Tile, ScrollNode[Tile]]:
-    return dict(
-        nodes_matrix(
-            distances_matrix=distances_matrix(
-                board_rows=board,
-                bottom_row=rack,
-                screen_width=screen_width,
-                tileset_to_distances=tiles_tileset_to_distances,
-            ),
-            node_factory=tile_node,
-        )
-    )
+        def distance(candidate: tuple[tuple[int, int], THashable]) -> tuple[int, ...]:
+            (candidate_row, candidate_column), _ = candidate
+            dx = self._xs[candidate_row][candidate_column] - x
+            dy = (candidate_row - row_index) * TILESET_HEIGHT
+            return dx * dx + dy * dy, candidate_row, candidate_column
 
+        return min(candidates, key=distance)[1]
 
-def create_tilesets_scroll_map(
-    board: tuple[tuple[Tileset, ...], ...], virtual_tileset: Tileset, screen_width: int
-) -> dict[Tileset, ScrollNode[Tileset]]:
-    return dict(
-        nodes_matrix(
-            distances_matrix=distances_matrix(
-                board_rows=board,
-                bottom_row=virtual_tileset,
-                screen_width=screen_width,
-                tileset_to_distances=tilesets_tileset_to_distances,
-            ),
-            node_factory=tileset_node,
-        )
-    )
+    def neighbour(self, value: THashable, direction: ScrollDirection) -> THashable | None:
+        """Returns the neighbour of the element in the given direction.
 
+        Args:
+            value (THashable): The tile or tileset.
+            direction (ScrollDirection): The direction of the neighbour.
 
-def tiles_tileset_to_distances(
-    tileset: Tileset, current_distance: int
-) -> Sequence[EdgeDistance[Tile]]:
-    return tuple(
-        EdgeDistance(distance=current_distance + (index * TILE_WIDTH), value=tile)
-        for index, tile in enumerate(tileset.tiles)
-    )
+        Returns:
+            The neighbour, or None if there is none or the element is not indexed.
+        """
+        key = (value, direction)
+        if key not in self._neighbours:
+            self._neighbours[key] = self._resolve(value, direction=direction)
+        return self._neighbours[key]
+
+    def _resolve(self, value: THashable, direction: ScrollDirection) -> THashable | None:
+        position = self._positions.get(value)
+        if position is None:
+            return None
 
+        row_index, column = position
+        ids = self._ids[row_index]
+        match direction:
+            case ScrollDirection.LEFT:
+                return self._values[ids[column - 1]] if column > 0 else None
+            case ScrollDirection.RIGHT:
+                return self._values[ids[column + 1]] if column < len(ids) - 1 else None
+            case ScrollDirection.UP:
+                target = row_index + 1
+            case ScrollDirection.DOWN:
+                target = row_index - 1
+
+        if not 0 <= target < len(self._xs):
+            return None
+        closest = take_closest(self._xs[target], self._xs[row_index][column])
+        return None if closest is None else self._values[self._ids[target][closest]]
+
+
+def create_tiles_index(
+    board: tuple[tuple[Tileset, ...], ...], rack: Tileset, screen_width: int
+) -> ScrollIndex[Tile]:
+    """Create the index of tiles on the board and rack, with tile ids as ids."""
+    xs: list[array[int]] = []
+    ids: list[array[int]] = []
+    for row in combine_rows(board, rack):
+        x = leftmost_distance(row, screen_width)
+        row_xs, row_ids = array("i"), array("i")
+        for tileset in row:
+            for index, tile in enumerate(tileset.tiles):
+                row_xs.append(x + index * TILE_WIDTH)
+                row_ids.append(tile.id)
+            x += tileset.width()
+        xs.append(row_xs)
+        ids.append(row_ids)
 
-def tilesets_tileset_to_distances(
-    tileset: Tileset, current_distance: int
-) -> Sequence[EdgeDistance[Tileset]]:
-    return (
-        EdgeDistance(distance=current_distance + (tileset.width() // 2), value=tileset),
-    )
+    return ScrollIndex(xs=xs, ids=ids, values=TILES)
 
 
-def distances_matrix(
-    board_rows: tuple[tuple[Tileset, ...], ...],
-    bottom_row: Tileset,
+def create_tilesets_index(
+    board: tuple[tuple[Tileset, ...], ...],
+    virtual_tileset: Tileset,
     screen_width: int,
-    tileset_to_distances: Callable[[Tileset, int], Sequence[EdgeDistance[T]]],
-) -> Sequence[Sequence[EdgeDistance[T]]]:
-    _distances_matrix: MutableSequence[Sequence[EdgeDistance[T]]] = []
-    for row in combine_rows(board_rows, bottom_row):
-        current_distance = leftmost_distance(row, screen_width)
-        distances: list[EdgeDistance[T]] = []
+) -> ScrollIndex[Tileset]:
+    """Create the index of tilesets on the board, with their centres as positions."""
+    xs: list[array[int]] = []
+    ids: list[array[int]] = []
+    tilesets: list[Tileset] = []
+    for row in combine_rows(board, virtual_tileset):
+        x = leftmost_distance(row, screen_width)
+        row_xs, row_ids = array("i"), array("i")
         for tileset in row:
-            distances.extend(tileset_to_distances(tileset, current_distance))
-            current_distance += tileset.width()
+            row_xs.append(x + tileset.width() // 2)
+            row_ids.append(len(tilesets))
+            tilesets.append(tileset)
+            x += tileset.width()
+        xs.append(row_xs)
+        ids.append(row_ids)
 
-        _distances_matrix.append(distances)
-    return _distances_matrix
+    return ScrollIndex(xs=xs, ids=ids, values=tilesets)
 
 
 def combine_rows(
@@ -277,88 +398,16 @@ def row_width(row: tuple[Tileset, ...]) -> int:
     return sum(tileset.width() for tileset in row)
 
 
-def nodes_matrix(
-    distances_matrix: Sequence[Sequence[EdgeDistance[T]]],
-    node_factory: Callable[
-        [EdgeDistance[T], AdjacentEdges[T]],
-        tuple[TKey, ScrollNode[TVal]],
-    ],
-) -> Iterable[tuple[TKey, ScrollNode[TVal]]]:
-    _nodes_matrix: list[tuple[TKey, ScrollNode[TVal]]] = []
-    for row_index, row in enumerate(distances_matrix):
-        for entry_index, entry in enumerate(row):
-            _nodes_matrix.append(
-                node_factory(
-                    entry,
-                    adjacent_edges(distances_matrix, row, row_index, entry, entry_index),
-                )
-            )
-    return _nodes_matrix
-
-
-def adjacent_edges(
-    distances_matrix: Sequence[Sequence[EdgeDistance[T]]],
-    row: Sequence[EdgeDistance[T]],
-    row_index: int,
-    entry: EdgeDistance[T],
-    entry_index: int,
-) -> AdjacentEdges[T]:
-    top: EdgeDistance[T] | None = None
-    right: EdgeDistance[T] | None = None
-    bottom: EdgeDistance[T] | None = None
-    left: EdgeDistance[T] | None = None
-
-    if entry_index > 0:
-        left = row[entry_index - 1]
-    if entry_index < len(row) - 1:
-        right = row[entry_index + 1]
-    if row_index > 0 and distances_matrix[row_index - 1]:
-        bottom = take_closest(distances_matrix[row_index - 1], entry)
-    if row_index < len(distances_matrix) - 1:
-        top = take_closest(distances_matrix[row_index + 1], entry)
-    return AdjacentEdges(bottom, left, right, top)
-
-
-def take_closest(
-    entries: Sequence[EdgeDistance], value: EdgeDistance
-) -> EdgeDistance | None:
-    if not entries:
+def take_closest(xs: Sequence[int], x: int) -> int | None:
+    """Returns the index of the position closest to x, preferring the left one."""
+    if not xs:
         return None
-    distances: list[int] = [entry.distance for entry in entries]
-    pos = bisect_left(distances, value.distance)
+    pos = bisect_left(xs, x)
     if pos == 0:
-        return entries[0]
-    if pos == len(distances):
-        return entries[-1]
-    before = distances[pos - 1]
-    after = distances[pos]
-    if after - value.distance < value.distance - before:
-        return entries[pos]
+        return 0
+    if pos == len(xs):
+        return len(xs) - 1
+    if xs[pos] - x < x - xs[pos - 1]:
+        return pos
     else:
-        return entries[pos - 1]
-
-
-def tile_node(
-    edge: EdgeDistance[Tile],
-    adjacent_edges: AdjacentEdges[Tile],
-) -> tuple[Tile, ScrollNode[Tile]]:
-    return edge.value, ScrollNode(
-        edge.value,
-        top=None if not adjacent_edges.top else adjacent_edges.top.value,
-        right=None if not adjacent_edges.right else adjacent_edges.right.value,
-        bottom=None if not adjacent_edges.bottom else adjacent_edges.bottom.value,
-        left=None if not adjacent_edges.left else adjacent_edges.left.value,
-    )
-
-
-def tileset_node(
-    edge: EdgeDistance[Tileset],
-    adjacent_edges: AdjacentEdges[Tileset],
-) -> tuple[Tileset, ScrollNode[Tileset]]:
-    return edge.value, ScrollNode(
-        edge.value,
-        top=None if not adjacent_edges.top else adjacent_edges.top.value,
-        right=None if not adjacent_edges.right else adjacent_edges.right.value,
-        bottom=None if not adjacent_edges.bottom else adjacent_edges.bottom.value,
-        left=None if not adjacent_edges.left else adjacent_edges.left.value,
-    )
+        return pos - 1
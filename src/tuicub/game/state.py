@@ -23,6 +23,8 @@ class GameScreenState:
         board (Board): The current board.
         rack (Tileset): The rack of the current user.
         virtual_tileset (Tileset): The
+        jump_query (str | None): The tile spec typed in the jump mode,
+            or None if not jumping.
     """
 
     pile_count: int = field(default=0)
@@ -40,6 +42,7 @@ class GameScreenState:
     board: Board = field(default=Board())
     rack: Tileset = field(default=Tileset())
     virtual_tileset: Tileset = field(default=Tileset())
+    jump_query: str | None = field(default=None)
 
     @classmethod
     def from_game(cls, user_id: str, game: Game) -> GameScreenState:
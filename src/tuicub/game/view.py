@@ -12,15 +12,29 @@ from ..common.screens import KeybindableElement, RootScreenView, ScreenName, Tui
 from ..common.views import FocusWindow, Theme
 from ..common.views.base_container import BasicContainer
 from .viewmodel import GameViewModel
+from .widgets.cache import TilesetWidgetCache
 from .widgets.frame import Frame
 from .widgets.game import GameWidget
 from .widgets.renderer import Renderer
+from .widgets.viewport import BoardViewport
 
 
 class GameWidgetFactory:
-    """A factory creating instances of the game widget."""
-
-    __slots__ = ("_viewmodel", "_theme")
+    """A factory creating instances of the game widget.
+
+    The created widget is retained and returned again until the viewmodel
+    publishes a new generation. Tileset widgets of unchanged tilesets and
+    the board's scroll position are kept between generations.
+    """
+
+    __slots__ = (
+        "_viewmodel",
+        "_theme",
+        "_widget",
+        "_generation",
+        "_tileset_widgets",
+        "_board_viewport",
+    )
 
     def __init__(self, viewmodel: GameViewModel, theme: Theme | None = None):
         """Initialize new factory.
@@ -31,18 +45,34 @@ class GameWidgetFactory:
         """
         self._viewmodel: GameViewModel = viewmodel
         self._theme: Theme = theme or Theme.default()
+        self._widget: GameWidget | None = None
+        self._generation: int | None = None
+        self._tileset_widgets: TilesetWidgetCache = TilesetWidgetCache(theme=self._theme)
+        self._board_viewport: BoardViewport = BoardViewport()
 
     def create(self) -> GameWidget:
-        """Creates a new instance of the game widget."""
-        return GameWidget(
-            board=self._viewmodel.board,
-            rack=self._viewmodel.rack,
-            pile=self._viewmodel.pile,
-            players=self._viewmodel.players,
-            status_bar=self._viewmodel.status_bar,
-            winner=self._viewmodel.winner,
-            theme=self._theme,
-        )
+        """Returns the game widget for the current generation of the viewmodel.
+
+        The widget is rebuilt only if the viewmodel's generation has changed since
+        the last call, otherwise the retained widget is returned.
+        """
+        generation = self._viewmodel.generation
+        if self._widget is None or generation != self._generation:
+            self._widget = GameWidget(
+                board=self._viewmodel.board,
+                rack=self._viewmodel.rack,
+                pile=self._viewmodel.pile,
+                players=self._viewmodel.players,
+                status_bar=self._viewmodel.status_bar,
+                winner=self._viewmodel.winner,
+                theme=self._theme,
+                tileset_widgets=self._tileset_widgets,
+                board_viewport=self._board_viewport,
+            )
+            self._tileset_widgets.sweep()
+            self._generation = generation
+
+        return self._widget
 
 
 class GameView(RootScreenView):
@@ -112,9 +142,8 @@ class GameRootView(BasicContainer):
         erase_bg: bool,
         z_index: int | None,
     ) -> None:
-        game_widget = self._factory.create()
-        game_widget.render(
-            renderer=self._renderer,
+        self._renderer.render_root(
+            widget=self._factory.create(),
             screen=screen,
             frame=Frame.from_write_position(write_position),
         )
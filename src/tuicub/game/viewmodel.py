@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from eventoolkit import EventsObserver
 from prompt_toolkit import application
 from pydepot import Store
 
-from .models import SelectionMode, Tile, Tileset, VirtualTileset
+from ..common.latency import LatencyTracer
+from ..common.services.screen_size_service import ScreenSizeService
+from .models import SelectionMode, Tile, Tileset, VirtualTileset, mask_of
 from .services.board_service import BoardService
 from .services.scroll_service import ScrollService
 from .state import GameScreenState
@@ -31,9 +35,17 @@ class GameViewModel:
         "_events_observer",
         "_store",
         "_scroll_service",
+        "_screen_size_service",
+        "_generation",
+        "_tracer",
         "__weakref__",
     )
 
+    @property
+    def generation(self) -> int:
+        """The generation of the viewmodels, incremented on every state update."""
+        return self._generation
+
     @property
     def board(self) -> tuple[tuple[TilesetViewModel, ...], ...]:
         """Rows of the game board."""
@@ -69,12 +81,15 @@ class GameViewModel:
         board_service: BoardService,
         events_observer: EventsObserver,
         scroll_service: ScrollService,
+        screen_size_service: ScreenSizeService,
         store: Store[GameScreenState],
         user_id: str,
+        tracer: LatencyTracer | None = None,
     ):
         self._board_service: BoardService = board_service
         self._events_observer: EventsObserver = events_observer
         self._scroll_service: ScrollService = scroll_service
+        self._screen_size_service: ScreenSizeService = screen_size_service
         self._store: Store[GameScreenState] = store
 
         self._board: tuple[tuple[TilesetViewModel, ...], ...] = ()
@@ -86,6 +101,8 @@ class GameViewModel:
             selection_mode=SelectionMode.TILES, has_turn=False
         )
         self._user_id: str = user_id
+        self._generation: int = 0
+        self._tracer: LatencyTracer | None = tracer
 
     def on_state(self, state: GameScreenState) -> None:
         """The hook of the store subscriber.
@@ -100,14 +117,11 @@ class GameViewModel:
         )
         self._board = self._create_board_and_update_scroll_maps(state=state)
         self._rack = TilesetViewModel(
-            tiles=tuple(
-                TileViewModel(
-                    tile=tile,
-                    is_selected=tile in state.selected_tiles,
-                    is_highlighted=tile == highlighted_tile,
-                    is_new=tile in state.new_tiles,
-                )
-                for tile in state.rack.tiles
+            tiles=_create_tiles(
+                state.rack.tiles,
+                selected=mask_of(state.selected_tiles),
+                new=mask_of(state.new_tiles),
+                highlighted=highlighted_tile,
             ),
             is_highlighted=False,
         )
@@ -119,16 +133,30 @@ class GameViewModel:
             has_turn=next(
                 (p.has_turn for p in state.players if p.user_id == self._user_id), False
             ),
+            jump_query=state.jump_query,
         )
+        self._generation += 1
+        if self._tracer is not None:
+            self._tracer.rebuilt()
 
         application.get_app().invalidate()
 
+    def on_resize(self, _: int) -> None:
+        """The hook of the screen size subscriber.
+
+        Recreates viewmodels from the current state, so the board is packed
+        and scrolled for the new width of the screen.
+        """
+        self.on_state(self._store.state)
+
     def subscribe(self) -> None:
         self._store.subscribe(self, include_current=True)
+        self._screen_size_service.subscribe(self)
         self._events_observer.observe()
 
     def unsubscribe(self) -> None:
         self._store.unsubscribe(self)
+        self._screen_size_service.unsubscribe(self)
         self._events_observer.stop()
 
     def _create_board_and_update_scroll_maps(
@@ -144,20 +172,17 @@ class GameViewModel:
             if state.selection_mode == SelectionMode.TILESETS
             else None
         )
-        selected_tiles: frozenset[Tile] = state.selected_tiles
-        new_tiles: frozenset[Tile] = state.new_tiles
-        rows = self._board_service.create_rows(board=state.board.tilesets)
+        selected = mask_of(state.selected_tiles)
+        new = mask_of(state.new_tiles)
+        rows = self._board_service.create_rows(board=state.board)
         board = tuple(
             tuple(
                 TilesetViewModel(
-                    tiles=tuple(
-                        TileViewModel(
-                            tile=tile,
-                            is_selected=tile in selected_tiles,
-                            is_highlighted=tile == highlighted_tile,
-                            is_new=tile in new_tiles,
-                        )
-                        for tile in tileset.tiles
+                    tiles=_create_tiles(
+                        tileset.tiles,
+                        selected=selected,
+                        new=new,
+                        highlighted=highlighted_tile,
                     ),
                     is_highlighted=tileset == highlighted_tileset,
                 )
@@ -171,14 +196,12 @@ class GameViewModel:
                 *board,
                 (
                     TilesetViewModel(
-                        tiles=tuple(
-                            VirtualTileViewModel(
-                                tile=tile,
-                                is_selected=tile in selected_tiles,
-                                is_highlighted=tile == highlighted_tile,
-                                is_new=tile in new_tiles,
-                            )
-                            for tile in state.virtual_tileset.tiles
+                        tiles=_create_tiles(
+                            state.virtual_tileset.tiles,
+                            selected=selected,
+                            new=new,
+                            highlighted=highlighted_tile,
+                            viewmodel=VirtualTileViewModel,
                         ),
                         is_highlighted=state.virtual_tileset == highlighted_tileset
                         and isinstance(highlighted_tileset, VirtualTileset),
@@ -191,3 +214,23 @@ class GameViewModel:
         )
 
         return board
+
+
+def _create_tiles(
+    tiles: Iterable[Tile],
+    selected: int,
+    new: int,
+    highlighted: Tile | None,
+    viewmodel: type[TileViewModel] = TileViewModel,
+) -> tuple[TileViewModel, ...]:
+    """Create viewmodels of tiles, looking their flags up in masks of tile ids."""
+    highlighted_id = highlighted.id if highlighted else None
+    return tuple(
+        viewmodel.interned(
+            tile=tile,
+            is_selected=bool(selected >> tile.id & 1),
+            is_highlighted=tile.id == highlighted_id,
+            is_new=bool(new >> tile.id & 1),
+        )
+        for tile in tiles
+    )
@@ -1,7 +1,8 @@
-from attrs import frozen
+from attrs import field, frozen
 from prompt_toolkit.formatted_text import StyleAndTextTuples
 
 from ...common.strings import (
+    GAME_STATUS_JUMP_MODE,
     GAME_STATUS_MOVE_MODE,
     GAME_STATUS_SELECT_MODE,
     GAME_STATUS_TURN_DONE,
@@ -17,10 +18,13 @@ class StatusBarViewModel:
     Attributes:
         selection_mode (SelectionMode): The current selection mode.
         has_turn (bool): True if the user currently has turn, false otherwise.
+        jump_query (str | None): The tile spec typed in the jump mode,
+            or None if not jumping.
     """
 
     selection_mode: SelectionMode
     has_turn: bool
+    jump_query: str | None = field(default=None)
 
     def bar_bg_color(self) -> Color:
         """Returns a background color according to the selection mode and turn status."""
@@ -49,5 +53,7 @@ class StatusBarViewModel:
                     text = GAME_STATUS_MOVE_MODE
                     text_bg_color = Color.PURPLE
                     text_fg_color = Color.FG_BLACK
+            if self.jump_query is not None:
+                text = GAME_STATUS_JUMP_MODE.format(self.jump_query)
 
         return [(theme.style(fg=text_fg_color, bg=text_bg_color, bold=True), f" {text} ")]
@@ -1,8 +1,46 @@
+from __future__ import annotations
+
 from attrs import frozen
 from prompt_toolkit.formatted_text import StyleAndTextTuples
 
+from ...common.cache import InternTable
 from ...common.views import Color, Theme
-from ..models import Tile
+from ..models import (
+    TILE_IS_JOKER,
+    TILE_NUMBERS,
+    TILE_UI_COLORS,
+    TILE_UI_SELECTED_COLORS,
+    Tile,
+)
+
+MAX_INTERNED_TILES = 2048
+
+
+@frozen
+class TileGlyphSet:
+    """Characters used for drawing the outline of tiles.
+
+    Attributes:
+        top (str): The top row of the tile.
+        side (str): The left and right edge of the tile.
+        bottom (str): The bottom row of the tile.
+        is_shaded (bool): Whether the characters are half blocks shading the tile,
+            in which case the left edge is drawn with inverted colors.
+    """
+
+    top: str
+    side: str
+    bottom: str
+    is_shaded: bool
+
+
+BLOCK_TILE_GLYPHS = TileGlyphSet(top="▗▄▄▖", side="▌", bottom="▝▀▀▘", is_shaded=True)
+ASCII_TILE_GLYPHS = TileGlyphSet(top=".--.", side="|", bottom="'--'", is_shaded=False)
+
+_TILE_LABELS: tuple[str, ...] = tuple(
+    "J " if is_joker else str(number).ljust(2)
+    for number, is_joker in zip(TILE_NUMBERS, TILE_IS_JOKER, strict=True)
+)
 
 
 @frozen
@@ -21,36 +59,69 @@ class TileViewModel:
     is_highlighted: bool
     is_new: bool
 
-    def content(self, parent_background: Color, theme: Theme) -> StyleAndTextTuples:
+    @classmethod
+    def interned(
+        cls, tile: Tile, is_selected: bool, is_highlighted: bool, is_new: bool
+    ) -> TileViewModel:
+        """Returns the shared viewmodel of the tile with the given flags.
+
+        Viewmodels are interned per class, so equal viewmodels created this way
+        are the same instance for as long as it is in use.
+        """
+        key = (cls, tile.id, is_selected, is_highlighted, is_new)
+        viewmodel = _TILE_VIEWMODELS.get(key)
+        if viewmodel is None:
+            viewmodel = _TILE_VIEWMODELS.add(
+                key,
+                cls(
+                    tile=tile,
+                    is_selected=is_selected,
+                    is_highlighted=is_highlighted,
+                    is_new=is_new,
+                ),
+            )
+        return viewmodel
+
+    def content(
+        self,
+        parent_background: Color,
+        theme: Theme,
+        glyph_set: TileGlyphSet = BLOCK_TILE_GLYPHS,
+    ) -> StyleAndTextTuples:
         """Returns the `prompt_toolkit` text content of the widget."""
+        tile_id = self.tile.id
+        selected_color = TILE_UI_SELECTED_COLORS[tile_id]
         bottom_background_color = (
-            self.tile.color.ui_selected_color
-            if (self.is_selected or self.is_new)
-            else Color.TILE_BG
-        )
-        tile_bg = (
-            Color.TILE_BG if not self.is_selected else self.tile.color.ui_selected_color
+            selected_color if (self.is_selected or self.is_new) else Color.TILE_BG
         )
+        tile_bg = Color.TILE_BG if not self.is_selected else selected_color
         border_color = (
             parent_background if not self.is_highlighted else Color.TILE_SELECTED_BORDER
         )
         number_background = (
-            Color.TILE_BG_LIGHT
-            if not self.is_selected
-            else self.tile.color.ui_selected_color
+            Color.TILE_BG_LIGHT if not self.is_selected else selected_color
         )
         number_foreground = (
-            self.tile.color.ui_color if not self.is_selected else Color.TILE_FG_SELECTED
+            TILE_UI_COLORS[tile_id] if not self.is_selected else Color.TILE_FG_SELECTED
         )
 
-        number = str(self.tile.number).ljust(2) if not self.tile.is_joker() else "J "
+        number = _TILE_LABELS[tile_id]
+
+        left_style = (
+            theme.style(fg=border_color, bg=tile_bg)
+            if glyph_set.is_shaded
+            else theme.style(fg=tile_bg, bg=border_color)
+        )
 
         return [
-            (theme.style(fg=tile_bg, bg=border_color), "▗▄▄▖\n"),
-            (theme.style(fg=border_color, bg=tile_bg), "▌"),
+            (theme.style(fg=tile_bg, bg=border_color), f"{glyph_set.top}\n"),
+            (left_style, glyph_set.side),
             (theme.style(fg=number_foreground, bg=number_background, bold=True), number),
-            (theme.style(fg=tile_bg, bg=border_color), "▌\n"),
-            (theme.style(fg=bottom_background_color, bg=border_color), "▝▀▀▘"),
+            (theme.style(fg=tile_bg, bg=border_color), f"{glyph_set.side}\n"),
+            (
+                theme.style(fg=bottom_background_color, bg=border_color),
+                glyph_set.bottom,
+            ),
         ]
 
 
@@ -58,12 +129,28 @@ class TileViewModel:
 class VirtualTileViewModel(TileViewModel):
     """A viewmodel for a virtual tile widget."""
 
-    def content(self, parent_background: Color, theme: Theme) -> StyleAndTextTuples:
+    def content(
+        self,
+        parent_background: Color,
+        theme: Theme,
+        glyph_set: TileGlyphSet = BLOCK_TILE_GLYPHS,
+    ) -> StyleAndTextTuples:
         """Returns the `prompt_toolkit` text content of the widget."""
+        left_style = (
+            theme.style(fg=parent_background, bg=Color.BG7)
+            if glyph_set.is_shaded
+            else theme.style(fg=Color.BG7, bg=parent_background)
+        )
+
         return [
-            (theme.style(fg=Color.BG7, bg=parent_background), "▗▄▄▖\n"),
-            (theme.style(fg=parent_background, bg=Color.BG7), "▌"),
+            (theme.style(fg=Color.BG7, bg=parent_background), f"{glyph_set.top}\n"),
+            (left_style, glyph_set.side),
             (theme.style(fg=Color.BG8, bg=Color.BG8), "  "),
-            (theme.style(fg=Color.BG7, bg=parent_background), "▌\n"),
-            (theme.style(fg=Color.BG7, bg=parent_background), "▝▀▀▘"),
+            (theme.style(fg=Color.BG7, bg=parent_background), f"{glyph_set.side}\n"),
+            (theme.style(fg=Color.BG7, bg=parent_background), glyph_set.bottom),
         ]
+
+
+_TILE_VIEWMODELS: InternTable[
+    tuple[type[TileViewModel], int, bool, bool, bool], TileViewModel
+] = InternTable(max_size=MAX_INTERNED_TILES)
@@ -23,6 +23,21 @@ class BaseWidget(ABC):
         """The height of the widget in characters."""
         return 0
 
+    def is_frame_damaged(self, previous: BaseWidget) -> bool:
+        """Returns true if the widget draws its frame differently than the previous one.
+
+        Called by the renderer for a widget that is not equal to the previous widget
+        of the same type rendered at the same frame. If true, the whole frame
+        is repainted. Otherwise, only the changed child widgets are repainted.
+
+        Widgets that only lay out child widgets and draw nothing else that can change
+        should return false. Defaults to true.
+
+        Args:
+            previous (BaseWidget): The previous widget rendered at the same frame.
+        """
+        return True
+
     @abstractmethod
     def render(self, renderer: Renderer, screen: Screen, frame: Frame) -> None:
         """Render this widget using the renderer.
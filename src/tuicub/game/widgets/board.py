@@ -1,27 +1,104 @@
 from prompt_toolkit.layout.screen import Screen
 
 from ...common.views import Theme
+from ..consts import TILESET_HEIGHT
 from ..viewmodels.tileset import TilesetViewModel
 from .base import BaseWidget, Frame
-from .renderer import Renderer, VerticalPosition
+from .cache import TilesetWidgetCache
+from .overflow import HEIGHT as OVERFLOW_HEIGHT
+from .overflow import OverflowDirection, OverflowWidget
+from .renderer import Position, Renderer, Side, VerticalPosition
 from .row import RowWidget
+from .viewport import BoardViewport
 
 
 class BoardWidget(BaseWidget):
-    """The board widget displaying all played tilesets."""
+    """The board widget displaying all played tilesets.
 
-    __slots__ = ("_rows",)
+    If the rows do not fit in the frame, only the rows visible through the board's
+    viewport are rendered, together with indicators of the rows hidden above
+    and below. The viewport follows the row containing the highlight.
+    """
+
+    __slots__ = ("_rows", "_theme", "_viewport")
 
     def __init__(
-        self, board: tuple[tuple[TilesetViewModel, ...], ...], theme: Theme
+        self,
+        board: tuple[tuple[TilesetViewModel, ...], ...],
+        theme: Theme,
+        tileset_widgets: TilesetWidgetCache | None = None,
+        viewport: BoardViewport | None = None,
     ) -> None:
         self._rows: tuple[RowWidget, ...] = tuple(
-            RowWidget(tilesets=tilesets, theme=theme) for tilesets in board
+            RowWidget(tilesets=tilesets, theme=theme, tileset_widgets=tileset_widgets)
+            for tilesets in board
         )
+        self._theme: Theme = theme
+        self._viewport: BoardViewport = viewport or BoardViewport()
+
+    def is_frame_damaged(self, previous: BaseWidget) -> bool:
+        return False
 
     def render(self, renderer: Renderer, screen: Screen, frame: Frame) -> None:
+        if len(self._rows) * TILESET_HEIGHT <= frame.height:
+            renderer.render_vertically(
+                self._rows, VerticalPosition.CENTER, frame, screen, width=frame.width
+            )
+            return
+
+        rows_frame = Frame(
+            frame.x,
+            frame.y + OVERFLOW_HEIGHT,
+            frame.width,
+            frame.height - 2 * OVERFLOW_HEIGHT,
+        )
+        visible_rows = max(1, rows_frame.height // TILESET_HEIGHT)
+        offset = self._viewport.scroll(
+            target=next(
+                (index for index, row in enumerate(self._rows) if row.is_highlighted),
+                None,
+            ),
+            visible_rows=visible_rows,
+            total_rows=len(self._rows),
+        )
+        hidden_below = len(self._rows) - (offset + visible_rows)
+
         renderer.render_vertically(
-            self._rows, VerticalPosition.CENTER, frame, screen, width=frame.width
+            self._rows[offset : offset + visible_rows],
+            VerticalPosition.CENTER,
+            rows_frame,
+            screen,
+            width=frame.width,
+        )
+        if offset > 0:
+            self._render_overflow(
+                renderer, screen, frame, offset, OverflowDirection.UP, Position.TOP
+            )
+        if hidden_below > 0:
+            self._render_overflow(
+                renderer,
+                screen,
+                frame,
+                hidden_below,
+                OverflowDirection.DOWN,
+                Position.BOTTOM,
+            )
+
+    def _render_overflow(
+        self,
+        renderer: Renderer,
+        screen: Screen,
+        frame: Frame,
+        count: int,
+        direction: OverflowDirection,
+        position: Position,
+    ) -> None:
+        renderer.render_widget(
+            widget=OverflowWidget(count=count, direction=direction, theme=self._theme),
+            position=position,
+            side=Side.CENTER,
+            screen=screen,
+            frame=frame,
         )
 
     def __eq__(self, other: object) -> bool:
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from ...common.views import Color, Theme
+from ..viewmodels.tileset import TilesetViewModel
+from .tileset import TilesetWidget
+
+
+class TilesetWidgetCache:
+    """A cache of tileset widgets retained between widget tree updates.
+
+    Widgets are keyed by their viewmodel and the background of their parent,
+    so an unchanged tileset keeps the same widget instance across updates.
+    Widgets that were not requested since the previous sweep are evicted
+    on the next one.
+    """
+
+    __slots__ = ("_theme", "_widgets", "_retained")
+
+    def __init__(self, theme: Theme):
+        """Initialize new cache.
+
+        Args:
+            theme (Theme): The theme used for creating new widgets.
+        """
+        self._theme: Theme = theme
+        self._widgets: dict[tuple[TilesetViewModel, Color], TilesetWidget] = {}
+        self._retained: dict[tuple[TilesetViewModel, Color], TilesetWidget] = {}
+
+    def get(self, viewmodel: TilesetViewModel, parent_background: Color) -> TilesetWidget:
+        """Returns a tileset widget for the viewmodel.
+
+        Reuses the widget created for an equal viewmodel and parent background,
+        or creates a new one if there is none.
+
+        Args:
+            viewmodel (TilesetViewModel): The viewmodel of the tileset.
+            parent_background (Color): The background color of the parent widget.
+
+        Returns:
+            The tileset widget.
+        """
+        key = (viewmodel, parent_background)
+        widget = self._retained.get(key, None) or self._widgets.get(key, None)
+        if widget is None:
+            widget = TilesetWidget(
+                viewmodel=viewmodel,
+                parent_background=parent_background,
+                theme=self._theme,
+            )
+        self._retained[key] = widget
+        return widget
+
+    def sweep(self) -> None:
+        """Evict all widgets that were not requested since the previous sweep."""
+        self._widgets = self._retained
+        self._retained = {}
+
+    def __len__(self) -> int:
+        return len(self._widgets)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from prompt_toolkit.layout.screen import Screen
+
+from .frame import Frame
+
+
+class Damage:
+    """Damaged regions of the screen that need to be repainted.
+
+    Regions are stored as sorted, non-overlapping horizontal spans for every
+    damaged row, so each damaged cell is repainted exactly once.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self) -> None:
+        self._rows: dict[int, list[tuple[int, int]]] = {}
+
+    def add(self, frame: Frame) -> None:
+        """Mark the whole frame as damaged.
+
+        Args:
+            frame (Frame): The damaged frame.
+        """
+        if frame.width <= 0 or frame.height <= 0:
+            return
+
+        start = frame.x
+        end = frame.x + frame.width
+        for y in range(frame.y, frame.y + frame.height):
+            self._rows[y] = _merge(self._rows.get(y, []), start, end)
+
+    def intersects(self, frame: Frame) -> bool:
+        """Returns true if any cell of the frame is damaged."""
+        start = frame.x
+        end = frame.x + frame.width
+        for y in range(frame.y, frame.y + frame.height):
+            for span_start, span_end in self._rows.get(y, ()):
+                if span_start < end and span_end > start:
+                    return True
+        return False
+
+    def spans(self, y: int, start: int, end: int) -> list[tuple[int, int]]:
+        """Returns damaged spans of the row clipped to the given range.
+
+        Args:
+            y (int): The row.
+            start (int): The first column of the range.
+            end (int): The column after the last column of the range.
+
+        Returns:
+            The list of `(start, end)` tuples of damaged columns.
+        """
+        return [
+            (max(span_start, start), min(span_end, end))
+            for span_start, span_end in self._rows.get(y, ())
+            if span_start < end and span_end > start
+        ]
+
+    def erase(self, screen: Screen) -> None:
+        """Remove all damaged cells from the screen."""
+        for y, spans in self._rows.items():
+            row = screen.data_buffer[y]
+            for start, end in spans:
+                for x in range(start, end):
+                    row.pop(x, None)
+
+    def __bool__(self) -> bool:
+        return bool(self._rows)
+
+    def __len__(self) -> int:
+        """Returns the number of damaged cells."""
+        return sum(end - start for spans in self._rows.values() for start, end in spans)
+
+
+def _merge(spans: list[tuple[int, int]], start: int, end: int) -> list[tuple[int, int]]:
+    merged: list[tuple[int, int]] = []
+    for span_start, span_end in sorted((*spans, (start, end))):
+        if merged and span_start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], span_end))
+        else:
+            merged.append((span_start, span_end))
+    return merged
@@ -8,10 +8,12 @@ from ..viewmodels.tileset import TilesetViewModel
 from ..viewmodels.winner import WinnerViewModel
 from .base import BaseWidget, Frame
 from .board import BoardWidget
+from .cache import TilesetWidgetCache
 from .rack import RackWidget
 from .renderer import Position, Renderer, Side
 from .status_bar import StatusBarWidget
 from .top_bar import TopBarWidget
+from .viewport import BoardViewport
 from .winner import WinnerWidget
 
 
@@ -29,16 +31,28 @@ class GameWidget(BaseWidget):
         status_bar: StatusBarViewModel,
         winner: WinnerViewModel | None,
         theme: Theme | None = None,
+        tileset_widgets: TilesetWidgetCache | None = None,
+        board_viewport: BoardViewport | None = None,
     ) -> None:
         self._theme: Theme = theme or Theme.default()
-        self._rack = RackWidget(viewmodel=rack, theme=self._theme)
-        self._board = BoardWidget(board=board, theme=self._theme)
+        self._rack = RackWidget(
+            viewmodel=rack, theme=self._theme, tileset_widgets=tileset_widgets
+        )
+        self._board = BoardWidget(
+            board=board,
+            theme=self._theme,
+            tileset_widgets=tileset_widgets,
+            viewport=board_viewport,
+        )
         self._status_bar = StatusBarWidget(viewmodel=status_bar, theme=self._theme)
         self._top_bar = TopBarWidget(pile=pile, players=players, theme=self._theme)
         self._winner: WinnerWidget | None = (
             None if not winner else WinnerWidget(viewmodel=winner, theme=self._theme)
         )
 
+    def is_frame_damaged(self, previous: BaseWidget) -> bool:
+        return False
+
     def render(self, renderer: Renderer, screen: Screen, frame: Frame) -> None:
         if winner := self._winner:
             renderer.render_widget(
@@ -74,7 +88,8 @@ class GameWidget(BaseWidget):
                 screen=screen,
                 frame=frame,
                 width=frame.width,
-                height=frame.height - (self._top_bar.height + self._rack.height),
+                height=frame.height
+                - (self._top_bar.height + self._rack.height + self._status_bar.height),
                 y_offset=self._top_bar.height,
             )
 
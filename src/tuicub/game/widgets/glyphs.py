@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from weakref import WeakKeyDictionary, ref
+
+from prompt_toolkit.formatted_text import split_lines
+from prompt_toolkit.layout.screen import _CHAR_CACHE, Char
+
+from ...common.views import Color, Theme
+from ..viewmodels.tile import (
+    ASCII_TILE_GLYPHS,
+    BLOCK_TILE_GLYPHS,
+    TileViewModel,
+    VirtualTileViewModel,
+)
+
+Glyphs = tuple[tuple[Char, ...], ...]
+
+_GlyphsKey = tuple[bool, int, bool, bool, bool, Color]
+
+
+class TileGlyphAtlas:
+    """An atlas of precompiled tile glyphs of a theme.
+
+    Glyphs are rows of `prompt_toolkit` characters ready to be written on the screen.
+    They are compiled once for every combination of a tile, its flags and
+    the background of its parent, and reused for all later renders.
+    Themes with a reduced render profile get tiles drawn with ASCII characters.
+    """
+
+    __slots__ = ("_theme", "_glyphs")
+
+    def __init__(self, theme: Theme):
+        """Initialize new atlas.
+
+        Args:
+            theme (Theme): The theme used for compiling glyphs.
+        """
+        self._theme: ref[Theme] = ref(theme)
+        self._glyphs: dict[_GlyphsKey, Glyphs] = {}
+
+    @classmethod
+    def for_theme(cls, theme: Theme) -> TileGlyphAtlas:
+        """Returns the shared atlas of the theme.
+
+        The atlas lives only as long as the theme, so glyphs compiled for one theme
+        are never reused for another.
+        """
+        atlas = _ATLASES.get(theme, None)
+        if atlas is None:
+            atlas = _ATLASES[theme] = cls(theme=theme)
+        return atlas
+
+    def glyphs(self, viewmodel: TileViewModel, parent_background: Color) -> Glyphs:
+        """Returns glyphs of the tile.
+
+        Args:
+            viewmodel (TileViewModel): The viewmodel of the tile.
+            parent_background (Color): The background color of the parent widget.
+
+        Returns:
+            Rows of characters displaying the tile.
+        """
+        key = (
+            isinstance(viewmodel, VirtualTileViewModel),
+            viewmodel.tile.id,
+            viewmodel.is_selected,
+            viewmodel.is_highlighted,
+            viewmodel.is_new,
+            parent_background,
+        )
+        glyphs = self._glyphs.get(key, None)
+        if glyphs is None:
+            glyphs = self._glyphs[key] = self._compile(viewmodel, parent_background)
+        return glyphs
+
+    def __len__(self) -> int:
+        return len(self._glyphs)
+
+    def _compile(self, viewmodel: TileViewModel, parent_background: Color) -> Glyphs:
+        theme: Theme = self._theme()  # type: ignore[assignment]
+        content = viewmodel.content(
+            parent_background=parent_background,
+            theme=theme,
+            glyph_set=(
+                ASCII_TILE_GLYPHS if theme.profile.is_reduced else BLOCK_TILE_GLYPHS
+            ),
+        )
+        return tuple(
+            tuple(_CHAR_CACHE[char, style] for style, text, *_ in line for char in text)
+            for line in split_lines(content)
+        )
+
+
+_ATLASES: WeakKeyDictionary[Theme, TileGlyphAtlas] = WeakKeyDictionary()
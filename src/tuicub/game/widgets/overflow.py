@@ -0,0 +1,55 @@
+from enum import IntEnum
+
+from prompt_toolkit.layout.screen import Screen
+
+from ...common.views import Color, Theme
+from .base import BaseWidget
+from .frame import Frame
+from .renderer import Renderer
+
+HEIGHT = 1
+
+
+class OverflowDirection(IntEnum):
+    UP = 1
+    DOWN = 2
+
+
+class OverflowWidget(BaseWidget):
+    """A widget indicating the number of board rows hidden above or below."""
+
+    __slots__ = ("_count", "_direction", "_theme")
+
+    @property
+    def width(self) -> int:
+        return len(self._text())
+
+    @property
+    def height(self) -> int:
+        return HEIGHT
+
+    def __init__(self, count: int, direction: OverflowDirection, theme: Theme) -> None:
+        self._count: int = count
+        self._direction: OverflowDirection = direction
+        self._theme: Theme = theme
+
+    def render(self, renderer: Renderer, screen: Screen, frame: Frame) -> None:
+        renderer.blit_text(
+            self._text(),
+            self._theme.style(fg=Color.FG4, bg=Color.BG2),
+            0,
+            0,
+            frame,
+            screen,
+        )
+
+    def _text(self) -> str:
+        arrow = "▲" if self._direction == OverflowDirection.UP else "▼"
+        rows = "row" if self._count == 1 else "rows"
+        return f"{arrow} {self._count} more {rows} {arrow}"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, OverflowWidget):
+            return NotImplemented
+
+        return self._count == other._count and self._direction == other._direction
@@ -32,6 +32,9 @@ class PlayersListWidget(BaseWidget):
             PlayerWidget(viewmodel=player, theme=theme) for player in players
         )
 
+    def is_frame_damaged(self, previous: BaseWidget) -> bool:
+        return False
+
     def render(self, renderer: Renderer, screen: Screen, frame: Frame) -> None:
         renderer.render_horizontally(
             self._players, HorizontalPosition.LEFT, frame, screen, spacing=SPACING
@@ -4,6 +4,7 @@ from ...common.views import Color, Theme
 from ..consts import TILESET_HEIGHT
 from ..viewmodels.tileset import TilesetViewModel
 from .base import BaseWidget
+from .cache import TilesetWidgetCache
 from .frame import Frame
 from .renderer import Position, Renderer, SeparatorSide, Side
 from .tileset import TilesetWidget
@@ -18,11 +19,23 @@ class RackWidget(BaseWidget):
     def height(self) -> int:
         return TILESET_HEIGHT
 
-    def __init__(self, viewmodel: TilesetViewModel, theme: Theme) -> None:
-        self._tileset: TilesetWidget = TilesetWidget(
-            viewmodel=viewmodel, parent_background=Color.BG3, theme=theme
+    def __init__(
+        self,
+        viewmodel: TilesetViewModel,
+        theme: Theme,
+        tileset_widgets: TilesetWidgetCache | None = None,
+    ) -> None:
+        self._tileset: TilesetWidget = (
+            tileset_widgets.get(viewmodel=viewmodel, parent_background=Color.BG3)
+            if tileset_widgets is not None
+            else TilesetWidget(
+                viewmodel=viewmodel, parent_background=Color.BG3, theme=theme
+            )
         )
 
+    def is_frame_damaged(self, previous: BaseWidget) -> bool:
+        return False
+
     def render(self, renderer: Renderer, screen: Screen, frame: Frame) -> None:
         renderer.render_widget(
             self._tileset,
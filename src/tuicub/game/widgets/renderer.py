@@ -9,20 +9,42 @@ from prompt_toolkit.formatted_text import (
     fragment_list_width,
     split_lines,
 )
-from prompt_toolkit.layout.screen import _CHAR_CACHE, Screen
+from prompt_toolkit.layout.screen import _CHAR_CACHE, Char, Screen, WritePosition
 
 from ...common.strings import BOTTOM_BORDER, TOP_BORDER
 from ...common.views import Color, Theme
+from .damage import Damage
 from .frame import Frame
 
 if TYPE_CHECKING:
     from .base import BaseWidget
 
+MIN_BORDER_SIZE = 2
 
-class Renderer:
-    """Renders game widgets on the screen."""
 
-    __slots__ = ("_theme",)
+class Renderer:
+    """Renders game widgets on the screen.
+
+    Widgets rendered with `render_root` are painted into a back buffer that is
+    retained between renders. Only the regions of widgets that changed since
+    the previous render are repainted, and the back buffer is then copied
+    onto the screen.
+
+    Decorative background fills are skipped for themes with a reduced render
+    profile.
+    """
+
+    __slots__ = (
+        "_theme",
+        "_buffer",
+        "_root_frame",
+        "_records",
+        "_previous_records",
+        "_current_records",
+        "_damage",
+        "_is_laying_out",
+        "_fills_background",
+    )
 
     def __init__(self, theme: Theme):
         """Initialize new renderer.
@@ -31,6 +53,62 @@ class Renderer:
             theme (Theme): The theme to use.
         """
         self._theme: Theme = theme
+        self._buffer: Screen = Screen()
+        self._root_frame: Frame | None = None
+        self._records: dict[Frame, _RenderRecord] = {}
+        self._previous_records: dict[Frame, _RenderRecord] = {}
+        self._current_records: dict[Frame, _RenderRecord] = {}
+        self._damage: Damage | None = None
+        self._is_laying_out: bool = False
+        self._fills_background: bool = not theme.profile.is_reduced
+
+    def render_root(self, widget: BaseWidget, screen: Screen, frame: Frame) -> Damage:
+        """Render the root widget, repainting only the damaged regions.
+
+        Rendering happens in two passes. The layout pass compares the widget tree
+        with the one from the previous render and collects frames of the widgets
+        that have changed, appeared or disappeared. The draw pass then repaints
+        only those regions of the back buffer, and the back buffer is copied
+        onto the screen.
+
+        If the frame differs from the previous one, e.g. when the terminal has been
+        resized, the whole frame is repainted.
+
+        Args:
+            widget (BaseWidget): The root widget to render.
+            screen (Screen): The screen to write on.
+            frame (Frame): The available frame.
+
+        Returns:
+            The damaged regions that were repainted.
+        """
+        if frame != self._root_frame:
+            self._root_frame = frame
+            self._buffer = Screen()
+            self._records = {}
+
+        damage = Damage()
+        records: dict[Frame, _RenderRecord] = {}
+        self._damage = damage
+        try:
+            self._is_laying_out = True
+            self._previous_records, self._current_records = self._records, records
+            self._render_child(widget=widget, screen=self._buffer, frame=frame)
+
+            self._is_laying_out = False
+            if damage:
+                damage.erase(self._buffer)
+                self._render_child(widget=widget, screen=self._buffer, frame=frame)
+        finally:
+            self._damage = None
+            self._is_laying_out = False
+            self._previous_records, self._current_records = {}, {}
+
+        self._records = records
+        for y, row in self._buffer.data_buffer.items():
+            screen.data_buffer[y].update(row)
+
+        return damage
 
     def write_content(
         self, content: StyleAndTextTuples, frame: Frame, screen: Screen
@@ -47,6 +125,21 @@ class Renderer:
                 line=line, x_offset=0, y_offset=line_number, frame=frame, screen=screen
             )
 
+    def write_glyphs(
+        self, glyphs: Sequence[Sequence[Char]], frame: Frame, screen: Screen
+    ) -> None:
+        """Write rows of precompiled characters on the screen.
+
+        Args:
+            glyphs (Sequence[Sequence[Char]]): The rows of characters to write.
+            frame (Frame): The available frame.
+            screen (Screen): The screen to write on.
+        """
+        for line_number, line in enumerate(glyphs):
+            self.blit(
+                chars=line, x_offset=0, y_offset=line_number, frame=frame, screen=screen
+            )
+
     def write_centered_content(
         self, content: StyleAndTextTuples, frame: Frame, screen: Screen
     ) -> None:
@@ -81,13 +174,73 @@ class Renderer:
             frame (Frame): The available frame.
             screen (Screen): The screen to write on.
         """
-        x = x_offset
-        for style, text, *_ in line:
-            for char in text:
-                screen.data_buffer[frame.y + y_offset][x + frame.x] = _CHAR_CACHE[
-                    char, style
-                ]
-                x += 1
+        self.blit(
+            chars=[_CHAR_CACHE[char, style] for style, text, *_ in line for char in text],
+            x_offset=x_offset,
+            y_offset=y_offset,
+            frame=frame,
+            screen=screen,
+        )
+
+    def blit(
+        self,
+        chars: Sequence[Char],
+        x_offset: int,
+        y_offset: int,
+        frame: Frame,
+        screen: Screen,
+    ) -> None:
+        """Write a horizontal run of characters on the screen in one operation.
+
+        The run is clipped to the frame, so nothing is written outside of it.
+
+        Args:
+            chars (Sequence[Char]): The characters to write.
+            x_offset (int): The offset of the first character on the x axis.
+            y_offset (int): The offset of the run on the y axis.
+            frame (Frame): The available frame.
+            screen (Screen): The screen to write on.
+        """
+        if not 0 <= y_offset < frame.height:
+            return
+
+        x = frame.x + x_offset
+        start = max(x, frame.x)
+        end = min(x + len(chars), frame.x + frame.width)
+        if start >= end:
+            return
+
+        if start != x or end != x + len(chars):
+            chars = chars[start - x : end - x]
+
+        self._write_chars(chars=chars, x=start, y=frame.y + y_offset, screen=screen)
+
+    def blit_text(
+        self,
+        text: str,
+        style: str,
+        x_offset: int,
+        y_offset: int,
+        frame: Frame,
+        screen: Screen,
+    ) -> None:
+        """Write a horizontal run of text with a single style on the screen.
+
+        Args:
+            text (str): The text to write.
+            style (str): The `prompt_toolkit` style of the text.
+            x_offset (int): The offset of the first character on the x axis.
+            y_offset (int): The offset of the text on the y axis.
+            frame (Frame): The available frame.
+            screen (Screen): The screen to write on.
+        """
+        self.blit(
+            chars=[_CHAR_CACHE[char, style] for char in text],
+            x_offset=x_offset,
+            y_offset=y_offset,
+            frame=frame,
+            screen=screen,
+        )
 
     def draw_border(self, frame: Frame, screen: Screen, color: Color = Color.BG8) -> None:
         """Draws a border around the frame.
@@ -97,28 +250,22 @@ class Renderer:
             screen (Screen): The screen to write on.
             color (Color): The color of the border.
         """
-        style = self._theme.to_framework_fg(color)
-
-        top = frame.y
-        bottom = frame.y + frame.height - 1
-        left = frame.x
-        right = frame.x + frame.width - 1
+        if (
+            self._is_laying_out
+            or frame.width < MIN_BORDER_SIZE
+            or frame.height < MIN_BORDER_SIZE
+        ):
+            return
 
-        # Draw corners
-        screen.data_buffer[top][left] = _CHAR_CACHE["┏", style]
-        screen.data_buffer[top][right] = _CHAR_CACHE["┓", style]
-        screen.data_buffer[bottom][left] = _CHAR_CACHE["┗", style]
-        screen.data_buffer[bottom][right] = _CHAR_CACHE["┛", style]
-
-        # Draw vertical (left and right) borders
-        for y in range(1, frame.height - 1):
-            screen.data_buffer[frame.y + y][left] = _CHAR_CACHE["┃", style]
-            screen.data_buffer[frame.y + y][right] = _CHAR_CACHE["┃", style]
+        style = self._theme.to_framework_fg(color)
+        horizontal = "━" * (frame.width - 2)
+        vertical = (_CHAR_CACHE["┃", style],)
 
-        # Draw horizontal (top and bottom) borders
-        for x in range(1, frame.width - 1):
-            screen.data_buffer[top][frame.x + x] = _CHAR_CACHE["━", style]
-            screen.data_buffer[bottom][frame.x + x] = _CHAR_CACHE["━", style]
+        self.blit_text(f"┏{horizontal}┓", style, 0, 0, frame, screen)
+        for y_offset in range(1, frame.height - 1):
+            self.blit(vertical, 0, y_offset, frame, screen)
+            self.blit(vertical, frame.width - 1, y_offset, frame, screen)
+        self.blit_text(f"┗{horizontal}┛", style, 0, frame.height - 1, frame, screen)
 
     def draw_separator(
         self, side: SeparatorSide, frame: Frame, screen: Screen, color: Color = Color.BG5
@@ -131,17 +278,21 @@ class Renderer:
             screen (Screen): The screen to write on.
             color (Color): The color of the separator.
         """
-        style = self._theme.to_framework_fg(color)
-
         if side == SeparatorSide.TOP:
-            y = frame.y
+            y_offset = 0
             char = TOP_BORDER
         else:
-            y = frame.y + frame.height - 1
+            y_offset = frame.height - 1
             char = BOTTOM_BORDER
 
-        for x in range(frame.width):
-            screen.data_buffer[y][frame.x + x] = _CHAR_CACHE[char, style]
+        self.blit_text(
+            text=char * frame.width,
+            style=self._theme.to_framework_fg(color),
+            x_offset=0,
+            y_offset=y_offset,
+            frame=frame,
+            screen=screen,
+        )
 
     def set_background_color(self, color: Color, screen: Screen, frame: Frame) -> None:
         """Sets the background color of the frame.
@@ -151,9 +302,17 @@ class Renderer:
             screen (Screen): The screen to write on.
             frame (Frame): The frame to set the background color for.
         """
-        screen.fill_area(
-            frame.to_write_position(), style=self._theme.to_framework_bg(color)
-        )
+        if self._is_laying_out or not self._fills_background:
+            return
+
+        style = self._theme.to_framework_bg(color)
+        if (damage := self._damage) is None:
+            screen.fill_area(frame.to_write_position(), style=style)
+            return
+
+        for y in range(frame.y, frame.y + frame.height):
+            for start, end in damage.spans(y, frame.x, frame.x + frame.width):
+                screen.fill_area(WritePosition(start, y, end - start, 1), style=style)
 
     def render_horizontally(
         self,
@@ -186,8 +345,8 @@ class Renderer:
                 y = frame.y + y_offset
 
         for widget in widgets:
-            widget.render(
-                renderer=self,
+            self._render_child(
+                widget=widget,
                 screen=screen,
                 frame=Frame(x, y, widget.width, widget.height),
             )
@@ -226,8 +385,8 @@ class Renderer:
                 y = frame.y + ((frame.height - widgets_height) // 2) + y_offset
 
         for widget in widgets:
-            widget.render(
-                renderer=self,
+            self._render_child(
+                widget=widget,
                 screen=screen,
                 frame=Frame(
                     x, y, width if width is not None else widget.width, widget.height
@@ -279,7 +438,98 @@ class Renderer:
             case Position.CENTER:
                 y = frame.y + ((frame.height - _height) // 2) + y_offset
 
-        widget.render(renderer=self, screen=screen, frame=Frame(x, y, _width, _height))
+        self._render_child(
+            widget=widget, screen=screen, frame=Frame(x, y, _width, _height)
+        )
+
+    def _render_child(self, widget: BaseWidget, screen: Screen, frame: Frame) -> None:
+        if self._damage is None:
+            widget.render(renderer=self, screen=screen, frame=frame)
+        elif self._is_laying_out:
+            self._lay_out(widget=widget, screen=screen, frame=frame)
+        else:
+            self._draw(widget=widget, screen=screen, frame=frame)
+
+    def _lay_out(self, widget: BaseWidget, screen: Screen, frame: Frame) -> None:
+        damage: Damage = self._damage  # type: ignore[assignment]
+        previous = self._previous_records.get(frame, None)
+        record = _RenderRecord(widget=widget)
+        self._current_records[frame] = record
+
+        if previous is not None and (
+            previous.widget is widget or previous.widget == widget
+        ):
+            record.children = previous.children
+            return
+
+        if (
+            previous is None
+            or type(previous.widget) is not type(widget)
+            or widget.is_frame_damaged(previous=previous.widget)
+        ):
+            damage.add(frame)
+            return
+
+        self._descend(
+            record=record, previous=previous, widget=widget, screen=screen, frame=frame
+        )
+        for vanished in previous.children.keys() - record.children.keys():
+            damage.add(vanished)
+
+    def _draw(self, widget: BaseWidget, screen: Screen, frame: Frame) -> None:
+        damage: Damage = self._damage  # type: ignore[assignment]
+        record = self._current_records.get(frame, None)
+        if record is None or record.widget is not widget:
+            record = _RenderRecord(
+                widget=widget, children=record.children if record else None
+            )
+            self._current_records[frame] = record
+
+        if damage.intersects(frame):
+            self._descend(record=record, widget=widget, screen=screen, frame=frame)
+
+    def _descend(
+        self,
+        record: _RenderRecord,
+        widget: BaseWidget,
+        screen: Screen,
+        frame: Frame,
+        previous: _RenderRecord | None = None,
+    ) -> None:
+        parent_previous, parent_current = self._previous_records, self._current_records
+        self._previous_records = previous.children if previous else {}
+        self._current_records = record.children
+        try:
+            widget.render(renderer=self, screen=screen, frame=frame)
+        finally:
+            self._previous_records = parent_previous
+            self._current_records = parent_current
+
+    def _write_chars(self, chars: Sequence[Char], x: int, y: int, screen: Screen) -> None:
+        if self._is_laying_out or not chars:
+            return
+
+        row = screen.data_buffer[y]
+        if (damage := self._damage) is None:
+            row.update(zip(range(x, x + len(chars)), chars))
+            return
+
+        for start, end in damage.spans(y, x, x + len(chars)):
+            row.update(zip(range(start, end), chars[start - x : end - x]))
+
+
+class _RenderRecord:
+    """A widget rendered at a frame during the previous render."""
+
+    __slots__ = ("widget", "children")
+
+    def __init__(
+        self, widget: BaseWidget, children: dict[Frame, _RenderRecord] | None = None
+    ):
+        self.widget: BaseWidget = widget
+        self.children: dict[Frame, _RenderRecord] = (
+            children if children is not None else {}
+        )
 
 
 class SeparatorSide(IntEnum):
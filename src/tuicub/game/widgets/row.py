@@ -4,6 +4,7 @@ from ...common.views import Color, Theme
 from ..consts import TILESET_HEIGHT
 from ..viewmodels.tileset import TilesetViewModel
 from .base import BaseWidget
+from .cache import TilesetWidgetCache
 from .frame import Frame
 from .renderer import HorizontalPosition, Renderer
 from .tileset import TilesetWidget
@@ -12,18 +13,39 @@ from .tileset import TilesetWidget
 class RowWidget(BaseWidget):
     """A widget displaying a list of tilesets for a single row."""
 
-    __slots__ = ("_tilesets",)
+    __slots__ = ("_tilesets", "_is_highlighted")
 
     @property
     def height(self) -> int:
         return TILESET_HEIGHT
 
-    def __init__(self, tilesets: tuple[TilesetViewModel, ...], theme: Theme) -> None:
+    @property
+    def is_highlighted(self) -> bool:
+        """Whether the row contains the highlighted tileset or tile."""
+        return self._is_highlighted
+
+    def __init__(
+        self,
+        tilesets: tuple[TilesetViewModel, ...],
+        theme: Theme,
+        tileset_widgets: TilesetWidgetCache | None = None,
+    ) -> None:
         self._tilesets: tuple[TilesetWidget, ...] = tuple(
-            TilesetWidget(viewmodel=tileset, parent_background=Color.BG2, theme=theme)
+            tileset_widgets.get(viewmodel=tileset, parent_background=Color.BG2)
+            if tileset_widgets is not None
+            else TilesetWidget(
+                viewmodel=tileset, parent_background=Color.BG2, theme=theme
+            )
+            for tileset in tilesets
+        )
+        self._is_highlighted: bool = any(
+            tileset.is_highlighted or any(tile.is_highlighted for tile in tileset.tiles)
             for tileset in tilesets
         )
 
+    def is_frame_damaged(self, previous: BaseWidget) -> bool:
+        return False
+
     def render(self, renderer: Renderer, screen: Screen, frame: Frame) -> None:
         renderer.render_horizontally(
             self._tilesets, HorizontalPosition.CENTER, frame, screen
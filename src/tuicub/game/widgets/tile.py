@@ -5,6 +5,7 @@ from ..consts import TILE_HEIGHT, TILE_WIDTH
 from ..viewmodels.tile import TileViewModel
 from .base import BaseWidget
 from .frame import Frame
+from .glyphs import TileGlyphAtlas
 from .renderer import Renderer
 
 
@@ -29,9 +30,9 @@ class TileWidget(BaseWidget):
         self._theme: Theme = theme
 
     def render(self, renderer: Renderer, screen: Screen, frame: Frame) -> None:
-        renderer.write_content(
-            self._viewmodel.content(
-                parent_background=self._parent_background, theme=self._theme
+        renderer.write_glyphs(
+            TileGlyphAtlas.for_theme(self._theme).glyphs(
+                viewmodel=self._viewmodel, parent_background=self._parent_background
             ),
             frame,
             screen,
@@ -41,4 +42,5 @@ class TileWidget(BaseWidget):
         if not isinstance(other, TileWidget):
             return NotImplemented
 
-        return self._viewmodel == other._viewmodel
+        # Interned viewmodels of equal tiles are usually the same instance.
+        return self._viewmodel is other._viewmodel or self._viewmodel == other._viewmodel
@@ -27,6 +27,11 @@ class TilesetWidget(BaseWidget):
     def height(self) -> int:
         return TILESET_HEIGHT
 
+    @property
+    def is_highlighted(self) -> bool:
+        """Whether the tileset is drawn with a highlighted border."""
+        return self._viewmodel.is_highlighted
+
     def __init__(
         self, viewmodel: TilesetViewModel, parent_background: Color, theme: Theme
     ) -> None:
@@ -36,6 +41,12 @@ class TilesetWidget(BaseWidget):
             for tile in viewmodel.tiles
         )
 
+    def is_frame_damaged(self, previous: BaseWidget) -> bool:
+        if not isinstance(previous, TilesetWidget):
+            return True
+
+        return self.is_highlighted != previous.is_highlighted
+
     def render(self, renderer: Renderer, screen: Screen, frame: Frame) -> None:
         if self._viewmodel.is_highlighted:
             renderer.draw_border(frame, screen)
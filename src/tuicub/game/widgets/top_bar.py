@@ -28,6 +28,9 @@ class TopBarWidget(BaseWidget):
         self._players = PlayersListWidget(players=players, theme=theme)
         self._pile = PileWidget(viewmodel=pile, theme=theme)
 
+    def is_frame_damaged(self, previous: BaseWidget) -> bool:
+        return False
+
     def render(self, renderer: Renderer, screen: Screen, frame: Frame) -> None:
         renderer.render_widget(
             widget=self._players,
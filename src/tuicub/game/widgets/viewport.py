@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+
+class BoardViewport:
+    """The vertical scroll position of the board.
+
+    The viewport is retained between widget tree updates, so the board keeps its
+    scroll position while the highlight moves.
+    """
+
+    __slots__ = ("_offset",)
+
+    @property
+    def offset(self) -> int:
+        """The index of the first visible row."""
+        return self._offset
+
+    def __init__(self) -> None:
+        self._offset: int = 0
+
+    def scroll(self, target: int | None, visible_rows: int, total_rows: int) -> int:
+        """Scroll the viewport so that the target row is visible.
+
+        The viewport moves only as much as needed to reveal the target row, and
+        never past the first or the last row.
+
+        Args:
+            target (int | None): The index of the row to keep in view, if any.
+            visible_rows (int): The number of rows that fit in the viewport.
+            total_rows (int): The number of all rows.
+
+        Returns:
+            The index of the first visible row.
+        """
+        offset = self._offset
+        if target is not None:
+            if target < offset:
+                offset = target
+            elif target >= offset + visible_rows:
+                offset = target - visible_rows + 1
+
+        self._offset = max(0, min(offset, total_rows - visible_rows))
+        return self._offset
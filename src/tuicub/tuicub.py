@@ -1,7 +1,6 @@
 import asyncio
 import tomllib
 
-from prompt_toolkit.output.defaults import create_output
 from pyllot import Router, ScreenPresenting
 
 from .app.module import AppModule
@@ -9,7 +8,10 @@ from .common.config import Config
 from .common.confirmation.module import ConfirmationModule
 from .common.events.module import EventsModule
 from .common.http.module import HttpModule
+from .common.latency import LatencyTracer
+from .common.logger import Logger
 from .common.module import CommonModule
+from .common.output import CountingOutput, create_output
 from .common.screens import ScreenName, ScreensFactory, TuicubScreen
 from .common.services.module import ServicesModule
 from .common.state import State
@@ -32,18 +34,30 @@ async def run(config: Config) -> int:
     stream_reader, stream_writer = await asyncio.open_connection(
         config.events_host, port=config.events_port
     )
-    output = create_output()
+    output = create_output(color_depth=config.render_profile.color_depth)
     loop = asyncio.get_running_loop()
-    theme = Theme.default()
+    theme = (
+        Theme(profile=config.render_profile)
+        if config.render_profile.is_reduced
+        else Theme.default()
+    )
     if config.theme_file:
         with config.theme_file.open("rb") as f:
             data = tomllib.load(f)
             if is_colors_map(data):
-                theme = Theme(colors_map=data)
+                theme = Theme(colors_map=data, profile=config.render_profile)
 
     common_module = CommonModule(config=config, theme=theme)
     state_module = StateModule(common_module=common_module)
-    events_module = EventsModule(stream_reader=stream_reader, stream_writer=stream_writer)
+    events_module = EventsModule(
+        stream_reader=stream_reader,
+        stream_writer=stream_writer,
+        loop=loop,
+        logger=common_module.logger,
+        strict_events=config.strict_events,
+        ingress_capacity=config.ingress_capacity,
+        latency_tracer=common_module.latency_tracer,
+    )
     confirmation_module = ConfirmationModule(state_module=state_module, loop=loop)
     services_module = ServicesModule(
         confirmation_module=confirmation_module,
@@ -105,6 +119,9 @@ async def run(config: Config) -> int:
     )
 
     state_module.store.subscribe(router)
+    _account_output(output, app_module=app_module, logger=common_module.logger)
+    if common_module.latency_tracer is not None:
+        _trace_paints(common_module.latency_tracer, app_module=app_module)
 
     def pre_run() -> None:
         nonlocal initial_screen
@@ -115,9 +132,35 @@ async def run(config: Config) -> int:
         group.create_task(events_module.socket_reader.start())
         group.create_task(app_module.app.run_async())
 
+    common_module.logger.log_redraw_stats(app_module.app.redraw_stats)
+    common_module.logger.log_ingress_stats(events_module.ingress.stats)
+    if common_module.latency_tracer is not None:
+        common_module.logger.log_latency_summary(common_module.latency_tracer.histograms)
+    common_module.logger.log_output_stats(
+        output.stats, screen_stats=output.screen_stats, profile=config.render_profile
+    )
     return 0
 
 
+def _account_output(
+    output: CountingOutput, app_module: AppModule, logger: Logger
+) -> None:
+    def on_after_render(_: object) -> None:
+        frame = output.end_frame(screen=app_module.view.screen().screen_name)
+        if frame:
+            logger.log_frame_output(frame)
+
+    app_module.app.after_render += on_after_render
+
+
+def _trace_paints(tracer: LatencyTracer, app_module: AppModule) -> None:
+    def on_after_render(_: object) -> None:
+        if app_module.view.screen().screen_name == ScreenName.GAME:
+            tracer.painted()
+
+    app_module.app.after_render += on_after_render
+
+
 def _create_router(
     initial_screen: TuicubScreen,
     presenter: ScreenPresenting[TuicubScreen],
@@ -0,0 +1,190 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from prompt_toolkit.application import Application
+from prompt_toolkit.input import DummyInput
+from prompt_toolkit.output import DummyOutput
+
+from src.tuicub.app.application import RedrawStats, TuicubApplication
+
+
+@pytest.fixture()
+def create_sut():
+    def factory(max_fps: int = 10, resize_debounce: float = 0.2) -> TuicubApplication:
+        app = TuicubApplication(
+            output=DummyOutput(),
+            input=DummyInput(),
+            max_fps=max_fps,
+            resize_debounce=resize_debounce,
+        )
+        app.loop = Mock()
+        return app
+
+    return factory
+
+
+@pytest.fixture()
+def super_invalidate():
+    with patch.object(Application, "invalidate") as mocked_invalidate:
+        yield mocked_invalidate
+
+
+@pytest.fixture()
+def super_redraw():
+    with patch.object(Application, "_redraw") as mocked_redraw:
+        yield mocked_redraw
+
+
+@pytest.fixture()
+def super_on_resize():
+    with patch.object(Application, "_on_resize") as mocked_on_resize:
+        yield mocked_on_resize
+
+
+class TestInit:
+    def test_sets_min_redraw_interval_to_frame_interval(self, create_sut) -> None:
+        sut = create_sut(max_fps=10)
+
+        result = sut.min_redraw_interval
+
+        assert result == pytest.approx(0.1)
+
+    def test_when_max_fps_zero__does_not_limit_redraws(self, create_sut) -> None:
+        sut = create_sut(max_fps=0)
+
+        result = sut.min_redraw_interval
+
+        assert result is None
+
+
+class TestInvalidate:
+    def test_when_not_handling_key_press__requests_redraw_of_application(
+        self, create_sut, super_invalidate
+    ) -> None:
+        sut = create_sut()
+
+        sut.invalidate()
+
+        super_invalidate.assert_called_once_with()
+        sut.loop.call_soon_threadsafe.assert_not_called()
+
+    def test_when_handling_key_press__redraws_once_after_keys_processed(
+        self, create_sut, super_invalidate, super_redraw
+    ) -> None:
+        sut = create_sut()
+
+        sut.key_processor.before_key_press.fire()
+        sut.invalidate()
+        sut.invalidate()
+        sut.key_processor.after_key_press.fire()
+        (callback,) = sut.loop.call_soon_threadsafe.call_args.args
+        callback()
+
+        super_invalidate.assert_not_called()
+        sut.loop.call_soon_threadsafe.assert_called_once()
+        super_redraw.assert_called_once_with()
+
+    def test_when_key_press_redraw_done__accepts_new_key_press_requests(
+        self, create_sut, super_invalidate, super_redraw
+    ) -> None:
+        sut = create_sut()
+        sut.key_processor.before_key_press.fire()
+        sut.invalidate()
+        (callback,) = sut.loop.call_soon_threadsafe.call_args.args
+        callback()
+
+        sut.invalidate()
+
+        assert sut.loop.call_soon_threadsafe.call_count == 2
+
+    def test_after_key_press__requests_redraw_of_application(
+        self, create_sut, super_invalidate
+    ) -> None:
+        sut = create_sut()
+        sut.key_processor.before_key_press.fire()
+        sut.key_processor.after_key_press.fire()
+
+        sut.invalidate()
+
+        super_invalidate.assert_called_once_with()
+
+
+class TestOnResize:
+    def test_when_resized__redraws_and_schedules_settling(
+        self, create_sut, super_on_resize
+    ) -> None:
+        sut = create_sut(resize_debounce=0.2)
+        handler = Mock()
+        sut.after_resize += handler
+
+        sut._on_resize()  # noqa: SLF001
+
+        super_on_resize.assert_called_once_with()
+        handler.assert_not_called()
+        delay, _ = sut.loop.call_later.call_args.args
+        assert delay == pytest.approx(0.2)
+
+    def test_when_resized_again__postpones_settling(
+        self, create_sut, super_on_resize
+    ) -> None:
+        sut = create_sut(resize_debounce=0.2)
+        sut._on_resize()  # noqa: SLF001
+        pending = sut.loop.call_later.return_value
+
+        sut._on_resize()  # noqa: SLF001
+
+        pending.cancel.assert_called_once_with()
+        assert sut.loop.call_later.call_count == 2
+
+    def test_when_settled__fires_after_resize_and_redraws(
+        self, create_sut, super_on_resize, super_invalidate
+    ) -> None:
+        sut = create_sut(max_fps=0, resize_debounce=0.2)
+        handler = Mock()
+        sut.after_resize += handler
+        sut._on_resize()  # noqa: SLF001
+        _, callback = sut.loop.call_later.call_args.args
+
+        callback()
+
+        handler.assert_called_once_with(sut)
+        super_invalidate.assert_called_once_with()
+
+    def test_when_debounce_zero__fires_after_resize_before_redraw(
+        self, create_sut, super_on_resize
+    ) -> None:
+        sut = create_sut(resize_debounce=0)
+        handler = Mock(side_effect=lambda _: super_on_resize.assert_not_called())
+        sut.after_resize += handler
+
+        sut._on_resize()  # noqa: SLF001
+
+        handler.assert_called_once_with(sut)
+        super_on_resize.assert_called_once_with()
+        sut.loop.call_later.assert_not_called()
+
+
+class TestRedrawStats:
+    def test_counts_every_request_and_performed_redraws(
+        self, create_sut, super_invalidate, super_on_resize
+    ) -> None:
+        sut = create_sut(resize_debounce=0)
+
+        sut.invalidate()
+        sut.invalidate()
+        sut._on_resize()  # noqa: SLF001
+        sut.after_render.fire()
+
+        assert sut.redraw_stats == RedrawStats(requested=3, immediate=0, performed=1)
+
+    def test_counts_immediate_redraws_of_key_presses(
+        self, create_sut, super_invalidate
+    ) -> None:
+        sut = create_sut()
+
+        sut.key_processor.before_key_press.fire()
+        sut.invalidate()
+        sut.invalidate()
+        sut.key_processor.after_key_press.fire()
+
+        assert sut.redraw_stats == RedrawStats(requested=2, immediate=1, performed=0)
@@ -0,0 +1,267 @@
+from unittest.mock import Mock, call, create_autospec
+
+import pytest
+from attrs import frozen
+from eventoolkit import EventPublisher, EventsFactory
+from pydepot import Action, Reducer
+
+from src.tuicub.common.events.coalescing import CoalescingEventBridge, coalesce
+from src.tuicub.common.latency import LatencyTracer
+from src.tuicub.common.logger import Logger
+from src.tuicub.common.state.store import TuicubStore
+from src.tuicub.game.events import (
+    BoardChangedEvent,
+    PileCountChangedEvent,
+    PlayersChangedEvent,
+    RackChangedEvent,
+    TileDrawnEvent,
+    TurnEndedEvent,
+)
+
+
+class MockError(Exception):
+    pass
+
+
+@frozen
+class IncrementAction(Action):
+    pass
+
+
+class IncrementReducer(Reducer[IncrementAction, int]):
+    @property
+    def action_type(self) -> type[IncrementAction]:
+        return IncrementAction
+
+    def apply(self, action: IncrementAction, state: int) -> int:
+        return state + 1
+
+
+def board(*tiles: int) -> BoardChangedEvent:
+    return BoardChangedEvent(board=[list(tiles)], new_tiles=[])
+
+
+def pile(count: int) -> PileCountChangedEvent:
+    return PileCountChangedEvent(pile_count=count)
+
+
+def rack(*tiles: int) -> RackChangedEvent:
+    return RackChangedEvent(rack=list(tiles))
+
+
+class TestCoalesce:
+    def test_drops_superseded_snapshot_events(self) -> None:
+        expected = [pile(1), board(2)]
+
+        result = coalesce([board(1), pile(1), board(2)])
+
+        assert result == expected
+
+    def test_keeps_events_separated_by_other_events(self) -> None:
+        expected = [board(1), TileDrawnEvent(tile=5), board(2)]
+
+        result = coalesce([board(1), TileDrawnEvent(tile=5), board(2)])
+
+        assert result == expected
+
+    def test_keeps_boards_separated_by_rack(self) -> None:
+        expected = [board(1), rack(2), board(3)]
+
+        result = coalesce([board(1), rack(2), board(3)])
+
+        assert result == expected
+
+    def test_keeps_racks_separated_by_board(self) -> None:
+        expected = [rack(1), board(2), rack(3)]
+
+        result = coalesce([rack(1), board(2), rack(3)])
+
+        assert result == expected
+
+    def test_when_board_and_rack_interleaved__drops_only_superseded(self) -> None:
+        expected = [board(2), rack(3), pile(5)]
+
+        result = coalesce([board(1), pile(4), board(2), rack(3), pile(5)])
+
+        assert result == expected
+
+    def test_keeps_all_other_events(self) -> None:
+        expected = [TurnEndedEvent(), TurnEndedEvent()]
+
+        result = coalesce([TurnEndedEvent(), TurnEndedEvent()])
+
+        assert result == expected
+
+    def test_when_different_snapshot_types__keeps_all(self) -> None:
+        events = [board(1), pile(1), PlayersChangedEvent(players=[])]
+
+        result = coalesce(events)
+
+        assert result == events
+
+
+class TestCoalescingEventBridge:
+    @pytest.fixture()
+    def factory(self) -> EventsFactory:
+        return create_autospec(EventsFactory)
+
+    @pytest.fixture()
+    def publisher(self) -> EventPublisher:
+        return create_autospec(EventPublisher)
+
+    @pytest.fixture()
+    def logger(self) -> Logger:
+        return create_autospec(Logger)
+
+    @pytest.fixture()
+    def sut(self, factory, publisher, logger) -> CoalescingEventBridge:
+        return CoalescingEventBridge(factory=factory, publisher=publisher, logger=logger)
+
+    def test_on_message__does_not_publish_before_flush(
+        self, sut, factory, publisher
+    ) -> None:
+        factory.create.return_value = board(1)
+
+        sut.on_message("foo")
+
+        factory.create.assert_called_once_with(raw="foo")
+        publisher.publish.assert_not_called()
+
+    def test_flush__publishes_coalesced_events(self, sut, factory, publisher) -> None:
+        factory.create.side_effect = [board(1), pile(3), board(2)]
+        for message in ("foo", "bar", "baz"):
+            sut.on_message(message)
+
+        sut.flush()
+
+        assert publisher.publish.call_args_list == [call(pile(3)), call(board(2))]
+        assert sut.merged == 1
+
+    def test_flush__when_merged__logs_counters(self, sut, factory, logger) -> None:
+        factory.create.side_effect = [board(1), board(2)]
+        sut.on_message("foo")
+        sut.on_message("bar")
+
+        sut.flush()
+
+        logger.log_coalesced_events.assert_called_once_with(
+            received=2, published=1, merged=1
+        )
+
+    def test_flush__when_nothing_merged__does_not_log(self, sut, factory, logger) -> None:
+        factory.create.return_value = board(1)
+        sut.on_message("foo")
+
+        sut.flush()
+
+        logger.log_coalesced_events.assert_not_called()
+
+    def test_flush__publishes_each_batch_once(self, sut, factory, publisher) -> None:
+        factory.create.side_effect = [board(1), board(2)]
+        sut.on_message("foo")
+        sut.flush()
+        sut.on_message("bar")
+
+        sut.flush()
+        sut.flush()
+
+        assert publisher.publish.call_args_list == [call(board(1)), call(board(2))]
+
+    def test_flush__when_handler_raises__logs_and_publishes_rest_of_batch(
+        self, sut, factory, publisher, logger
+    ) -> None:
+        error = MockError()
+        factory.create.side_effect = [board(1), TurnEndedEvent(), pile(2)]
+        publisher.publish.side_effect = [error, None, None]
+        for message in ("foo", "bar", "baz"):
+            sut.on_message(message)
+
+        sut.flush()
+
+        assert publisher.publish.call_args_list == [
+            call(board(1)),
+            call(TurnEndedEvent()),
+            call(pile(2)),
+        ]
+        logger.log_event_error.assert_called_once_with(
+            message=repr(board(1)), error=error
+        )
+
+    def test_flush__when_handler_raises__notifies_subscribers_of_store(
+        self, sut, factory, publisher, logger
+    ) -> None:
+        store = TuicubStore(initial_state=0, logger=logger)
+        store.register(IncrementReducer())
+        subscriber = Mock()
+        store.subscribe(subscriber)
+        sut.add_store(store)
+        factory.create.side_effect = [TurnEndedEvent(), board(1)]
+
+        def publish(event: object) -> None:
+            store.dispatch(IncrementAction())
+            if isinstance(event, TurnEndedEvent):
+                raise MockError
+
+        publisher.publish.side_effect = publish
+        sut.on_message("foo")
+        sut.on_message("bar")
+
+        sut.flush()
+
+        subscriber.on_state.assert_called_once_with(2)
+
+    def test_flush__when_tracer__stamps_batch_dispatched_and_published(
+        self, factory, publisher, logger
+    ) -> None:
+        tracer = create_autospec(LatencyTracer)
+        sut = CoalescingEventBridge(
+            factory=factory, publisher=publisher, logger=logger, tracer=tracer
+        )
+        store = TuicubStore(initial_state=0, logger=logger)
+        store.register(IncrementReducer())
+        subscriber = Mock(on_state=Mock(side_effect=lambda _: tracer.rebuilt()))
+        store.subscribe(subscriber)
+        sut.add_store(store)
+        factory.create.return_value = board(1)
+        publisher.publish.side_effect = lambda _: store.dispatch(IncrementAction())
+        sut.on_message("foo")
+
+        sut.flush()
+
+        assert tracer.method_calls == [
+            call.dispatched(changed=True),
+            call.rebuilt(),
+            call.published(),
+        ]
+
+    def test_flush__when_state_unchanged__stamps_batch_not_changed(
+        self, factory, publisher, logger
+    ) -> None:
+        tracer = create_autospec(LatencyTracer)
+        sut = CoalescingEventBridge(
+            factory=factory, publisher=publisher, logger=logger, tracer=tracer
+        )
+        sut.add_store(TuicubStore(initial_state=0, logger=logger))
+        factory.create.return_value = board(1)
+        sut.on_message("foo")
+
+        sut.flush()
+
+        tracer.dispatched.assert_called_once_with(changed=False)
+
+    def test_flush__notifies_subscribers_of_added_store_once(
+        self, sut, factory, publisher, logger
+    ) -> None:
+        store = TuicubStore(initial_state=0, logger=logger)
+        store.register(IncrementReducer())
+        subscriber = Mock()
+        store.subscribe(subscriber)
+        sut.add_store(store)
+        factory.create.side_effect = [board(1), TurnEndedEvent(), board(2)]
+        publisher.publish.side_effect = lambda _: store.dispatch(IncrementAction())
+        for message in ("foo", "bar", "baz"):
+            sut.on_message(message)
+
+        sut.flush()
+
+        subscriber.on_state.assert_called_once_with(3)
@@ -0,0 +1,82 @@
+import pytest
+
+from src.tuicub.common.events.decoders import (
+    DecodeError,
+    decode_board_changed,
+    decode_players_changed,
+    decode_rack_changed,
+)
+from src.tuicub.common.models import Player
+from src.tuicub.game.events import (
+    BoardChangedEvent,
+    PlayersChangedEvent,
+    RackChangedEvent,
+)
+
+
+class TestDecodeBoardChanged:
+    def test_returns_board_changed_event(self) -> None:
+        expected = BoardChangedEvent(board=[[1, 2, 3], [4, 5, 6]], new_tiles=[1, 4])
+
+        result = decode_board_changed(
+            {"board": [[1, 2, 3], [4, 5, 6]], "new_tiles": [1, 4]}
+        )
+
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"board": [[1, "2"]], "new_tiles": []},
+            {"board": [[1, True]], "new_tiles": []},
+            {"board": [1], "new_tiles": []},
+            {"board": [[1]]},
+        ],
+    )
+    def test_when_payload_not_exact__raises_decode_error(self, data) -> None:
+        with pytest.raises(DecodeError):
+            decode_board_changed(data)
+
+
+class TestDecodePlayersChanged:
+    def test_returns_players_changed_event(self) -> None:
+        expected = PlayersChangedEvent(
+            players=[Player(user_id="123", name="Alice", tiles_count=7, has_turn=True)]
+        )
+
+        result = decode_players_changed(
+            {
+                "players": [
+                    {
+                        "name": "Alice",
+                        "user_id": "123",
+                        "tiles_count": 7,
+                        "has_turn": True,
+                    }
+                ]
+            }
+        )
+
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "player",
+        [
+            {"name": "Alice", "user_id": None, "tiles_count": 7, "has_turn": True},
+            {"name": "Alice", "user_id": "123", "tiles_count": 7, "has_turn": 1},
+            {"name": "Alice", "user_id": "123", "tiles_count": 7},
+            {"name": "A", "user_id": "1", "tiles_count": 7, "has_turn": True, "x": 1},
+        ],
+    )
+    def test_when_player_not_exact__raises_decode_error(self, player) -> None:
+        with pytest.raises(DecodeError):
+            decode_players_changed({"players": [player]})
+
+
+class TestDecodeRackChanged:
+    def test_ignores_unknown_fields(self) -> None:
+        expected = RackChangedEvent(rack=[3, 1, 2])
+
+        result = decode_rack_changed({"rack": [3, 1, 2], "foo": "bar"})
+
+        assert result == expected
@@ -1,6 +1,10 @@
+from unittest.mock import Mock, create_autospec, patch
+
 import pytest
+from marshmallow import ValidationError
 
 from src.tuicub.common.events.factory import EventSchemas, TuicubEventsFactory
+from src.tuicub.common.latency import LatencyTracer
 from src.tuicub.common.models import (
     Game,
     Gameroom,
@@ -243,3 +247,76 @@ class TestCreate:
 
         with pytest.raises(NotImplementedError):
             sut.create(raw)
+
+    def test_when_payload_needs_coercion__returns_event_loaded_by_schema(
+        self, sut
+    ) -> None:
+        raw = '{"name": "pile_count_changed", "data": {"pile_count": "7"}}'
+        expected = PileCountChangedEvent(pile_count=7)
+
+        result = sut.create(raw)
+
+        assert result == expected
+
+    def test_when_payload_invalid__raises_validation_error(self, sut) -> None:
+        raw = '{"name": "tile_drawn", "data": {"tile": "foo"}}'
+
+        with pytest.raises(ValidationError):
+            sut.create(raw)
+
+    def test_when_player_has_unknown_field__raises_validation_error(self, sut) -> None:
+        raw = (
+            '{"name": "player_left", "data": {"player": {"name": "Alice", '
+            '"user_id": "123", "tiles_count": 7, "has_turn": false, "foo": 1}}}'
+        )
+
+        with pytest.raises(ValidationError):
+            sut.create(raw)
+
+
+class TestCreateTraced:
+    def test_stamps_event_as_decoded_with_event_name(self, schemas) -> None:
+        tracer = create_autospec(LatencyTracer)
+        sut = TuicubEventsFactory(event_schemas=schemas, tracer=tracer)
+
+        sut.create('{"name": "tile_drawn", "data": {"tile": 42}}')
+
+        tracer.decoded.assert_called_once_with("TileDrawnEvent")
+
+
+class TestCreateStrict:
+    @pytest.fixture()
+    def sut(self, schemas) -> TuicubEventsFactory:
+        return TuicubEventsFactory(event_schemas=schemas, strict=True)
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            '{"name": "board_changed", "data": {"board": [[1, 2]], "new_tiles": [2]}}',
+            '{"name": "pile_count_changed", "data": {"pile_count": 7}}',
+            '{"name": "rack_changed", "data": {"rack": [3, 1, 2]}}',
+            '{"name": "tile_drawn", "data": {"tile": 42}}',
+            '{"name": "turn_ended", "data": {}}',
+            (
+                '{"name": "players_changed", "data": {"players": [{"name": "Alice", '
+                '"user_id": "123", "tiles_count": 7, "has_turn": true}]}}'
+            ),
+        ],
+    )
+    def test_returns_event_equal_to_decoded_event(self, sut, schemas, raw) -> None:
+        expected = TuicubEventsFactory(event_schemas=schemas).create(raw)
+
+        result = sut.create(raw)
+
+        assert result == expected
+
+    def test_does_not_use_decoders(self, sut) -> None:
+        raw = '{"name": "tile_drawn", "data": {"tile": 42}}'
+        decoder = Mock()
+
+        with patch.dict(
+            "src.tuicub.common.events.factory.DECODERS", {"tile_drawn": decoder}
+        ):
+            sut.create(raw)
+
+        decoder.assert_not_called()
@@ -5,7 +5,9 @@ import asockit
 import pytest
 from eventoolkit import EventPublisher
 
+from src.tuicub.common.events.ingress import EventIngressQueue
 from src.tuicub.common.events.module import EventsModule
+from src.tuicub.common.logger import Logger
 
 
 @pytest.fixture()
@@ -20,7 +22,12 @@ def stream_writer() -> asyncio.StreamWriter:
 
 @pytest.fixture()
 def sut(stream_reader, stream_writer) -> EventsModule:
-    return EventsModule(stream_reader=stream_reader, stream_writer=stream_writer)
+    return EventsModule(
+        stream_reader=stream_reader,
+        stream_writer=stream_writer,
+        loop=create_autospec(asyncio.AbstractEventLoop),
+        logger=create_autospec(Logger),
+    )
 
 
 class TestEventsModule:
@@ -38,3 +45,19 @@ class TestEventsModule:
         result = sut.socket_writer
 
         assert isinstance(result, asockit.SocketWriter)
+
+    def test_ingress__returns_queue_with_capacity(
+        self, stream_reader, stream_writer
+    ) -> None:
+        sut = EventsModule(
+            stream_reader=stream_reader,
+            stream_writer=stream_writer,
+            loop=create_autospec(asyncio.AbstractEventLoop),
+            logger=create_autospec(Logger),
+            ingress_capacity=8,
+        )
+
+        result = sut.ingress
+
+        assert isinstance(result, EventIngressQueue)
+        assert result.capacity == 8
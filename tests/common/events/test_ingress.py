@@ -0,0 +1,313 @@
+import asyncio
+import json
+from unittest.mock import Mock, call, create_autospec
+
+import asockit
+import pytest
+
+from src.tuicub.common.events.ingress import (
+    BackpressuredConnection,
+    EventIngressQueue,
+    IngressStats,
+)
+from src.tuicub.common.latency import LatencyTracer
+
+
+class MockError(Exception):
+    pass
+
+
+def line(name: str, value: int = 0) -> str:
+    return json.dumps({"name": name, "data": {"value": value}})
+
+
+@pytest.fixture()
+def delegate() -> asockit.SocketReaderDelegate:
+    return create_autospec(asockit.SocketReaderDelegate)
+
+
+class TestIngressStats:
+    def test_mean_wait__returns_mean_of_consumed(self) -> None:
+        stats = IngressStats(
+            received=4,
+            consumed=4,
+            merged=0,
+            failed=0,
+            depth=0,
+            max_depth=2,
+            total_wait=2.0,
+            max_wait=1.0,
+        )
+
+        result = stats.mean_wait
+
+        assert result == 0.5
+
+    def test_mean_wait__when_nothing_consumed__returns_zero(self) -> None:
+        stats = IngressStats(
+            received=1,
+            consumed=0,
+            merged=0,
+            failed=0,
+            depth=1,
+            max_depth=1,
+            total_wait=0.0,
+            max_wait=0.0,
+        )
+
+        result = stats.mean_wait
+
+        assert result == 0.0
+
+
+class TestEventIngressQueue:
+    @pytest.fixture()
+    def loop(self) -> asyncio.AbstractEventLoop:
+        loop = create_autospec(asyncio.AbstractEventLoop)
+        loop.time.return_value = 0.0
+        return loop
+
+    def test_on_message__starts_single_consumer(self, delegate, loop, logger) -> None:
+        sut = EventIngressQueue(delegate=delegate, logger=logger, loop=loop)
+
+        sut.on_message("foo")
+        sut.on_message("bar")
+
+        loop.create_task.assert_called_once()
+        loop.create_task.call_args.args[0].close()
+        delegate.on_message.assert_not_called()
+
+    def test_on_message__counts_received_and_depth(self, delegate, loop, logger) -> None:
+        sut = EventIngressQueue(delegate=delegate, logger=logger, loop=loop)
+
+        sut.on_message("foo")
+        sut.on_message("bar")
+
+        loop.create_task.call_args.args[0].close()
+        assert sut.stats.received == 2
+        assert sut.stats.depth == 2
+        assert sut.stats.max_depth == 2
+
+
+@pytest.mark.asyncio()
+class TestEventIngressQueueConsumer:
+    async def test_consumer__passes_lines_in_order(self, delegate, logger) -> None:
+        sut = EventIngressQueue(
+            delegate=delegate, logger=logger, loop=asyncio.get_running_loop()
+        )
+
+        sut.on_message("foo")
+        sut.on_message("bar")
+        await asyncio.sleep(0.01)
+
+        assert delegate.on_message.call_args_list == [call("foo"), call("bar")]
+        assert sut.stats.consumed == 2
+        assert sut.stats.depth == 0
+
+    async def test_consumer__when_tracer__stamps_lines_as_read_when_received(
+        self, delegate, logger
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        tracer = create_autospec(LatencyTracer)
+        sut = EventIngressQueue(
+            delegate=delegate, logger=logger, loop=loop, tracer=tracer
+        )
+        received_at = loop.time()
+
+        sut.on_message("foo")
+        await asyncio.sleep(0.01)
+
+        tracer.read.assert_called_once()
+        assert received_at <= tracer.read.call_args.args[0] < loop.time()
+
+    async def test_consumer__when_delegate_raises__logs_and_consumes_next_lines(
+        self, delegate, logger
+    ) -> None:
+        error = MockError()
+        delegate.on_message.side_effect = [None, error, None]
+        sut = EventIngressQueue(
+            delegate=delegate, logger=logger, loop=asyncio.get_running_loop()
+        )
+
+        for message in ("foo", "bar", "baz"):
+            sut.on_message(message)
+        await asyncio.sleep(0.01)
+
+        assert delegate.on_message.call_args_list == [
+            call("foo"),
+            call("bar"),
+            call("baz"),
+        ]
+        logger.log_event_error.assert_called_once_with(message="bar", error=error)
+        assert sut.stats.failed == 1
+
+    async def test_wait_for_space__when_delegate_raises__still_gets_space(
+        self, delegate, logger
+    ) -> None:
+        delegate.on_message.side_effect = MockError()
+        sut = EventIngressQueue(
+            delegate=delegate,
+            logger=logger,
+            loop=asyncio.get_running_loop(),
+            capacity=1,
+        )
+        sut.on_message("foo")
+        await sut.wait_for_space()
+        sut.on_message("bar")
+
+        await sut.wait_for_space()
+
+        assert delegate.on_message.call_count == 2
+
+    async def test_consumer__when_drained__calls_on_drained_once(
+        self, delegate, logger
+    ) -> None:
+        on_drained = Mock()
+        sut = EventIngressQueue(
+            delegate=delegate,
+            logger=logger,
+            loop=asyncio.get_running_loop(),
+            on_drained=on_drained,
+        )
+
+        sut.on_message("foo")
+        sut.on_message("bar")
+        await asyncio.sleep(0.01)
+
+        assert delegate.on_message.call_count == 2
+        on_drained.assert_called_once_with()
+
+    async def test_consumer__when_delegate_raises__still_calls_on_drained(
+        self, delegate, logger
+    ) -> None:
+        delegate.on_message.side_effect = MockError()
+        on_drained = Mock()
+        sut = EventIngressQueue(
+            delegate=delegate,
+            logger=logger,
+            loop=asyncio.get_running_loop(),
+            on_drained=on_drained,
+        )
+
+        sut.on_message("foo")
+        await asyncio.sleep(0.01)
+
+        on_drained.assert_called_once_with()
+
+    async def test_consumer__yields_to_loop_between_lines(self, delegate, logger) -> None:
+        sut = EventIngressQueue(
+            delegate=delegate, logger=logger, loop=asyncio.get_running_loop()
+        )
+        sut.on_message("foo")
+        sut.on_message("bar")
+
+        await asyncio.sleep(0)
+
+        delegate.on_message.assert_called_once_with("foo")
+
+    async def test_consumer__after_drained__restarts_on_message(
+        self, delegate, logger
+    ) -> None:
+        sut = EventIngressQueue(
+            delegate=delegate, logger=logger, loop=asyncio.get_running_loop()
+        )
+        sut.on_message("foo")
+        await asyncio.sleep(0.01)
+
+        sut.on_message("bar")
+        await asyncio.sleep(0.01)
+
+        assert delegate.on_message.call_args_list == [call("foo"), call("bar")]
+
+    async def test_wait_for_space__when_full__merges_superseded_snapshots(
+        self, delegate, logger
+    ) -> None:
+        sut = EventIngressQueue(
+            delegate=delegate, logger=logger, loop=asyncio.get_running_loop(), capacity=3
+        )
+        sut.on_message(line("board_changed", 1))
+        sut.on_message(line("pile_count_changed", 1))
+        sut.on_message(line("board_changed", 2))
+
+        await sut.wait_for_space()
+        await asyncio.sleep(0.01)
+
+        assert delegate.on_message.call_args_list == [
+            call(line("pile_count_changed", 1)),
+            call(line("board_changed", 2)),
+        ]
+        assert sut.stats.merged == 1
+
+    async def test_wait_for_space__does_not_merge_boards_across_rack(
+        self, delegate, logger
+    ) -> None:
+        sut = EventIngressQueue(
+            delegate=delegate, logger=logger, loop=asyncio.get_running_loop(), capacity=3
+        )
+        sut.on_message(line("board_changed", 1))
+        sut.on_message(line("rack_changed", 1))
+        sut.on_message(line("board_changed", 2))
+
+        await sut.wait_for_space()
+
+        assert delegate.on_message.call_count == 1
+        assert sut.stats.merged == 0
+
+    async def test_wait_for_space__does_not_merge_across_other_events(
+        self, delegate, logger
+    ) -> None:
+        sut = EventIngressQueue(
+            delegate=delegate, logger=logger, loop=asyncio.get_running_loop(), capacity=3
+        )
+        sut.on_message(line("board_changed", 1))
+        sut.on_message(line("tile_drawn", 5))
+        sut.on_message(line("board_changed", 2))
+
+        await sut.wait_for_space()
+
+        assert delegate.on_message.call_count == 1
+        assert sut.stats.merged == 0
+
+    async def test_wait_for_space__when_not_mergeable__waits_for_consumer(
+        self, delegate, logger
+    ) -> None:
+        sut = EventIngressQueue(
+            delegate=delegate, logger=logger, loop=asyncio.get_running_loop(), capacity=2
+        )
+        sut.on_message("foo")
+        sut.on_message("bar")
+
+        await sut.wait_for_space()
+
+        delegate.on_message.assert_called_once_with("foo")
+        assert sut.stats.depth == 1
+
+
+@pytest.mark.asyncio()
+class TestBackpressuredConnection:
+    async def test_readline__returns_line_of_connection(self, delegate, logger) -> None:
+        connection = create_autospec(asockit.ReadableConnection)
+        connection.readline.return_value = "foo"
+        queue = EventIngressQueue(
+            delegate=delegate, logger=logger, loop=asyncio.get_running_loop()
+        )
+        sut = BackpressuredConnection(connection, queue=queue)
+
+        result = await sut.readline()
+
+        assert result == "foo"
+
+    async def test_readline__when_queue_full__waits_before_reading(
+        self, delegate, logger
+    ) -> None:
+        connection = create_autospec(asockit.ReadableConnection)
+        queue = EventIngressQueue(
+            delegate=delegate, logger=logger, loop=asyncio.get_running_loop(), capacity=1
+        )
+        sut = BackpressuredConnection(connection, queue=queue)
+        queue.on_message("foo")
+
+        await sut.readline()
+
+        delegate.on_message.assert_called_once_with("foo")
+        connection.readline.assert_awaited_once()
@@ -1,5 +1,5 @@
 from typing import Any
-from unittest.mock import AsyncMock, Mock, create_autospec
+from unittest.mock import AsyncMock, Mock, call, create_autospec
 
 import pytest
 from httperactor import Request
@@ -95,3 +95,13 @@ class TestExecute:
         http_client.send.assert_awaited_with(
             confirming_sut.request, auth=confirming_sut.auth
         )
+
+    @pytest.mark.asyncio()
+    async def test_dispatches_actions_of_response(self, sut, http_client, store) -> None:
+        actions = [Mock(), Mock()]
+        sut.actions = Mock(return_value=actions)
+
+        await sut.execute()
+
+        sut.actions.assert_called_once_with(http_client.send.return_value)
+        assert store.dispatch.call_args_list == [call(action) for action in actions]
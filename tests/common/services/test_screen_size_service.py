@@ -1,4 +1,4 @@
-from unittest.mock import create_autospec
+from unittest.mock import Mock, create_autospec
 
 import pytest
 from prompt_toolkit.renderer import Output, Size
@@ -16,13 +16,86 @@ def sut(output) -> ScreenSizeService:
     return ScreenSizeService(output=output)
 
 
-class TestWidth:
-    def test_returns_number_of_columns_of_output_size(self, sut, output) -> None:
+@pytest.fixture()
+def set_columns(output):
+    def factory(columns: int) -> None:
         size = create_autospec(Size)
-        size.columns = 42
+        size.columns = columns
         output.get_size.return_value = size
+
+    return factory
+
+
+class TestWidth:
+    def test_returns_number_of_columns_of_output_size(self, sut, set_columns) -> None:
+        set_columns(42)
+        expected = 42
+
+        result = sut.width()
+
+        assert result == expected
+
+    def test_when_resize_not_settled__returns_previous_width(
+        self, sut, set_columns
+    ) -> None:
+        set_columns(42)
+        sut.width()
+        set_columns(50)
         expected = 42
 
         result = sut.width()
 
         assert result == expected
+
+    def test_when_resize_settled__returns_new_width(self, sut, set_columns) -> None:
+        set_columns(42)
+        sut.width()
+        set_columns(50)
+        sut.did_resize()
+        expected = 50
+
+        result = sut.width()
+
+        assert result == expected
+
+
+class TestDidResize:
+    @pytest.fixture()
+    def subscriber(self) -> Mock:
+        return Mock()
+
+    def test_when_width_changed__notifies_subscribers(
+        self, sut, set_columns, subscriber
+    ) -> None:
+        set_columns(42)
+        sut.width()
+        sut.subscribe(subscriber)
+        set_columns(50)
+
+        sut.did_resize()
+
+        subscriber.on_resize.assert_called_once_with(50)
+
+    def test_when_width_unchanged__does_not_notify_subscribers(
+        self, sut, set_columns, subscriber
+    ) -> None:
+        set_columns(42)
+        sut.width()
+        sut.subscribe(subscriber)
+
+        sut.did_resize()
+
+        subscriber.on_resize.assert_not_called()
+
+    def test_when_unsubscribed__does_not_notify_subscriber(
+        self, sut, set_columns, subscriber
+    ) -> None:
+        set_columns(42)
+        sut.width()
+        sut.subscribe(subscriber)
+        sut.unsubscribe(subscriber)
+        set_columns(50)
+
+        sut.did_resize()
+
+        subscriber.on_resize.assert_not_called()
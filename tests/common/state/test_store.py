@@ -1,8 +1,10 @@
+from unittest.mock import Mock, call, create_autospec
+
 import pytest
-from attrs import field, frozen
-from pydepot import Action
+from attrs import evolve, field, frozen
+from pydepot import Action, Reducer, Store
 
-from src.tuicub.common.state.store import TuicubStore
+from src.tuicub.common.state.store import TuicubStore, dispatch_batch
 
 
 @frozen
@@ -15,9 +17,30 @@ class MockAction(Action):
     foo: int
 
 
+class MockError(Exception):
+    pass
+
+
+class MockReducer(Reducer[MockAction, MockState]):
+    @property
+    def action_type(self) -> type[MockAction]:
+        return MockAction
+
+    def apply(self, action: MockAction, state: MockState) -> MockState:
+        return evolve(state, foo=action.foo)
+
+
+@pytest.fixture()
+def subscriber() -> Mock:
+    return Mock()
+
+
 @pytest.fixture()
-def sut(logger) -> TuicubStore[MockState]:
-    return TuicubStore(initial_state=MockState(), logger=logger)
+def sut(logger, subscriber) -> TuicubStore[MockState]:
+    store = TuicubStore(initial_state=MockState(), logger=logger)
+    store.register(MockReducer())
+    store.subscribe(subscriber)
+    return store
 
 
 class TestDispatch:
@@ -25,3 +48,71 @@ class TestDispatch:
         sut.dispatch(MockAction(foo=13))
 
         logger.log_action.assert_called_once_with(MockAction(foo=13))
+
+    def test_notifies_subscribers_with_new_state(self, sut, subscriber) -> None:
+        sut.dispatch(MockAction(foo=13))
+
+        subscriber.on_state.assert_called_once_with(MockState(foo=13))
+
+
+class TestDispatchBatch:
+    def test_notifies_subscribers_once_with_final_state(self, sut, subscriber) -> None:
+        sut.dispatch_batch([MockAction(foo=1), MockAction(foo=2), MockAction(foo=3)])
+
+        subscriber.on_state.assert_called_once_with(MockState(foo=3))
+        assert sut.state == MockState(foo=3)
+
+    def test_logs_every_action(self, sut, logger) -> None:
+        sut.dispatch_batch([MockAction(foo=1), MockAction(foo=2)])
+
+        assert logger.log_action.call_args_list == [
+            call(action=MockAction(foo=1)),
+            call(action=MockAction(foo=2)),
+        ]
+
+    def test_when_final_state_unchanged__does_not_notify(self, sut, subscriber) -> None:
+        sut.dispatch_batch([MockAction(foo=1), MockAction(foo=42)])
+
+        subscriber.on_state.assert_not_called()
+
+
+class TestTransaction:
+    def test_when_nested__notifies_at_end_of_outermost(self, sut, subscriber) -> None:
+        with sut.transaction():
+            sut.dispatch(MockAction(foo=1))
+            with sut.transaction():
+                sut.dispatch(MockAction(foo=2))
+            subscriber.on_state.assert_not_called()
+
+        subscriber.on_state.assert_called_once_with(MockState(foo=2))
+
+    def test_when_raises__notifies_with_applied_state(self, sut, subscriber) -> None:
+        def dispatch_and_raise() -> None:
+            with sut.transaction():
+                sut.dispatch(MockAction(foo=1))
+                raise MockError
+
+        with pytest.raises(MockError):
+            dispatch_and_raise()
+
+        subscriber.on_state.assert_called_once_with(MockState(foo=1))
+
+
+class TestDispatchBatchFunction:
+    def test_when_tuicub_store__dispatches_batch(self) -> None:
+        store = create_autospec(TuicubStore)
+        actions = [MockAction(foo=1), MockAction(foo=2)]
+
+        dispatch_batch(store, actions)
+
+        store.dispatch_batch.assert_called_once_with(actions)
+
+    def test_when_other_store__dispatches_every_action(self) -> None:
+        store = create_autospec(Store)
+
+        dispatch_batch(store, [MockAction(foo=1), MockAction(foo=2)])
+
+        assert store.dispatch.call_args_list == [
+            call(MockAction(foo=1)),
+            call(MockAction(foo=2)),
+        ]
@@ -3,7 +3,7 @@ from unittest.mock import create_autospec
 import pytest
 from cacheout import Cache as Cacheout  # type: ignore
 
-from src.tuicub.common.cache import Cache
+from src.tuicub.common.cache import Cache, InternTable
 
 
 @pytest.fixture()
@@ -32,3 +32,37 @@ class TestSet:
         sut.set(key=42, value="foo")
 
         cacheout.set.assert_called_once_with(key=42, value="foo")
+
+
+class _Value:
+    pass
+
+
+class TestInternTable:
+    def test_get__returns_added_value(self) -> None:
+        expected = _Value()
+        sut: InternTable[int, _Value] = InternTable(max_size=1)
+        sut.add(42, expected)
+
+        result = sut.get(42)
+
+        assert result is expected
+
+    def test_get__when_value_released__returns_none(self) -> None:
+        sut: InternTable[int, _Value] = InternTable(max_size=1)
+        sut.add(42, _Value())
+
+        result = sut.get(42)
+
+        assert result is None
+
+    def test_add__when_full__returns_value_without_interning(self) -> None:
+        value, other = _Value(), _Value()
+        sut: InternTable[int, _Value] = InternTable(max_size=1)
+        sut.add(1, value)
+
+        result = sut.add(2, other)
+
+        assert result is other
+        assert sut.get(2) is None
+        assert len(sut) == 1
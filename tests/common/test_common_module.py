@@ -1,6 +1,7 @@
 import pytest
 
 from src.tuicub.common.cache import Cache
+from src.tuicub.common.latency import LatencyTracer
 from src.tuicub.common.logger import Logger
 from src.tuicub.common.module import CommonModule
 
@@ -32,3 +33,21 @@ class TestCommonModule:
         result = sut.cache()
 
         assert isinstance(result, Cache)
+
+    def test_latency_tracer__when_debug__returns_tracer_instance(
+        self, config, theme
+    ) -> None:
+        config.debug = True
+        sut = CommonModule(config=config, theme=theme)
+
+        result = sut.latency_tracer
+
+        assert isinstance(result, LatencyTracer)
+
+    def test_latency_tracer__when_not_debug__returns_none(self, config, theme) -> None:
+        config.debug = False
+        sut = CommonModule(config=config, theme=theme)
+
+        result = sut.latency_tracer
+
+        assert result is None
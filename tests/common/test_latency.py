@@ -0,0 +1,194 @@
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.tuicub.common.latency import LatencyHistogram, LatencyTracer
+from src.tuicub.common.logger import Logger
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLatencyHistogram:
+    def test_add__counts_latency_in_bucket_of_upper_bound(self) -> None:
+        sut = LatencyHistogram()
+
+        sut.add(0.5)
+        sut.add(1.0)
+        sut.add(1.5)
+        sut.add(2000.0)
+
+        assert sut.counts == (2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1)
+        assert sut.count == 4
+
+    def test_mean_and_max__return_aggregates(self) -> None:
+        sut = LatencyHistogram()
+
+        sut.add(1.0)
+        sut.add(3.0)
+
+        assert sut.mean == 2.0
+        assert sut.max == 3.0
+
+    def test_quantile__returns_upper_bound_of_bucket(self) -> None:
+        sut = LatencyHistogram()
+        for latency in (0.5, 3.0, 4.0, 40.0):
+            sut.add(latency)
+
+        result = sut.quantile(0.5)
+
+        assert result == 5
+
+    def test_quantile__caps_bound_at_max(self) -> None:
+        sut = LatencyHistogram()
+        sut.add(3.0)
+
+        result = sut.quantile(0.95)
+
+        assert result == 3.0
+
+    def test_quantile__when_in_last_bucket__returns_max(self) -> None:
+        sut = LatencyHistogram()
+        sut.add(1500.0)
+
+        result = sut.quantile(0.5)
+
+        assert result == 1500.0
+
+    def test_quantile__when_empty__returns_zero(self) -> None:
+        sut = LatencyHistogram()
+
+        result = sut.quantile(0.5)
+
+        assert result == 0.0
+
+
+class TestLatencyTracer:
+    @pytest.fixture()
+    def logger(self) -> Logger:
+        return create_autospec(Logger)
+
+    @pytest.fixture()
+    def clock(self) -> Clock:
+        return Clock()
+
+    @pytest.fixture()
+    def sut(self, logger, clock) -> LatencyTracer:
+        return LatencyTracer(logger=logger, clock=clock)
+
+    def trace(self, sut: LatencyTracer, clock: Clock, name: str) -> None:
+        sut.read(clock.now)
+        clock.now += 0.001
+        sut.decoded(name)
+        clock.now += 0.002
+        sut.dispatched(changed=True)
+        clock.now += 0.003
+        sut.rebuilt()
+        sut.published()
+        clock.now += 0.004
+        sut.painted()
+
+    def test_painted__logs_latencies_of_every_segment(self, sut, clock, logger) -> None:
+        self.trace(sut, clock, "BoardChangedEvent")
+
+        logger.log_event_latency.assert_called_once()
+        kwargs = logger.log_event_latency.call_args.kwargs
+        assert kwargs["name"] == "BoardChangedEvent"
+        assert kwargs["latencies"] == pytest.approx(
+            {"decode": 1, "dispatch": 2, "rebuild": 3, "paint": 4, "total": 10}
+        )
+
+    def test_painted__records_histograms_by_event_name(self, sut, clock) -> None:
+        self.trace(sut, clock, "BoardChangedEvent")
+        self.trace(sut, clock, "BoardChangedEvent")
+        self.trace(sut, clock, "RackChangedEvent")
+
+        result = sut.histograms
+
+        assert result["BoardChangedEvent"]["total"].count == 2
+        assert result["RackChangedEvent"]["total"].count == 1
+
+    def test_stages__stamp_all_events_of_batch(self, sut, clock, logger) -> None:
+        sut.decoded("BoardChangedEvent")
+        sut.decoded("RackChangedEvent")
+        sut.dispatched(changed=True)
+        sut.rebuilt()
+        sut.published()
+
+        sut.painted()
+
+        assert logger.log_event_latency.call_count == 2
+
+    def test_painted__completes_trace_once(self, sut, clock, logger) -> None:
+        self.trace(sut, clock, "BoardChangedEvent")
+
+        sut.painted()
+
+        logger.log_event_latency.assert_called_once()
+
+    def test_dispatched__when_state_unchanged__drops_traces(
+        self, sut, clock, logger
+    ) -> None:
+        sut.decoded("UserJoinedEvent")
+        sut.dispatched(changed=False)
+        sut.published()
+        sut.dispatched(changed=True)
+        sut.rebuilt()
+        sut.published()
+
+        sut.painted()
+
+        logger.log_event_latency.assert_not_called()
+        assert sut.histograms == {}
+
+    def test_rebuilt__when_not_in_published_batch__does_not_stamp_traces(
+        self, sut, clock, logger
+    ) -> None:
+        sut.decoded("PlayersChangedEvent")
+        sut.dispatched(changed=True)
+        sut.published()
+
+        sut.rebuilt()
+        sut.painted()
+
+        logger.log_event_latency.assert_not_called()
+
+    def test_rebuilt__when_not_dispatched__does_not_stamp_decoded_traces(
+        self, sut, clock, logger
+    ) -> None:
+        sut.decoded("BoardChangedEvent")
+
+        sut.rebuilt()
+        sut.painted()
+
+        logger.log_event_latency.assert_not_called()
+
+    def test_painted__when_not_rebuilt__keeps_trace_pending(
+        self, sut, clock, logger
+    ) -> None:
+        sut.decoded("BoardChangedEvent")
+        sut.painted()
+
+        sut.dispatched(changed=True)
+        sut.rebuilt()
+        sut.published()
+        sut.painted()
+
+        logger.log_event_latency.assert_called_once()
+
+    def test_decoded__when_not_read__starts_at_decode(self, sut, clock, logger) -> None:
+        clock.now = 5.0
+        sut.decoded("TurnEndedEvent")
+        sut.dispatched(changed=True)
+        sut.rebuilt()
+        sut.published()
+
+        sut.painted()
+
+        kwargs = logger.log_event_latency.call_args.kwargs
+        assert kwargs["latencies"]["decode"] == 0.0
@@ -9,7 +9,12 @@ import structlog
 from attrs import frozen
 from pydepot import Action
 
+from src.tuicub.app.application import RedrawStats
+from src.tuicub.common.events.ingress import IngressStats
+from src.tuicub.common.latency import LatencyHistogram
 from src.tuicub.common.logger import Logger
+from src.tuicub.common.output import FrameStats, OutputStats
+from src.tuicub.common.views.profile import RenderProfile
 
 
 @pytest.fixture()
@@ -162,3 +167,235 @@ class TestLogAction:
             sut.log_action(action)
 
             mock_log.info.assert_not_called()
+
+
+class TestLogRedrawStats:
+    def test_when_debug__logs_info_with_counters(self, create_sut, mock_log) -> None:
+        sut = create_sut()
+
+        with patch("structlog.get_logger", return_value=mock_log):
+            sut.log_redraw_stats(RedrawStats(requested=5, immediate=1, performed=2))
+
+            mock_log.info.assert_called_once_with(
+                "redraw_stats", requested=5, immediate=1, performed=2
+            )
+
+    def test_when_not_debug__does_not_log(self, create_sut, mock_log) -> None:
+        sut = create_sut(debug=False)
+
+        with patch("structlog.get_logger", return_value=mock_log):
+            sut.log_redraw_stats(RedrawStats(requested=5, immediate=1, performed=2))
+
+            mock_log.info.assert_not_called()
+
+
+class TestLogCoalescedEvents:
+    def test_when_debug__logs_info_with_counters(self, create_sut, mock_log) -> None:
+        sut = create_sut()
+
+        with patch("structlog.get_logger", return_value=mock_log):
+            sut.log_coalesced_events(received=4, published=3, merged=7)
+
+            mock_log.info.assert_called_once_with(
+                "events_coalesced", received=4, published=3, merged=7
+            )
+
+    def test_when_not_debug__does_not_log(self, create_sut, mock_log) -> None:
+        sut = create_sut(debug=False)
+
+        with patch("structlog.get_logger", return_value=mock_log):
+            sut.log_coalesced_events(received=4, published=3, merged=7)
+
+            mock_log.info.assert_not_called()
+
+
+class TestLogEventError:
+    def test_when_debug__logs_error_with_message_and_exception(
+        self, create_sut, mock_log
+    ) -> None:
+        sut = create_sut()
+        error = ValueError("foo")
+
+        with patch("structlog.get_logger", return_value=mock_log):
+            sut.log_event_error(message="bar", error=error)
+
+            mock_log.error.assert_called_once_with(
+                "event_error", message="bar", exc_info=error
+            )
+
+    def test_when_not_debug__logs_error(self, create_sut, mock_log) -> None:
+        sut = create_sut(debug=False)
+        error = ValueError("foo")
+
+        with patch("structlog.get_logger", return_value=mock_log):
+            sut.log_event_error(message="bar", error=error)
+
+            mock_log.error.assert_called_once_with(
+                "event_error", message="bar", exc_info=error
+            )
+
+
+class TestLogIngressStats:
+    @pytest.fixture()
+    def stats(self) -> IngressStats:
+        return IngressStats(
+            received=10,
+            consumed=8,
+            merged=2,
+            failed=1,
+            depth=0,
+            max_depth=5,
+            total_wait=0.004,
+            max_wait=0.002,
+        )
+
+    def test_when_debug__logs_info_with_counters(
+        self, create_sut, mock_log, stats
+    ) -> None:
+        sut = create_sut()
+
+        with patch("structlog.get_logger", return_value=mock_log):
+            sut.log_ingress_stats(stats)
+
+            mock_log.info.assert_called_once_with(
+                "ingress_stats",
+                received=10,
+                merged=2,
+                failed=1,
+                max_depth=5,
+                mean_wait_ms=0.5,
+                max_wait_ms=2.0,
+            )
+
+    def test_when_not_debug__does_not_log(self, create_sut, mock_log, stats) -> None:
+        sut = create_sut(debug=False)
+
+        with patch("structlog.get_logger", return_value=mock_log):
+            sut.log_ingress_stats(stats)
+
+            mock_log.info.assert_not_called()
+
+
+class TestLogEventLatency:
+    def test_when_debug__logs_info_with_latencies(self, create_sut, mock_log) -> None:
+        sut = create_sut()
+
+        with patch("structlog.get_logger", return_value=mock_log):
+            sut.log_event_latency(
+                name="BoardChangedEvent", latencies={"decode": 0.1234, "total": 2.0}
+            )
+
+            mock_log.info.assert_called_once_with(
+                "event_latency",
+                event_name="BoardChangedEvent",
+                decode_ms=0.123,
+                total_ms=2.0,
+            )
+
+    def test_when_not_debug__does_not_log(self, create_sut, mock_log) -> None:
+        sut = create_sut(debug=False)
+
+        with patch("structlog.get_logger", return_value=mock_log):
+            sut.log_event_latency(name="BoardChangedEvent", latencies={"total": 2.0})
+
+            mock_log.info.assert_not_called()
+
+
+class TestLogLatencySummary:
+    @pytest.fixture()
+    def histogram(self) -> LatencyHistogram:
+        histogram = LatencyHistogram()
+        histogram.add(1.5)
+        histogram.add(2.5)
+        return histogram
+
+    def test_when_debug__logs_info_with_histograms(
+        self, create_sut, mock_log, histogram
+    ) -> None:
+        sut = create_sut()
+
+        with patch("structlog.get_logger", return_value=mock_log):
+            sut.log_latency_summary({"RackChangedEvent": {"total": histogram}})
+
+            mock_log.info.assert_called_once_with(
+                "event_latency_summary",
+                bucket_bounds_ms=[1, 2, 5, 10, 20, 50, 100, 200, 500, 1000],
+                events={
+                    "RackChangedEvent": {
+                        "total": {
+                            "count": 2,
+                            "mean_ms": 2.0,
+                            "p50_ms": 2,
+                            "p95_ms": 2.5,
+                            "max_ms": 2.5,
+                            "buckets": [0, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0],
+                        }
+                    }
+                },
+            )
+
+    def test_when_not_debug__does_not_log(self, create_sut, mock_log, histogram) -> None:
+        sut = create_sut(debug=False)
+
+        with patch("structlog.get_logger", return_value=mock_log):
+            sut.log_latency_summary({"RackChangedEvent": {"total": histogram}})
+
+            mock_log.info.assert_not_called()
+
+
+class TestLogFrameOutput:
+    def test_when_debug__logs_info_with_counters(self, create_sut, mock_log) -> None:
+        sut = create_sut()
+
+        with patch("structlog.get_logger", return_value=mock_log):
+            sut.log_frame_output(
+                FrameStats(screen="game", bytes_written=10, escapes=3, flushes=1)
+            )
+
+            mock_log.info.assert_called_once_with(
+                "frame_output", screen="game", bytes_written=10, escapes=3, flushes=1
+            )
+
+    def test_when_not_debug__does_not_log(self, create_sut, mock_log) -> None:
+        sut = create_sut(debug=False)
+
+        with patch("structlog.get_logger", return_value=mock_log):
+            sut.log_frame_output(
+                FrameStats(screen="game", bytes_written=10, escapes=3, flushes=1)
+            )
+
+            mock_log.info.assert_not_called()
+
+
+class TestLogOutputStats:
+    def test_when_debug__logs_info_with_totals_and_screens(
+        self, create_sut, mock_log
+    ) -> None:
+        sut = create_sut()
+        stats = OutputStats(bytes_written=10, escapes=3, flushes=4, frames=4)
+        fields = {
+            "bytes_written": 10,
+            "escapes": 3,
+            "flushes": 4,
+            "frames": 4,
+            "bytes_per_frame": 2.5,
+        }
+
+        with patch("structlog.get_logger", return_value=mock_log):
+            sut.log_output_stats(
+                stats, screen_stats={"game": stats}, profile=RenderProfile.COLORS_16
+            )
+
+            mock_log.info.assert_called_once_with(
+                "output_stats", profile="16", **fields, screens={"game": fields}
+            )
+
+    def test_when_not_debug__does_not_log(self, create_sut, mock_log) -> None:
+        sut = create_sut(debug=False)
+
+        with patch("structlog.get_logger", return_value=mock_log):
+            sut.log_output_stats(
+                OutputStats(), screen_stats={}, profile=RenderProfile.COLORS_16
+            )
+
+            mock_log.info.assert_not_called()
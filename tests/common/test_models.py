@@ -3,7 +3,13 @@ from unittest.mock import Mock, call, create_autospec, patch
 
 import pytest
 
-from src.tuicub.common.models import Alert, AlertType, Gameroom, remove_gameroom
+from src.tuicub.common.models import (
+    Alert,
+    AlertType,
+    Gameroom,
+    remove_gameroom,
+    sorted_tileset,
+)
 from src.tuicub.common.views import Color, Text, TextPart
 from src.tuicub.common.views.animation import TextAnimation
 from src.tuicub.common.views.text import EMPTY_TEXT
@@ -47,6 +53,22 @@ class TestRemoveGameroom:
         assert result == expected
 
 
+class TestSortedTileset:
+    def test_places_both_figures_next_to_each_other(self) -> None:
+        expected = [0, 52, 1, 13, 65, 104, 105]
+
+        result = sorted_tileset([105, 13, 65, 1, 0, 104, 52])
+
+        assert result == expected
+
+    def test_keeps_order_of_equal_tiles(self) -> None:
+        expected = [52, 0]
+
+        result = sorted_tileset([52, 0])
+
+        assert result == expected
+
+
 class TestAlertType:
     @pytest.mark.parametrize(
         ("sut", "expected"),
@@ -0,0 +1,119 @@
+import io
+
+import pytest
+from prompt_toolkit.data_structures import Size
+
+from src.tuicub.common.output import CountingOutput, FrameStats, OutputStats
+
+
+@pytest.fixture()
+def stdout() -> io.StringIO:
+    return io.StringIO()
+
+
+@pytest.fixture()
+def sut(stdout) -> CountingOutput:
+    return CountingOutput(stdout, get_size=lambda: Size(rows=24, columns=80))
+
+
+class TestCountingOutput:
+    def test_stats__when_nothing_written__returns_zero_counters(self, sut) -> None:
+        expected = OutputStats()
+
+        result = sut.stats
+
+        assert result == expected
+
+    def test_end_frame__returns_bytes_escapes_and_flushes_of_frame(self, sut) -> None:
+        expected = FrameStats(screen="game", bytes_written=12, escapes=2, flushes=2)
+        sut.write("ab▌")
+        sut.write_raw("\x1b[0m")
+        sut.flush()
+        sut.write_raw("\x1b[?")
+        sut.flush()
+        sut.flush()
+
+        result = sut.end_frame(screen="game")
+
+        assert result == expected
+
+    def test_end_frame__when_nothing_written__returns_none(self, sut) -> None:
+        sut.flush()
+
+        result = sut.end_frame(screen="game")
+
+        assert result is None
+
+    def test_end_frame__resets_frame_counters(self, sut) -> None:
+        expected = FrameStats(screen="game", bytes_written=1, escapes=0, flushes=1)
+        sut.write("ab")
+        sut.flush()
+        sut.end_frame(screen="game")
+        sut.write("c")
+        sut.flush()
+
+        result = sut.end_frame(screen="game")
+
+        assert result == expected
+
+    def test_stats__returns_totals_of_ended_frames(self, sut) -> None:
+        expected = OutputStats(bytes_written=3, escapes=1, flushes=2, frames=2)
+        sut.write("ab")
+        sut.flush()
+        sut.end_frame(screen="game")
+        sut.write_raw("\x1b")
+        sut.flush()
+        sut.end_frame(screen="gamerooms")
+        sut.write("c")
+
+        result = sut.stats
+
+        assert result == expected
+
+    def test_screen_stats__returns_totals_by_screen(self, sut) -> None:
+        expected = {
+            "game": OutputStats(bytes_written=3, escapes=0, flushes=2, frames=2),
+            "gamerooms": OutputStats(bytes_written=1, escapes=1, flushes=1, frames=1),
+        }
+        for screen, data in (("game", "ab"), ("gamerooms", "\x1b"), ("game", "c")):
+            sut.write_raw(data)
+            sut.flush()
+            sut.end_frame(screen=screen)
+
+        result = sut.screen_stats
+
+        assert result == expected
+
+    def test_flush__writes_data_to_stdout(self, sut, stdout) -> None:
+        expected = "ab"
+        sut.write("ab")
+
+        sut.flush()
+
+        assert stdout.getvalue() == expected
+
+
+class TestOutputStats:
+    def test_bytes_per_frame__returns_average_bytes_per_frame(self) -> None:
+        expected = 2.5
+        sut = OutputStats(bytes_written=5, frames=2)
+
+        result = sut.bytes_per_frame
+
+        assert result == expected
+
+    def test_bytes_per_frame__when_no_frames__returns_zero(self) -> None:
+        expected = 0.0
+        sut = OutputStats()
+
+        result = sut.bytes_per_frame
+
+        assert result == expected
+
+    def test_add__returns_counters_with_frame_added(self) -> None:
+        expected = OutputStats(bytes_written=15, escapes=3, flushes=3, frames=2)
+        sut = OutputStats(bytes_written=10, escapes=1, flushes=2, frames=1)
+
+        result = sut.add(FrameStats(screen="game", bytes_written=5, escapes=2, flushes=1))
+
+        assert result == expected
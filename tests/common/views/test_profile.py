@@ -0,0 +1,60 @@
+import pytest
+from prompt_toolkit.output import ColorDepth
+
+from src.tuicub.common.views.profile import RenderProfile
+
+
+class TestRenderProfile:
+    @pytest.mark.parametrize(
+        ("profile", "expected"),
+        [
+            (RenderProfile.TRUE_COLOR, ColorDepth.TRUE_COLOR),
+            (RenderProfile.COLORS_256, ColorDepth.DEPTH_8_BIT),
+            (RenderProfile.COLORS_16, ColorDepth.DEPTH_4_BIT),
+        ],
+    )
+    def test_color_depth__returns_depth_of_profile(self, profile, expected) -> None:
+        result = profile.color_depth
+
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        ("profile", "expected"),
+        [
+            (RenderProfile.TRUE_COLOR, False),
+            (RenderProfile.COLORS_256, True),
+            (RenderProfile.COLORS_16, True),
+        ],
+    )
+    def test_is_reduced__returns_whether_profile_reduced(self, profile, expected) -> None:
+        result = profile.is_reduced
+
+        assert result == expected
+
+    def test_quantize__when_true_color__returns_unchanged_hex(self) -> None:
+        expected = "#ebdbb2"
+
+        result = RenderProfile.TRUE_COLOR.quantize("#ebdbb2")
+
+        assert result == expected
+
+    def test_quantize__when_256_colors__returns_closest_palette_hex(self) -> None:
+        expected = "#d7d7af"
+
+        result = RenderProfile.COLORS_256.quantize("#ebdbb2")
+
+        assert result == expected
+
+    def test_quantize__when_16_colors__returns_closest_ansi_color(self) -> None:
+        expected = "ansired"
+
+        result = RenderProfile.COLORS_16.quantize("#d6070f")
+
+        assert result == expected
+
+    def test_quantize__when_closest_excluded__returns_next_closest(self) -> None:
+        expected = "ansibrightblack"
+
+        result = RenderProfile.COLORS_16.quantize("#191b1c", exclude="ansiblack")
+
+        assert result == expected
@@ -1,6 +1,7 @@
 import pytest
 
 from src.tuicub.common.views.color import Color, Theme, is_colors_map, to_framework_bg
+from src.tuicub.common.views.profile import RenderProfile
 
 
 @pytest.fixture()
@@ -25,6 +26,74 @@ class TestTheme:
 
         assert result == expected
 
+    def test_style__returns_same_string_object_for_every_lookup(self, sut) -> None:
+        expected = sut.style(fg=Color.FG1, bg=Color.BG3)
+
+        result = sut.style(fg=Color.FG1, bg=Color.BG3)
+
+        assert result is expected
+
+    def test_to_framework_fg__returns_framework_fg_string(self, sut) -> None:
+        expected = "fg:#ebdbb2 "
+
+        result = sut.to_framework_fg(Color.FG1)
+
+        assert result == expected
+
+    def test_to_framework_bg__returns_framework_bg_string(self, sut) -> None:
+        expected = "bg:#282828 "
+
+        result = sut.to_framework_bg(Color.BG3)
+
+        assert result == expected
+
+    def test_when_custom_colors_map__uses_custom_and_default_colors(self) -> None:
+        expected = "fg:#123456 bg:#282828 "
+        sut = Theme(colors_map={"fg1": "#123456"})  # type: ignore
+
+        result = sut.style(fg=Color.FG1, bg=Color.BG3)
+
+        assert result == expected
+
+    def test_default__returns_shared_theme(self) -> None:
+        expected = Theme.default()
+
+        result = Theme.default()
+
+        assert result is expected
+
+    def test_profile__returns_render_profile(self) -> None:
+        expected = RenderProfile.COLORS_256
+        sut = Theme(profile=RenderProfile.COLORS_256)
+
+        result = sut.profile
+
+        assert result == expected
+
+    def test_when_16_colors_profile__uses_ansi_colors(self) -> None:
+        expected = "fg:ansired bg:ansigray "
+        sut = Theme(profile=RenderProfile.COLORS_16)
+
+        result = sut.style(fg=Color.TILE_RED, bg=Color.TILE_BG)
+
+        assert result == expected
+
+    def test_when_256_colors_profile__uses_palette_colors(self) -> None:
+        expected = "fg:#d70000 bg:#d7d7af "
+        sut = Theme(profile=RenderProfile.COLORS_256)
+
+        result = sut.style(fg=Color.TILE_RED, bg=Color.TILE_BG)
+
+        assert result == expected
+
+    def test_when_fg_mapped_onto_bg__uses_next_closest_fg(self) -> None:
+        expected = "fg:ansibrightblack bg:ansiblack "
+        sut = Theme(profile=RenderProfile.COLORS_16)
+
+        result = sut.style(fg=Color.BG7, bg=Color.BG2)
+
+        assert result == expected
+
 
 class TestToFrameworkBg:
     def test_when_color_none__returns_empty_string(self, theme) -> None:
@@ -16,7 +16,7 @@ from pydepot import Store
 
 from src.tuicub.app.state import AppState
 from src.tuicub.common.cache import Cache
-from src.tuicub.common.config import Config
+from src.tuicub.common.config import Config, Packing
 from src.tuicub.common.confirmation import ConfirmationService
 from src.tuicub.common.confirmation.module import ConfirmationModule
 from src.tuicub.common.events.module import EventsModule
@@ -38,13 +38,16 @@ from src.tuicub.common.services.auth_service import AuthService
 from src.tuicub.common.services.module import ServicesModule
 from src.tuicub.common.state import State
 from src.tuicub.common.state.module import StateModule
-from src.tuicub.common.views import Theme
+from src.tuicub.common.views import RenderProfile, Theme
 
 
 @pytest.fixture()
 def config() -> Config:
     config = create_autospec(Config)
     config.api_url = "http://localhost:5000"
+    config.max_fps = 60
+    config.render_profile = RenderProfile.TRUE_COLOR
+    config.packing = Packing.PRESERVE
     return config
 
 
@@ -94,7 +97,9 @@ def confirmation_module() -> ConfirmationModule:
 
 @pytest.fixture()
 def theme() -> Theme:
-    return create_autospec(Theme)
+    theme = create_autospec(Theme)
+    theme.profile = RenderProfile.TRUE_COLOR
+    return theme
 
 
 @pytest.fixture()
@@ -0,0 +1,61 @@
+import pytest
+
+from src.tuicub.game.actions import (
+    EndJumpAction,
+    EndJumpReducer,
+    SetJumpQueryAction,
+    SetJumpQueryReducer,
+)
+from src.tuicub.game.state import GameScreenState
+
+
+class TestSetJumpQueryReducer:
+    @pytest.fixture()
+    def sut(self) -> SetJumpQueryReducer:
+        return SetJumpQueryReducer()
+
+    def test_action_type__returns_set_jump_query_action(self, sut) -> None:
+        expected = SetJumpQueryAction
+
+        result = sut.action_type
+
+        assert result == expected
+
+    def test_apply__returns_state_with_new_query(self, sut) -> None:
+        current = GameScreenState(jump_query="b")
+        expected = GameScreenState(jump_query="b1")
+
+        result = sut.apply(SetJumpQueryAction(query="b1"), state=current)
+
+        assert result == expected
+
+
+class TestEndJumpReducer:
+    @pytest.fixture()
+    def sut(self) -> EndJumpReducer:
+        return EndJumpReducer()
+
+    def test_action_type__returns_end_jump_action(self, sut) -> None:
+        expected = EndJumpAction
+
+        result = sut.action_type
+
+        assert result == expected
+
+    def test_apply__with_tile__returns_state_with_tile_highlighted(
+        self, sut, tile
+    ) -> None:
+        current = GameScreenState(jump_query="b1", highlighted_tile=tile(1))
+        expected = GameScreenState(jump_query=None, highlighted_tile=tile(13))
+
+        result = sut.apply(EndJumpAction(tile=tile(13)), state=current)
+
+        assert result == expected
+
+    def test_apply__without_tile__keeps_highlighted_tile(self, sut, tile) -> None:
+        current = GameScreenState(jump_query="b1", highlighted_tile=tile(1))
+        expected = GameScreenState(jump_query=None, highlighted_tile=tile(1))
+
+        result = sut.apply(EndJumpAction(), state=current)
+
+        assert result == expected
@@ -2,9 +2,14 @@ from unittest.mock import Mock, create_autospec
 
 import pytest
 
-from src.tuicub.game.actions import SetHighlightedTileAction, SetHighlightedTilesetAction
+from src.tuicub.game.actions import (
+    EndJumpAction,
+    SetHighlightedTileAction,
+    SetHighlightedTilesetAction,
+    SetJumpQueryAction,
+)
 from src.tuicub.game.interactors.scroll import ScrollInteractor
-from src.tuicub.game.models import ScrollDirection, SelectionMode
+from src.tuicub.game.models import Color, ScrollDirection, SelectionMode, TileSpec
 from src.tuicub.game.services.scroll_service import ScrollService
 from src.tuicub.game.state import GameScreenState
 
@@ -61,3 +66,74 @@ class TestScroll:
         sut.scroll(direction=ScrollDirection.UP)
 
         local_store.dispatch.assert_not_called()
+
+
+class TestJump:
+    def test_start_jump__dispatches_empty_query(self, sut, local_store) -> None:
+        expected = SetJumpQueryAction(query="")
+
+        sut.start_jump()
+
+        local_store.dispatch.assert_called_once_with(expected)
+
+    def test_type_jump__when_spec_extendable__dispatches_query(
+        self, sut, local_store
+    ) -> None:
+        local_store.state = GameScreenState(jump_query="b")
+        expected = SetJumpQueryAction(query="b1")
+
+        sut.type_jump(text="1")
+
+        local_store.dispatch.assert_called_once_with(expected)
+
+    def test_type_jump__when_spec_complete__jumps_to_tile(
+        self, sut, scroll_service, local_store, tile
+    ) -> None:
+        local_store.state = GameScreenState(jump_query="b")
+        scroll_service.jump_to_tile = Mock(return_value=tile(19))
+        expected = EndJumpAction(tile=tile(19))
+
+        sut.type_jump(text="7")
+
+        scroll_service.jump_to_tile.assert_called_once_with(
+            spec=TileSpec(color=Color.BLUE, number=7), state=local_store.state
+        )
+        local_store.dispatch.assert_called_once_with(expected)
+
+    def test_type_jump__when_spec_invalid__does_not_dispatch(
+        self, sut, local_store
+    ) -> None:
+        local_store.state = GameScreenState(jump_query="b")
+
+        sut.type_jump(text="b")
+
+        local_store.dispatch.assert_not_called()
+
+    def test_confirm_jump__when_spec_complete__jumps_to_tile(
+        self, sut, scroll_service, local_store, tile
+    ) -> None:
+        local_store.state = GameScreenState(jump_query="r1")
+        scroll_service.jump_to_tile = Mock(return_value=tile(0))
+        expected = EndJumpAction(tile=tile(0))
+
+        sut.confirm_jump()
+
+        local_store.dispatch.assert_called_once_with(expected)
+
+    def test_confirm_jump__when_spec_incomplete__ends_jump(
+        self, sut, scroll_service, local_store
+    ) -> None:
+        local_store.state = GameScreenState(jump_query="r")
+        expected = EndJumpAction()
+
+        sut.confirm_jump()
+
+        scroll_service.jump_to_tile.assert_not_called()
+        local_store.dispatch.assert_called_once_with(expected)
+
+    def test_cancel_jump__ends_jump(self, sut, local_store) -> None:
+        expected = EndJumpAction()
+
+        sut.cancel_jump()
+
+        local_store.dispatch.assert_called_once_with(expected)
@@ -1,59 +1,66 @@
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, create_autospec
 
 import pytest
 
+from src.tuicub.game.models import Board
 from src.tuicub.game.services.board_service import BoardService
+from src.tuicub.game.services.packing import PackingStrategy
 
 
 @pytest.fixture()
-def sut(cache, screen_size_service) -> BoardService:
-    return BoardService(cache=cache, screen_size_service=screen_size_service)
+def strategy() -> PackingStrategy:
+    return create_autospec(PackingStrategy)
+
+
+@pytest.fixture()
+def sut(cache, screen_size_service, strategy) -> BoardService:
+    return BoardService(
+        cache=cache, screen_size_service=screen_size_service, strategy=strategy
+    )
 
 
 class TestCreateRows:
-    def test_when_cached__returns_cached_value(
-        self, sut, cache, screen_size_service, tileset
+    def test_when_cached__returns_cached_value_remembered_by_strategy(
+        self, sut, cache, screen_size_service, strategy, tileset
     ) -> None:
         screen_size_service.width.return_value = 42
-        board = frozenset({tileset(1, 2, 3), tileset(4, 5, 6)})
-        key = hash((board, 42))
+        board = Board(tilesets=frozenset({tileset(1, 2, 3), tileset(4, 5, 6)}))
+        key = (board.fingerprint, 42)
+        cached = ((tileset(4, 5, 6), tileset(1, 2, 3)),)
         expected = Mock()
-        cache.get = Mock(return_value=expected)
+        cache.get = Mock(return_value=cached)
+        strategy.remember.return_value = expected
 
         result = sut.create_rows(board=board)
 
         assert result == expected
         cache.get.assert_called_once_with(key, default=None)
+        strategy.remember.assert_called_once_with(rows=cached, width=42)
 
-    def test_when_not_cached__returns_result_of_bin_packing(
-        self, sut, cache, screen_size_service, tileset
+    def test_when_not_cached__returns_rows_packed_by_strategy(
+        self, sut, cache, screen_size_service, strategy, tileset
     ) -> None:
-        with patch(
-            "binpacking.to_constant_volume",
-            return_value=[{tileset(1, 2, 3): 42}, {tileset(4, 5, 6): 42}],
-        ):
-            screen_size_service.width.return_value = 42
-            board = frozenset({tileset(1, 2, 3), tileset(4, 5, 6)})
-            cache.get = Mock(return_value=None)
-            expected = ((tileset(1, 2, 3),), (tileset(4, 5, 6),))
+        screen_size_service.width.return_value = 42
+        board = Board(tilesets=frozenset({tileset(1, 2, 3), tileset(4, 5, 6)}))
+        cache.get = Mock(return_value=None)
+        expected = ((tileset(1, 2, 3),), (tileset(4, 5, 6),))
+        strategy.pack.return_value = expected
 
-            result = sut.create_rows(board=board)
+        result = sut.create_rows(board=board)
 
-            assert result == expected
+        assert result == expected
+        strategy.pack.assert_called_once_with(board.tilesets, width=42)
 
     def test_when_not_cached__caches_result(
-        self, sut, cache, screen_size_service, tileset
+        self, sut, cache, screen_size_service, strategy, tileset
     ) -> None:
-        with patch(
-            "binpacking.to_constant_volume",
-            return_value=[{tileset(1, 2, 3): 42}, {tileset(4, 5, 6): 42}],
-        ):
-            screen_size_service.width.return_value = 42
-            board = frozenset({tileset(1, 2, 3), tileset(4, 5, 6)})
-            key = hash((board, 42))
-            cache.get = Mock(return_value=None)
-            expected = ((tileset(1, 2, 3),), (tileset(4, 5, 6),))
-
-            sut.create_rows(board=board)
-
-            cache.set.assert_called_once_with(key, expected)
+        screen_size_service.width.return_value = 42
+        board = Board(tilesets=frozenset({tileset(1, 2, 3), tileset(4, 5, 6)}))
+        key = (board.fingerprint, 42)
+        cache.get = Mock(return_value=None)
+        expected = ((tileset(1, 2, 3),), (tileset(4, 5, 6),))
+        strategy.pack.return_value = expected
+
+        sut.create_rows(board=board)
+
+        cache.set.assert_called_once_with(key, expected)
@@ -51,6 +51,38 @@ class TestScroll:
         scroll_interactor.scroll.assert_called_once_with(direction=ScrollDirection.RIGHT)
 
 
+class TestJump:
+    def test_start_jump__calls_scroll_interactor(
+        self, sut, event, scroll_interactor
+    ) -> None:
+        sut.start_jump(event)
+
+        scroll_interactor.start_jump.assert_called_once_with()
+
+    def test_type_jump__calls_scroll_interactor_with_key_data(
+        self, sut, event, scroll_interactor
+    ) -> None:
+        event.data = "b"
+
+        sut.type_jump(event)
+
+        scroll_interactor.type_jump.assert_called_once_with(text="b")
+
+    def test_confirm_jump__calls_scroll_interactor(
+        self, sut, event, scroll_interactor
+    ) -> None:
+        sut.confirm_jump(event)
+
+        scroll_interactor.confirm_jump.assert_called_once_with()
+
+    def test_cancel_jump__calls_scroll_interactor(
+        self, sut, event, scroll_interactor
+    ) -> None:
+        sut.cancel_jump(event)
+
+        scroll_interactor.cancel_jump.assert_called_once_with()
+
+
 class TestToggleTileSelected:
     def test_dispatches_toggle_tile_selected_action_to_local_store(
         self, sut, event, local_store
@@ -13,6 +13,10 @@ from src.tuicub.common.strings import (
     GAME_DRAW_KEY_TOOLTIP,
     GAME_END_TURN_KEY_TOOLTIP,
     GAME_FINISH_GAME_KEY_TOOLTIP,
+    GAME_JUMP_CANCEL_KEY_TOOLTIP,
+    GAME_JUMP_CONFIRM_KEY_TOOLTIP,
+    GAME_JUMP_KEY_TOOLTIP,
+    GAME_JUMP_TYPE_KEY_TOOLTIP,
     GAME_MOVE_MODE_KEY_TOOLTIP,
     GAME_MOVE_TILES_KEY_TOOLTIP,
     GAME_REDO_KEY_TOOLTIP,
@@ -27,6 +31,7 @@ from src.tuicub.game.keybinds import (
     HasTurnNoWinnerTilesetsSelectionMode,
     HasTurnNoWinnerTilesSelectionMode,
     HasWinner,
+    IsJumping,
 )
 from src.tuicub.game.models import ScrollDirection, SelectionMode
 from src.tuicub.game.state import GameScreenState
@@ -43,6 +48,7 @@ def state(user_1) -> Callable[[bool, bool], GameScreenState]:
         has_turn: bool = True,
         has_winner: bool = False,
         selection_mode: SelectionMode = SelectionMode.TILES,
+        jump_query: str | None = None,
     ) -> GameScreenState:
         player = Player(
             user_id=user_1.id, name=user_1.name, tiles_count=42, has_turn=has_turn
@@ -51,6 +57,7 @@ def state(user_1) -> Callable[[bool, bool], GameScreenState]:
             players=(player,),
             winner=player if has_winner else None,
             selection_mode=selection_mode,
+            jump_query=jump_query,
         )
 
     return factory
@@ -149,6 +156,30 @@ class TestKeybinds:
                 tooltip=GAME_FINISH_GAME_KEY_TOOLTIP,
                 action=controller.finish_game,
             ),
+            Keybind(
+                key="/",
+                display_key="/",
+                tooltip=GAME_JUMP_KEY_TOOLTIP,
+                action=controller.start_jump,
+            ),
+            Keybind(
+                key=("r", "y", "b", "k", "j", *"0123456789"),
+                display_key="b7",
+                tooltip=GAME_JUMP_TYPE_KEY_TOOLTIP,
+                action=controller.type_jump,
+            ),
+            Keybind(
+                key="c-m",
+                display_key="enter",
+                tooltip=GAME_JUMP_CONFIRM_KEY_TOOLTIP,
+                action=controller.confirm_jump,
+            ),
+            Keybind(
+                key="escape",
+                display_key="esc",
+                tooltip=GAME_JUMP_CANCEL_KEY_TOOLTIP,
+                action=controller.cancel_jump,
+            ),
         ]
 
         result = sut.keybinds()
@@ -319,6 +350,54 @@ class TestKeybinds:
 
         assert isinstance(keybind.condition, HasWinner)
 
+    def test_jump__starts_jump(self, sut, event, controller) -> None:
+        keybind = sut.keybinds()[13]
+
+        keybind.action(event)
+
+        controller.start_jump.assert_called_once()
+
+    def test_jump__condition_is_has_turn_no_winner_tiles_selection(self, sut) -> None:
+        keybind = sut.keybinds()[13]
+
+        assert isinstance(keybind.condition, HasTurnNoWinnerTilesSelectionMode)
+
+    def test_jump_type__types_jump(self, sut, event, controller) -> None:
+        keybind = sut.keybinds()[14]
+
+        keybind.action(event)
+
+        controller.type_jump.assert_called_once()
+
+    def test_jump_type__condition_is_jumping(self, sut) -> None:
+        keybind = sut.keybinds()[14]
+
+        assert isinstance(keybind.condition, IsJumping)
+
+    def test_jump_confirm__confirms_jump(self, sut, event, controller) -> None:
+        keybind = sut.keybinds()[15]
+
+        keybind.action(event)
+
+        controller.confirm_jump.assert_called_once()
+
+    def test_jump_confirm__condition_is_jumping(self, sut) -> None:
+        keybind = sut.keybinds()[15]
+
+        assert isinstance(keybind.condition, IsJumping)
+
+    def test_jump_cancel__cancels_jump(self, sut, event, controller) -> None:
+        keybind = sut.keybinds()[16]
+
+        keybind.action(event)
+
+        controller.cancel_jump.assert_called_once()
+
+    def test_jump_cancel__condition_is_jumping(self, sut) -> None:
+        keybind = sut.keybinds()[16]
+
+        assert isinstance(keybind.condition, IsJumping)
+
 
 class TestHasTurnNoWinner:
     @pytest.fixture()
@@ -360,6 +439,45 @@ class TestHasTurnNoWinner:
 
         assert result == expected
 
+    def test_when_jumping__is_false(self, sut, state, local_store) -> None:
+        local_store.state = state(has_turn=True, has_winner=False, jump_query="b")
+        expected = False
+
+        result = sut()
+
+        assert result == expected
+
+
+class TestIsJumping:
+    @pytest.fixture()
+    def sut(self, store, user_1, local_store) -> IsJumping:
+        store.state = State(current_user=user_1)
+        return IsJumping(store=store, local_store=local_store)
+
+    def test_when_has_turn__jumping__is_true(self, sut, state, local_store) -> None:
+        local_store.state = state(has_turn=True, jump_query="")
+        expected = True
+
+        result = sut()
+
+        assert result == expected
+
+    def test_when_has_turn__not_jumping__is_false(self, sut, state, local_store) -> None:
+        local_store.state = state(has_turn=True, jump_query=None)
+        expected = False
+
+        result = sut()
+
+        assert result == expected
+
+    def test_when_has_no_turn__jumping__is_false(self, sut, state, local_store) -> None:
+        local_store.state = state(has_turn=False, jump_query="b")
+        expected = False
+
+        result = sut()
+
+        assert result == expected
+
 
 class TestHasTurnNoWinnerTilesSelectionMode:
     @pytest.fixture()
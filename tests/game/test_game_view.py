@@ -108,6 +108,27 @@ class TestGameWidgetFactory:
 
         assert result == expected
 
+    def test_create__when_generation_unchanged__returns_retained_widget(
+        self, sut: GameWidgetFactory, viewmodel
+    ) -> None:
+        viewmodel.generation = 1
+        expected = sut.create()
+
+        result = sut.create()
+
+        assert result is expected
+
+    def test_create__when_generation_changed__returns_new_widget(
+        self, sut: GameWidgetFactory, viewmodel
+    ) -> None:
+        viewmodel.generation = 1
+        previous = sut.create()
+        viewmodel.generation = 2
+
+        result = sut.create()
+
+        assert result is not previous
+
 
 class TestGameRootView:
     @pytest.fixture()
@@ -177,8 +198,10 @@ class TestGameRootView:
             z_index=0,
         )
 
-        game_widget.render.assert_called_once_with(
-            renderer=renderer, screen=screen, frame=Frame(x=0, y=0, width=10, height=10)
+        renderer.render_root.assert_called_once_with(
+            widget=game_widget,
+            screen=screen,
+            frame=Frame(x=0, y=0, width=10, height=10),
         )
 
 
@@ -2,11 +2,17 @@ from collections.abc import Callable
 from unittest.mock import create_autospec
 
 import pytest
+from cacheout import Cache as Cacheout  # type: ignore
+from prompt_toolkit.renderer import Output, Size
 from pydepot import Store
 
+from src.tuicub.common.cache import Cache
+from src.tuicub.common.latency import LatencyTracer
 from src.tuicub.common.models import Player
-from src.tuicub.game.models import SelectionMode
+from src.tuicub.common.services.screen_size_service import ScreenSizeService
+from src.tuicub.game.models import Board, SelectionMode
 from src.tuicub.game.services.board_service import BoardService
+from src.tuicub.game.services.packing import PreservingPacking
 from src.tuicub.game.services.scroll_service import ScrollService
 from src.tuicub.game.state import GameScreenState
 from src.tuicub.game.viewmodel import GameViewModel
@@ -64,12 +70,18 @@ def store(local_store) -> Store[GameScreenState]:
 
 @pytest.fixture()
 def sut(
-    board_service, scroll_service, store, user_id_1, events_observer
+    board_service,
+    scroll_service,
+    screen_size_service,
+    store,
+    user_id_1,
+    events_observer,
 ) -> GameViewModel:
     return GameViewModel(
         board_service=board_service,
         events_observer=events_observer,
         scroll_service=scroll_service,
+        screen_size_service=screen_size_service,
         store=store,
         user_id=user_id_1,
     )
@@ -311,6 +323,137 @@ class TestStatusBar:
         assert result == expected
 
 
+class TestGeneration:
+    def test_initial_generation_is_zero(self, sut) -> None:
+        expected = 0
+
+        result = sut.generation
+
+        assert result == expected
+
+    def test_on_state__increments_generation(self, sut) -> None:
+        expected = 2
+
+        sut.on_state(GameScreenState())
+        sut.on_state(GameScreenState(pile_count=42))
+        result = sut.generation
+
+        assert result == expected
+
+
+class TestTracing:
+    def test_on_state__stamps_events_as_rebuilt(
+        self,
+        board_service,
+        scroll_service,
+        screen_size_service,
+        store,
+        user_id_1,
+        events_observer,
+    ) -> None:
+        tracer = create_autospec(LatencyTracer)
+        sut = GameViewModel(
+            board_service=board_service,
+            events_observer=events_observer,
+            scroll_service=scroll_service,
+            screen_size_service=screen_size_service,
+            store=store,
+            user_id=user_id_1,
+            tracer=tracer,
+        )
+
+        sut.on_state(GameScreenState())
+
+        tracer.rebuilt.assert_called_once()
+
+
+class TestResize:
+    @pytest.fixture()
+    def output(self) -> Output:
+        return create_autospec(Output)
+
+    @pytest.fixture()
+    def set_columns(self, output) -> Callable[[int], None]:
+        def factory(columns: int) -> None:
+            size = create_autospec(Size)
+            size.columns = columns
+            output.get_size.return_value = size
+
+        return factory
+
+    @pytest.fixture()
+    def screen_size_service(self, output) -> ScreenSizeService:
+        return ScreenSizeService(output=output)
+
+    @pytest.fixture()
+    def sut(
+        self,
+        screen_size_service,
+        scroll_service,
+        store,
+        user_id_1,
+        events_observer,
+        tileset,
+    ) -> GameViewModel:
+        store.state = GameScreenState(
+            board=Board(
+                tilesets=frozenset({tileset(1, 2, 3), tileset(4, 5, 6), tileset(7, 8, 9)})
+            )
+        )
+        return GameViewModel(
+            board_service=BoardService(
+                cache=Cache(cache_engine=Cacheout(maxsize=16)),
+                screen_size_service=screen_size_service,
+                strategy=PreservingPacking(),
+            ),
+            events_observer=events_observer,
+            scroll_service=scroll_service,
+            screen_size_service=screen_size_service,
+            store=store,
+            user_id=user_id_1,
+        )
+
+    def test_when_resize_settled__repacks_board_for_new_width(
+        self, sut, store, screen_size_service, set_columns
+    ) -> None:
+        set_columns(200)
+        sut.subscribe()
+        sut.on_state(store.state)
+        set_columns(20)
+
+        screen_size_service.did_resize()
+        result = sut.board
+
+        assert len(result) == 3
+
+    def test_when_resize_settled__updates_scroll_maps(
+        self, sut, store, screen_size_service, set_columns, scroll_service
+    ) -> None:
+        set_columns(200)
+        sut.subscribe()
+        sut.on_state(store.state)
+        scroll_service.reset_mock()
+        set_columns(20)
+
+        screen_size_service.did_resize()
+
+        scroll_service.update_scroll_maps.assert_called_once()
+
+    def test_when_unsubscribed__does_not_repack_board(
+        self, sut, store, screen_size_service, set_columns
+    ) -> None:
+        set_columns(200)
+        sut.subscribe()
+        sut.on_state(store.state)
+        sut.unsubscribe()
+        set_columns(20)
+
+        screen_size_service.did_resize()
+        result = sut.board
+
+        assert len(result) == 1
+
+
 class TestSubscribe:
     def test_subscribes_to_store_and_starts_events_observer(
         self, sut, store, events_observer
@@ -320,6 +463,11 @@ class TestSubscribe:
         store.subscribe.assert_called_once_with(sut, include_current=True)
         events_observer.observe.assert_called_once()
 
+    def test_subscribes_to_screen_size_service(self, sut, screen_size_service) -> None:
+        sut.subscribe()
+
+        screen_size_service.subscribe.assert_called_once_with(sut)
+
 
 class TestUnsubscribe:
     def test_unsubscribes_from_store_and_stops_events_observer(
@@ -329,3 +477,10 @@ class TestUnsubscribe:
 
         store.unsubscribe.assert_called_once_with(sut)
         events_observer.stop.assert_called_once()
+
+    def test_unsubscribes_from_screen_size_service(
+        self, sut, screen_size_service
+    ) -> None:
+        sut.unsubscribe()
+
+        screen_size_service.unsubscribe.assert_called_once_with(sut)
@@ -1,5 +1,22 @@
+import pytest
+
 from src.tuicub.common.views import Color as UIColor
-from src.tuicub.game.models import Color, Tile, Tileset
+from src.tuicub.game.models import (
+    TILE_COLORS,
+    TILE_FIGURES,
+    TILE_IS_JOKER,
+    TILE_NUMBERS,
+    TILE_UI_COLORS,
+    TILE_UI_SELECTED_COLORS,
+    TILES,
+    Board,
+    Color,
+    Tile,
+    Tileset,
+    TileSpec,
+    mask_of,
+    tile_ids_of,
+)
 
 
 class TestColor:
@@ -77,6 +94,35 @@ class TestTile:
 
         assert result == expected
 
+    @pytest.mark.parametrize(("tile_id", "expected"), [(0, False), (104, True)])
+    def test_is_joker__returns_whether_tile_is_joker(
+        self, tile_id: int, expected: bool
+    ) -> None:
+        result = Tile.from_id(tile_id).is_joker()
+
+        assert result == expected
+
+
+def test_tile_tables__return_attributes_of_tiles_by_id() -> None:
+    expected = [
+        (t.number, t.color, t.figure, t.color.ui_color, t.color.ui_selected_color)
+        for t in TILES
+    ]
+
+    result = list(
+        zip(
+            TILE_NUMBERS,
+            TILE_COLORS,
+            TILE_FIGURES,
+            TILE_UI_COLORS,
+            TILE_UI_SELECTED_COLORS,
+            strict=True,
+        )
+    )
+
+    assert result == expected
+    assert [i for i, is_joker in enumerate(TILE_IS_JOKER) if is_joker] == [104, 105]
+
 
 class TestTileset:
     def test_str__returns_correct_string(self) -> None:
@@ -86,3 +132,203 @@ class TestTileset:
         result = str(sut)
 
         assert result == expected
+
+    def test_fingerprint__returns_tile_ids_in_order(self) -> None:
+        expected = bytes([3, 1, 2])
+        sut = Tileset.from_tile_ids([3, 1, 2])
+
+        result = sut.fingerprint
+
+        assert result == expected
+
+    def test_eq__ignores_fingerprint(self) -> None:
+        sut = Tileset.from_tile_ids([1, 2, 3])
+
+        result = sut == Tileset.from_tile_ids([1, 2, 3])
+
+        assert result
+
+    def test_from_tile_ids__when_equal_ids__returns_same_instance(self) -> None:
+        expected = Tileset.from_tile_ids([5, 0, 2])
+
+        result = Tileset.from_tile_ids([5, 0, 2])
+
+        assert result is expected
+
+    def test_from_tile_ids__when_other_order__returns_other_tileset(self) -> None:
+        tileset = Tileset.from_tile_ids([5, 0, 2])
+
+        result = Tileset.from_tile_ids([0, 2, 5])
+
+        assert result != tileset
+
+    def test_mask__returns_bits_of_tile_ids(self) -> None:
+        expected = 0b100101
+
+        result = Tileset.from_tile_ids([5, 0, 2]).mask
+
+        assert result == expected
+
+    def test_tile_ids__returns_ids_in_order(self) -> None:
+        expected = (5, 0, 2)
+
+        result = Tileset.from_tile_ids([5, 0, 2]).tile_ids
+
+        assert result == expected
+
+    @pytest.mark.parametrize(("tile_id", "expected"), [(2, True), (3, False)])
+    def test_contains__returns_whether_tile_in_tileset(
+        self, tile_id: int, expected: bool
+    ) -> None:
+        sut = Tileset.from_tile_ids([5, 0, 2])
+
+        result = Tile.from_id(tile_id) in sut
+
+        assert result == expected
+
+
+class TestBoard:
+    def test_fingerprint__when_equal_boards__returns_equal_fingerprints(self) -> None:
+        sut = Board(
+            tilesets=frozenset(
+                {Tileset.from_tile_ids([1, 2, 3]), Tileset.from_tile_ids([40, 41, 42])}
+            )
+        )
+        other = Board(
+            tilesets=frozenset(
+                {Tileset.from_tile_ids([40, 41, 42]), Tileset.from_tile_ids([1, 2, 3])}
+            )
+        )
+
+        result = sut.fingerprint == other.fingerprint
+
+        assert result
+
+    def test_fingerprint__when_tiles_regrouped__returns_different_fingerprints(
+        self,
+    ) -> None:
+        sut = Board(
+            tilesets=frozenset(
+                {Tileset.from_tile_ids([1, 2, 3]), Tileset.from_tile_ids([4, 5, 6])}
+            )
+        )
+        other = Board(
+            tilesets=frozenset(
+                {Tileset.from_tile_ids([1, 2]), Tileset.from_tile_ids([3, 4, 5, 6])}
+            )
+        )
+
+        result = sut.fingerprint == other.fingerprint
+
+        assert not result
+
+    def test_fingerprint__when_tiles_reordered__returns_different_fingerprints(
+        self,
+    ) -> None:
+        sut = Board(tilesets=frozenset({Tileset.from_tile_ids([1, 2, 3])}))
+        other = Board(tilesets=frozenset({Tileset.from_tile_ids([3, 2, 1])}))
+
+        result = sut.fingerprint == other.fingerprint
+
+        assert not result
+
+    def test_mask__returns_bits_of_all_tile_ids(self) -> None:
+        expected = 0b1100011
+        sut = Board(
+            tilesets=frozenset(
+                (Tileset.from_tile_ids([0, 1]), Tileset.from_tile_ids([6, 5]))
+            )
+        )
+
+        result = sut.mask
+
+        assert result == expected
+
+    def test_tileset_of__returns_tileset_containing_tile(self) -> None:
+        expected = Tileset.from_tile_ids([6, 5])
+        sut = Board(tilesets=frozenset((Tileset.from_tile_ids([0, 1]), expected)))
+
+        result = sut.tileset_of(Tile.from_id(5))
+
+        assert result == expected
+
+    def test_tileset_of__when_tile_not_on_board__returns_none(self) -> None:
+        sut = Board(tilesets=frozenset((Tileset.from_tile_ids([0, 1]),)))
+
+        result = sut.tileset_of(Tile.from_id(5))
+
+        assert result is None
+
+    @pytest.mark.parametrize(("tile_id", "expected"), [(1, True), (2, False)])
+    def test_contains__returns_whether_tile_on_board(
+        self, tile_id: int, expected: bool
+    ) -> None:
+        sut = Board(tilesets=frozenset((Tileset.from_tile_ids([0, 1]),)))
+
+        result = Tile.from_id(tile_id) in sut
+
+        assert result == expected
+
+
+def test_mask_of__returns_bits_of_tile_ids() -> None:
+    expected = (1 << 105) | 1
+
+    result = mask_of([Tile.from_id(105), Tile.from_id(0)])
+
+    assert result == expected
+
+
+def test_tile_ids_of__returns_ascending_ids() -> None:
+    expected = [0, 7, 105]
+
+    result = tile_ids_of((1 << 105) | (1 << 7) | 1)
+
+    assert result == expected
+
+
+class TestTileSpec:
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("j", TileSpec()),
+            ("b7", TileSpec(color=Color.BLUE, number=7)),
+            ("k13", TileSpec(color=Color.BLACK, number=13)),
+            ("r1", TileSpec(color=Color.RED, number=1)),
+            ("y", None),
+            ("b0", None),
+            ("b14", None),
+            ("x1", None),
+            ("", None),
+        ],
+    )
+    def test_parse__returns_spec_of_complete_text(
+        self, text: str, expected: TileSpec | None
+    ) -> None:
+        result = TileSpec.parse(text)
+
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [("b", True), ("b1", True), ("b2", False), ("b13", False), ("j", False)],
+    )
+    def test_is_prefix__returns_whether_text_extendable(
+        self, text: str, expected: bool
+    ) -> None:
+        result = TileSpec.is_prefix(text)
+
+        assert result == expected
+
+    def test_tile_ids__returns_both_figures(self) -> None:
+        expected = (19, 71)
+
+        result = TileSpec(color=Color.BLUE, number=7).tile_ids()
+
+        assert result == expected
+
+    def test_tile_ids__when_joker__returns_jokers(self) -> None:
+        expected = (104, 105)
+
+        result = TileSpec().tile_ids()
+
+        assert result == expected
@@ -0,0 +1,282 @@
+import pytest
+
+from src.tuicub.common.config import Packing
+from src.tuicub.game.models import Tile, Tileset
+from src.tuicub.game.services.packing import (
+    BestFitPacking,
+    ExactPacking,
+    FirstFitPacking,
+    PreservingPacking,
+    create_packing_strategy,
+    pack_rows,
+)
+
+# Tilesets of three tiles are 14 characters wide, of four tiles 18 characters.
+WIDTH = 32
+
+
+@pytest.fixture()
+def sut() -> PreservingPacking:
+    return PreservingPacking()
+
+
+class TestPackRows:
+    def test_packs_widest_tilesets_first_into_first_fitting_row(self, tileset) -> None:
+        board = [tileset(1, 2, 3), tileset(4, 5, 6, 7), tileset(8, 9, 10)]
+        expected = (
+            (tileset(4, 5, 6, 7), tileset(1, 2, 3)),
+            (tileset(8, 9, 10),),
+        )
+
+        result = pack_rows(board, width=WIDTH)
+
+        assert result == expected
+
+    def test_when_tileset_wider_than_row__puts_it_in_own_row(self, tileset) -> None:
+        board = [tileset(1, 2, 3), tileset(4, 5, 6, 7)]
+        expected = ((tileset(4, 5, 6, 7),), (tileset(1, 2, 3),))
+
+        result = pack_rows(board, width=10)
+
+        assert result == expected
+
+    def test_result_does_not_depend_on_board_order(self, tileset) -> None:
+        board = [tileset(1, 2, 3), tileset(4, 5, 6), tileset(7, 8, 9), tileset(10, 11)]
+        expected = pack_rows(board, width=WIDTH)
+
+        result = pack_rows(reversed(board), width=WIDTH)
+
+        assert result == expected
+
+
+class TestFirstFitPacking:
+    def test_pack__returns_first_fit_rows(self, tileset) -> None:
+        board = frozenset({tileset(1, 2, 3), tileset(4, 5, 6, 7), tileset(8, 9, 10)})
+        expected = pack_rows(board, width=WIDTH)
+
+        result = FirstFitPacking().pack(board, width=WIDTH)
+
+        assert result == expected
+
+    def test_remember__returns_rows(self, tileset) -> None:
+        expected = ((tileset(1, 2, 3),),)
+
+        result = FirstFitPacking().remember(rows=expected, width=WIDTH)
+
+        assert result is expected
+
+
+class TestBestFitPacking:
+    def test_pack__packs_each_tileset_into_fullest_fitting_row(self, tileset) -> None:
+        board = frozenset(
+            {
+                tileset(0, 1, 2, 3, 4),
+                tileset(5, 6, 7, 8, 9),
+                tileset(10, 11, 12),
+                tileset(13, 14),
+                tileset(15),
+            }
+        )
+        expected = (
+            (tileset(0, 1, 2, 3, 4),),
+            (tileset(5, 6, 7, 8, 9),),
+            (tileset(10, 11, 12), tileset(13, 14), tileset(15)),
+        )
+
+        result = BestFitPacking().pack(board, width=30)
+
+        assert result == expected
+
+
+class TestExactPacking:
+    @pytest.fixture()
+    def board(self, tileset) -> frozenset:
+        return frozenset(
+            {
+                tileset(0),
+                tileset(1, 2),
+                tileset(3, 4, 5),
+                tileset(6, 7, 8, 9),
+                tileset(10, 11),
+                tileset(12),
+                tileset(13),
+            }
+        )
+
+    def test_pack__packs_into_least_rows(self, board, tileset) -> None:
+        expected = (
+            (tileset(3, 4, 5), tileset(1, 2), tileset(0), tileset(12)),
+            (tileset(6, 7, 8, 9), tileset(10, 11), tileset(13)),
+        )
+
+        result = ExactPacking().pack(board, width=36)
+
+        assert result == expected
+
+    def test_pack__when_too_many_states__returns_first_fit_rows(self, board) -> None:
+        expected = pack_rows(board, width=36)
+
+        result = ExactPacking(max_states=10).pack(board, width=36)
+
+        assert result == expected
+
+    def test_pack__when_tileset_wider_than_row__returns_first_fit_rows(
+        self, board
+    ) -> None:
+        expected = pack_rows(board, width=14)
+
+        result = ExactPacking().pack(board, width=14)
+
+        assert result == expected
+
+    def test_pack__when_board_empty__returns_no_rows(self) -> None:
+        expected = ()
+
+        result = ExactPacking().pack(frozenset(), width=36)
+
+        assert result == expected
+
+
+class TestCreatePackingStrategy:
+    @pytest.mark.parametrize(
+        ("packing", "expected"),
+        [
+            (Packing.PRESERVE, PreservingPacking),
+            (Packing.FIRST_FIT, FirstFitPacking),
+            (Packing.BEST_FIT, BestFitPacking),
+            (Packing.EXACT, ExactPacking),
+        ],
+    )
+    def test_returns_strategy_of_name(self, packing, expected) -> None:
+        result = create_packing_strategy(packing)
+
+        assert isinstance(result, expected)
+
+
+class TestPreservingPacking:
+    def test_when_first_pack__returns_packed_rows(self, sut, tileset) -> None:
+        board = frozenset({tileset(1, 2, 3), tileset(4, 5, 6), tileset(7, 8, 9)})
+        expected = pack_rows(board, width=WIDTH)
+
+        result = sut.pack(board, width=WIDTH)
+
+        assert result == expected
+
+    def test_when_equal_tilesets_are_new_instances__removes_removed_tilesets(
+        self, sut
+    ) -> None:
+        def board(*tilesets: tuple[int, ...]) -> frozenset[Tileset]:
+            return frozenset(
+                Tileset(tiles=tuple(Tile.from_id(tile) for tile in tileset))
+                for tileset in tilesets
+            )
+
+        sut.pack(board((0, 1, 2), (13, 14, 15), (26, 27, 28)), width=WIDTH)
+        sut.pack(board((0, 1, 2), (13, 14, 15), (40, 41, 42)), width=WIDTH)
+
+        result = sut.pack(board((0, 1, 2), (40, 41, 42)), width=WIDTH)
+
+        assert frozenset(tileset for row in result for tileset in row) == board(
+            (0, 1, 2), (40, 41, 42)
+        )
+
+    def test_when_tileset_removed__leaves_other_tilesets_in_place(
+        self, sut, tileset
+    ) -> None:
+        sut.remember(
+            rows=(
+                (tileset(1, 2, 3), tileset(4, 5, 6)),
+                (tileset(7, 8, 9), tileset(10, 11, 12)),
+            ),
+            width=WIDTH,
+        )
+        expected = ((tileset(4, 5, 6),), (tileset(7, 8, 9), tileset(10, 11, 12)))
+
+        result = sut.pack(
+            frozenset({tileset(4, 5, 6), tileset(7, 8, 9), tileset(10, 11, 12)}),
+            width=WIDTH,
+        )
+
+        assert result == expected
+
+    def test_when_tileset_changed__puts_new_tileset_in_its_place(
+        self, sut, tileset
+    ) -> None:
+        sut.remember(
+            rows=((tileset(1, 2, 3), tileset(4, 5, 6)), (tileset(7, 8, 9),)),
+            width=WIDTH,
+        )
+        expected = ((tileset(1, 2), tileset(4, 5, 6)), (tileset(7, 8, 9, 3),))
+
+        result = sut.pack(
+            frozenset({tileset(1, 2), tileset(4, 5, 6), tileset(7, 8, 9, 3)}),
+            width=WIDTH,
+        )
+
+        assert result == expected
+
+    def test_when_tileset_added__appends_it_to_first_fitting_row(
+        self, sut, tileset
+    ) -> None:
+        sut.remember(
+            rows=((tileset(1, 2, 3), tileset(4, 5, 6)), (tileset(7, 8, 9),)),
+            width=WIDTH,
+        )
+        expected = (
+            (tileset(1, 2, 3), tileset(4, 5, 6)),
+            (tileset(7, 8, 9), tileset(10, 11, 12)),
+        )
+
+        result = sut.pack(
+            frozenset(
+                {
+                    tileset(1, 2, 3),
+                    tileset(4, 5, 6),
+                    tileset(7, 8, 9),
+                    tileset(10, 11, 12),
+                }
+            ),
+            width=WIDTH,
+        )
+
+        assert result == expected
+
+    def test_when_tileset_fits_no_row__appends_new_row(self, sut, tileset) -> None:
+        sut.remember(rows=((tileset(1, 2, 3), tileset(4, 5, 6)),), width=WIDTH)
+        expected = ((tileset(1, 2, 3), tileset(4, 5, 6)), (tileset(7, 8, 9),))
+
+        result = sut.pack(
+            frozenset({tileset(1, 2, 3), tileset(4, 5, 6), tileset(7, 8, 9)}),
+            width=WIDTH,
+        )
+
+        assert result == expected
+
+    def test_when_row_overflows__repacks_whole_board(self, sut, tileset) -> None:
+        sut.remember(
+            rows=((tileset(1, 2, 3), tileset(4, 5, 6)), (tileset(7, 8, 9),)),
+            width=WIDTH,
+        )
+        board = frozenset({tileset(1, 2, 3), tileset(4, 5, 6, 10, 11), tileset(7, 8, 9)})
+        expected = pack_rows(board, width=WIDTH)
+
+        result = sut.pack(board, width=WIDTH)
+
+        assert result == expected
+
+    def test_when_width_changes__repacks_whole_board(self, sut, tileset) -> None:
+        sut.remember(rows=((tileset(1, 2, 3),), (tileset(4, 5, 6),)), width=20)
+        board = frozenset({tileset(1, 2, 3), tileset(4, 5, 6)})
+        expected = pack_rows(board, width=WIDTH)
+
+        result = sut.pack(board, width=WIDTH)
+
+        assert result == expected
+
+    def test_when_board_unchanged__returns_previous_rows(self, sut, tileset) -> None:
+        expected = ((tileset(4, 5, 6), tileset(1, 2, 3)),)
+        sut.remember(rows=expected, width=WIDTH)
+
+        result = sut.pack(frozenset({tileset(1, 2, 3), tileset(4, 5, 6)}), width=WIDTH)
+
+        assert result is expected
@@ -2,9 +2,22 @@ from collections.abc import Callable
 from unittest.mock import Mock
 
 import pytest
-
-from src.tuicub.game.models import ScrollDirection, Tile, Tileset
-from src.tuicub.game.services.scroll_service import ScrollService, take_closest
+from cacheout import Cache as Cacheout  # type: ignore
+
+from src.tuicub.common.cache import Cache
+from src.tuicub.game.models import (
+    Color,
+    ScrollDirection,
+    Tile,
+    Tileset,
+    TileSpec,
+    VirtualTileset,
+)
+from src.tuicub.game.services.scroll_service import (
+    ScrollService,
+    create_tiles_index,
+    take_closest,
+)
 from src.tuicub.game.state import GameScreenState
 
 
@@ -421,23 +434,181 @@ class TestScrollTilesets:
         assert result == expected
 
 
+class TestJumpToTile:
+    def test_returns_matching_tile_closest_to_highlighted_one(
+        self, sut, tile, highlighted_tile
+    ) -> None:
+        expected = tile(9)
+
+        result = sut.jump_to_tile(
+            spec=TileSpec(color=Color.RED, number=10), state=highlighted_tile(12)
+        )
+
+        assert result == expected
+
+    def test_when_no_highlighted_tile__returns_lowest_matching_tile(
+        self, sut, tile
+    ) -> None:
+        expected = tile(29)
+
+        result = sut.jump_to_tile(
+            spec=TileSpec(color=Color.YELLOW, number=4), state=GameScreenState()
+        )
+
+        assert result == expected
+
+    def test_when_no_matching_tile__returns_none(self, sut, highlighted_tile) -> None:
+        expected = None
+
+        result = sut.jump_to_tile(spec=TileSpec(), state=highlighted_tile(12))
+
+        assert result == expected
+
+
 class TestUpdateScrollMaps:
-    def test_when_maps_cached__does_not_cache_new_maps(
-        self, sut, board, cache, screen_size_service, virtual_tileset, rack
+    def test_when_layout_unchanged__reuses_indices(
+        self, sut, board, cache, virtual_tileset, rack, highlighted_tile
     ) -> None:
-        screen_size_service.width = Mock(return_value=80)
+        sut.scroll_tiles(direction=ScrollDirection.LEFT, state=highlighted_tile(2))
         cache.reset_mock()
-        cache.get = Mock(return_value=(Mock(), Mock()))
 
         sut.update_scroll_maps(board=board, virtual_tileset=virtual_tileset, rack=rack)
+        sut.scroll_tiles(direction=ScrollDirection.LEFT, state=highlighted_tile(2))
 
+        cache.get.assert_not_called()
         cache.set.assert_not_called()
 
+    def test_when_layout_changed__creates_indices_on_scroll(
+        self, sut, board, cache, virtual_tileset, tileset, tile, highlighted_tile
+    ) -> None:
+        cache.reset_mock()
+        rack = tileset(27, 28)
+
+        sut.update_scroll_maps(board=board, virtual_tileset=virtual_tileset, rack=rack)
+        cache.get.assert_not_called()
+        result = sut.scroll_tiles(
+            direction=ScrollDirection.RIGHT, state=highlighted_tile(27)
+        )
+
+        assert result == tile(28)
+        cache.set.assert_called_once()
+
+    def test_when_indices_cached__does_not_cache_new_indices(
+        self, sut, board, cache, virtual_tileset, tileset, highlighted_tile
+    ) -> None:
+        cache.reset_mock()
+        cache.get = Mock(return_value=(Mock(), Mock()))
+
+        sut.update_scroll_maps(
+            board=board, virtual_tileset=virtual_tileset, rack=tileset(27, 28)
+        )
+        sut.scroll_tiles(direction=ScrollDirection.LEFT, state=highlighted_tile(27))
+
+        cache.set.assert_not_called()
+
+    def test_when_indices_not_cached__caches_indices_by_fingerprints(
+        self, sut, board, cache, virtual_tileset, tileset, highlighted_tile
+    ) -> None:
+        cache.reset_mock()
+        rack = tileset(27, 28)
+        expected = (
+            tuple(b"\xff".join(t.fingerprint for t in row) for row in board),
+            (False, virtual_tileset.fingerprint),
+            rack.fingerprint,
+            80,
+        )
+
+        sut.update_scroll_maps(board=board, virtual_tileset=virtual_tileset, rack=rack)
+        sut.scroll_tiles(direction=ScrollDirection.LEFT, state=highlighted_tile(27))
+
+        cache.get.assert_called_once_with(expected, None)
+
+    def test_when_virtual_tileset_empty__does_not_reuse_indices_of_empty_tileset(
+        self, board, screen_size_service, rack
+    ) -> None:
+        screen_size_service.width = Mock(return_value=80)
+        sut = ScrollService(
+            cache=Cache(cache_engine=Cacheout()),
+            screen_size_service=screen_size_service,
+        )
+        state = GameScreenState(highlighted_tileset=VirtualTileset())
+        sut.update_scroll_maps(board=board, virtual_tileset=Tileset(), rack=rack)
+        sut.scroll_tiles(
+            direction=ScrollDirection.LEFT,
+            state=GameScreenState(highlighted_tile=rack.tiles[0]),
+        )
+
+        sut.update_scroll_maps(board=board, virtual_tileset=VirtualTileset(), rack=rack)
+        result = sut.scroll_tilesets(direction=ScrollDirection.UP, state=state)
+
+        assert result == board[-1][1]
+
 
 class TestTakeClosest:
     def test_when_entries_empty__returns_none(self) -> None:
         expected = None
 
-        result = take_closest(entries=[], value=Mock())
+        result = take_closest(xs=[], x=3)
+
+        assert result == expected
+
+    def test_when_x_before_all__returns_first(self) -> None:
+        expected = 0
+
+        result = take_closest(xs=[5, 9, 13], x=1)
+
+        assert result == expected
+
+    def test_when_x_after_all__returns_last(self) -> None:
+        expected = 2
+
+        result = take_closest(xs=[5, 9, 13], x=20)
+
+        assert result == expected
+
+    def test_when_x_between__returns_closest(self) -> None:
+        expected = 2
+
+        result = take_closest(xs=[5, 9, 13], x=12)
+
+        assert result == expected
+
+    def test_when_x_equally_close__returns_left(self) -> None:
+        expected = 1
+
+        result = take_closest(xs=[5, 9, 13], x=11)
+
+        assert result == expected
+
+
+class TestScrollIndex:
+    def test_position__returns_row_and_column_from_bottom(
+        self, board, rack, tile
+    ) -> None:
+        sut = create_tiles_index(board=board, rack=rack, screen_width=80)
+        expected = (1, 2)
+
+        result = sut.position(tile(20))
+
+        assert result == expected
+
+    def test_nearest__returns_candidate_closest_to_origin(
+        self, board, tileset, tile
+    ) -> None:
+        sut = create_tiles_index(board=board, rack=tileset(61, 28), screen_width=80)
+        expected = (tile(9), tile(61))
+
+        result = (
+            sut.nearest([tile(9), tile(61)], origin=tile(12)),
+            sut.nearest([tile(9), tile(61)], origin=tile(28)),
+        )
+
+        assert result == expected
+
+    def test_position__when_not_indexed__returns_none(self, board, rack, tile) -> None:
+        sut = create_tiles_index(board=board, rack=rack, screen_width=80)
+        expected = None
+
+        result = sut.position(tile(100))
 
         assert result == expected
@@ -60,6 +60,16 @@ class TestContent:
 
         assert result == expected
 
+    def test_when_has_turn__jumping__text_is_jump_mode_with_query(self, theme) -> None:
+        sut = StatusBarViewModel(
+            selection_mode=SelectionMode.TILES, has_turn=True, jump_query="b1"
+        )
+        expected = " JUMP TO b1_ "
+
+        result = to_plain_text(sut.content(theme=theme))
+
+        assert result == expected
+
     def test_when_has_turn__selection_tiles__fg_is_fg_black__bg_is_aqua(
         self, theme
     ) -> None:
@@ -5,7 +5,11 @@ import pytest
 
 from src.tuicub.common.views import Color, Theme
 from src.tuicub.game.models import Tile
-from src.tuicub.game.viewmodels.tile import TileViewModel, VirtualTileViewModel
+from src.tuicub.game.viewmodels.tile import (
+    ASCII_TILE_GLYPHS,
+    TileViewModel,
+    VirtualTileViewModel,
+)
 
 
 @pytest.fixture()
@@ -64,6 +68,58 @@ class TestTileViewModel:
 
         assert result == expected
 
+    def test_content__when_ascii_glyph_set__returns_ascii_content(
+        self, make_sut, tile, theme
+    ) -> None:
+        expected = [
+            ("style", ".--.\n"),
+            ("style", "|"),
+            ("style", "1 "),
+            ("style", "|\n"),
+            ("style", "'--'"),
+        ]
+        theme.style.return_value = "style"
+        sut = make_sut(tile(0))
+
+        result = sut.content(
+            parent_background=Color.BG3, theme=theme, glyph_set=ASCII_TILE_GLYPHS
+        )
+
+        assert result == expected
+
+    def test_interned__when_equal_flags__returns_same_instance(self, tile) -> None:
+        expected = TileViewModel.interned(
+            tile=tile(0), is_selected=True, is_highlighted=False, is_new=False
+        )
+
+        result = TileViewModel.interned(
+            tile=tile(0), is_selected=True, is_highlighted=False, is_new=False
+        )
+
+        assert result is expected
+
+    def test_interned__when_other_flags__returns_other_instance(self, tile) -> None:
+        viewmodel = TileViewModel.interned(
+            tile=tile(0), is_selected=True, is_highlighted=False, is_new=False
+        )
+
+        result = TileViewModel.interned(
+            tile=tile(0), is_selected=False, is_highlighted=False, is_new=False
+        )
+
+        assert result != viewmodel
+
+    def test_interned__when_virtual__returns_virtual_viewmodel(self, tile) -> None:
+        TileViewModel.interned(
+            tile=tile(0), is_selected=False, is_highlighted=False, is_new=False
+        )
+
+        result = VirtualTileViewModel.interned(
+            tile=tile(0), is_selected=False, is_highlighted=False, is_new=False
+        )
+
+        assert type(result) is VirtualTileViewModel
+
 
 class TestVirtualTileViewModel:
     @pytest.fixture()
@@ -97,3 +153,22 @@ class TestVirtualTileViewModel:
         result = sut.content(parent_background=Color.BG3, theme=theme)
 
         assert result == expected
+
+    def test_content__when_ascii_glyph_set__returns_ascii_content(
+        self, make_sut, tile, theme
+    ) -> None:
+        expected = [
+            ("style", ".--.\n"),
+            ("style", "|"),
+            ("style", "  "),
+            ("style", "|\n"),
+            ("style", "'--'"),
+        ]
+        theme.style.return_value = "style"
+        sut = make_sut(tile(0))
+
+        result = sut.content(
+            parent_background=Color.BG3, theme=theme, glyph_set=ASCII_TILE_GLYPHS
+        )
+
+        assert result == expected
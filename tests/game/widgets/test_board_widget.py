@@ -1,7 +1,30 @@
+from unittest.mock import call
+
+import pytest
+
 from src.tuicub.game.widgets.base import Frame
 from src.tuicub.game.widgets.board import BoardWidget
-from src.tuicub.game.widgets.renderer import VerticalPosition
+from src.tuicub.game.widgets.overflow import OverflowDirection, OverflowWidget
+from src.tuicub.game.widgets.renderer import Position, Side, VerticalPosition
 from src.tuicub.game.widgets.row import RowWidget
+from src.tuicub.game.widgets.viewport import BoardViewport
+
+
+@pytest.fixture()
+def board(tileset_vm, tile_vm):
+    def factory(rows: int, highlighted_row: int | None = None):
+        return tuple(
+            (
+                tileset_vm(
+                    tile_vm(row * 3),
+                    tile_vm(row * 3 + 1, is_highlighted=row == highlighted_row),
+                    tile_vm(row * 3 + 2),
+                ),
+            )
+            for row in range(rows)
+        )
+
+    return factory
 
 
 class TestRender:
@@ -36,3 +59,76 @@ class TestRender:
         renderer.render_vertically.assert_called_once_with(
             rows, VerticalPosition.CENTER, frame, screen, width=42
         )
+
+
+class TestRenderOverflowing:
+    def test_renders_only_visible_rows_and_indicator_below(
+        self, board, theme, renderer, screen
+    ) -> None:
+        rows = board(rows=6)
+        frame = Frame(x=0, y=3, width=42, height=17)
+        sut = BoardWidget(board=rows, theme=theme)
+
+        sut.render(renderer=renderer, screen=screen, frame=frame)
+
+        renderer.render_vertically.assert_called_once_with(
+            tuple(RowWidget(tilesets=row, theme=theme) for row in rows[:3]),
+            VerticalPosition.CENTER,
+            Frame(x=0, y=4, width=42, height=15),
+            screen,
+            width=42,
+        )
+        renderer.render_widget.assert_called_once_with(
+            widget=OverflowWidget(count=3, direction=OverflowDirection.DOWN, theme=theme),
+            position=Position.BOTTOM,
+            side=Side.CENTER,
+            screen=screen,
+            frame=frame,
+        )
+
+    def test_when_highlighted_row_hidden__scrolls_it_into_view(
+        self, board, theme, renderer, screen
+    ) -> None:
+        rows = board(rows=6, highlighted_row=4)
+        frame = Frame(x=0, y=3, width=42, height=17)
+        sut = BoardWidget(board=rows, theme=theme)
+
+        sut.render(renderer=renderer, screen=screen, frame=frame)
+
+        assert renderer.render_vertically.call_args.args[0] == tuple(
+            RowWidget(tilesets=row, theme=theme) for row in rows[2:5]
+        )
+        assert renderer.render_widget.call_args_list == [
+            call(
+                widget=OverflowWidget(
+                    count=2, direction=OverflowDirection.UP, theme=theme
+                ),
+                position=Position.TOP,
+                side=Side.CENTER,
+                screen=screen,
+                frame=frame,
+            ),
+            call(
+                widget=OverflowWidget(
+                    count=1, direction=OverflowDirection.DOWN, theme=theme
+                ),
+                position=Position.BOTTOM,
+                side=Side.CENTER,
+                screen=screen,
+                frame=frame,
+            ),
+        ]
+
+    def test_keeps_scroll_position_of_retained_viewport(
+        self, board, theme, renderer, screen
+    ) -> None:
+        viewport = BoardViewport()
+        frame = Frame(x=0, y=3, width=42, height=17)
+        BoardWidget(
+            board=board(rows=6, highlighted_row=5), theme=theme, viewport=viewport
+        ).render(renderer=renderer, screen=screen, frame=frame)
+        sut = BoardWidget(board=board(rows=6), theme=theme, viewport=viewport)
+
+        sut.render(renderer=renderer, screen=screen, frame=frame)
+
+        assert viewport.offset == 3
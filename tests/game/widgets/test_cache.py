@@ -0,0 +1,64 @@
+import pytest
+
+from src.tuicub.common.views import Color
+from src.tuicub.game.widgets.cache import TilesetWidgetCache
+from src.tuicub.game.widgets.tileset import TilesetWidget
+
+
+@pytest.fixture()
+def sut(theme) -> TilesetWidgetCache:
+    return TilesetWidgetCache(theme=theme)
+
+
+class TestGet:
+    def test_when_not_cached__returns_new_tileset_widget(
+        self, sut, theme, tileset_vm, tile_vm
+    ) -> None:
+        viewmodel = tileset_vm(tile_vm(1), tile_vm(2), tile_vm(3))
+        expected = TilesetWidget(
+            viewmodel=viewmodel, parent_background=Color.BG2, theme=theme
+        )
+
+        result = sut.get(viewmodel=viewmodel, parent_background=Color.BG2)
+
+        assert result == expected
+
+    def test_when_equal_viewmodel_requested_after_sweep__returns_same_widget(
+        self, sut, tileset_vm, tile_vm
+    ) -> None:
+        expected = sut.get(
+            viewmodel=tileset_vm(tile_vm(1), tile_vm(2), tile_vm(3)),
+            parent_background=Color.BG2,
+        )
+        sut.sweep()
+
+        result = sut.get(
+            viewmodel=tileset_vm(tile_vm(1), tile_vm(2), tile_vm(3)),
+            parent_background=Color.BG2,
+        )
+
+        assert result is expected
+
+    def test_when_parent_background_differs__returns_different_widget(
+        self, sut, tileset_vm, tile_vm
+    ) -> None:
+        viewmodel = tileset_vm(tile_vm(1), tile_vm(2), tile_vm(3))
+        rack_widget = sut.get(viewmodel=viewmodel, parent_background=Color.BG3)
+
+        result = sut.get(viewmodel=viewmodel, parent_background=Color.BG2)
+
+        assert result is not rack_widget
+
+
+class TestSweep:
+    def test_evicts_widgets_not_requested_since_previous_sweep(
+        self, sut, tileset_vm, tile_vm
+    ) -> None:
+        sut.get(viewmodel=tileset_vm(tile_vm(1)), parent_background=Color.BG2)
+        sut.get(viewmodel=tileset_vm(tile_vm(2)), parent_background=Color.BG2)
+        sut.sweep()
+        sut.get(viewmodel=tileset_vm(tile_vm(2)), parent_background=Color.BG2)
+
+        sut.sweep()
+
+        assert len(sut) == 1
@@ -0,0 +1,81 @@
+from prompt_toolkit.layout.screen import Char, Screen
+
+from src.tuicub.game.widgets.damage import Damage
+from src.tuicub.game.widgets.frame import Frame
+
+
+class TestAdd:
+    def test_merges_overlapping_spans(self) -> None:
+        sut = Damage()
+
+        sut.add(Frame(x=0, y=0, width=4, height=1))
+        sut.add(Frame(x=2, y=0, width=4, height=1))
+
+        assert sut.spans(0, 0, 80) == [(0, 6)]
+
+    def test_keeps_disjoint_spans_sorted(self) -> None:
+        sut = Damage()
+
+        sut.add(Frame(x=10, y=0, width=2, height=1))
+        sut.add(Frame(x=0, y=0, width=2, height=1))
+
+        assert sut.spans(0, 0, 80) == [(0, 2), (10, 12)]
+
+    def test_when_frame_empty__adds_nothing(self) -> None:
+        sut = Damage()
+
+        sut.add(Frame(x=0, y=0, width=0, height=3))
+
+        assert not sut
+
+
+class TestIntersects:
+    def test_when_frame_overlaps_damage__returns_true(self) -> None:
+        sut = Damage()
+        sut.add(Frame(x=4, y=2, width=4, height=3))
+
+        result = sut.intersects(Frame(x=7, y=4, width=10, height=10))
+
+        assert result is True
+
+    def test_when_frame_is_adjacent_to_damage__returns_false(self) -> None:
+        sut = Damage()
+        sut.add(Frame(x=4, y=2, width=4, height=3))
+
+        result = sut.intersects(Frame(x=8, y=2, width=10, height=3))
+
+        assert result is False
+
+
+class TestSpans:
+    def test_returns_spans_clipped_to_range(self) -> None:
+        sut = Damage()
+        sut.add(Frame(x=0, y=1, width=10, height=1))
+
+        result = sut.spans(1, 4, 20)
+
+        assert result == [(4, 10)]
+
+
+class TestErase:
+    def test_removes_damaged_cells_from_screen(self) -> None:
+        screen = Screen()
+        screen.data_buffer[0][0] = Char("a", "")
+        screen.data_buffer[0][1] = Char("b", "")
+        sut = Damage()
+        sut.add(Frame(x=1, y=0, width=1, height=1))
+
+        sut.erase(screen)
+
+        assert dict(screen.data_buffer[0]) == {0: Char("a", "")}
+
+
+class TestLen:
+    def test_returns_number_of_damaged_cells(self) -> None:
+        sut = Damage()
+        sut.add(Frame(x=0, y=0, width=4, height=2))
+        sut.add(Frame(x=2, y=1, width=4, height=1))
+
+        result = len(sut)
+
+        assert result == 10
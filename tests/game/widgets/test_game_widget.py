@@ -115,7 +115,7 @@ class TestRender:
                 screen=screen,
                 frame=frame,
                 width=frame.width,
-                height=frame.height - (top_bar.height + rack.height),
+                height=frame.height - (top_bar.height + rack.height + status_bar.height),
                 y_offset=top_bar.height,
             ),
             call(
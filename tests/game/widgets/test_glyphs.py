@@ -0,0 +1,96 @@
+import gc
+
+import pytest
+from prompt_toolkit.formatted_text import split_lines
+from prompt_toolkit.layout.screen import _CHAR_CACHE
+
+from src.tuicub.common.views import Color, RenderProfile, Theme
+from src.tuicub.game.viewmodels.tile import VirtualTileViewModel
+from src.tuicub.game.widgets.glyphs import _ATLASES, TileGlyphAtlas
+
+
+@pytest.fixture()
+def theme() -> Theme:
+    return Theme.default()
+
+
+@pytest.fixture()
+def sut(theme) -> TileGlyphAtlas:
+    return TileGlyphAtlas(theme=theme)
+
+
+class TestForTheme:
+    def test_when_same_theme__returns_same_atlas(self, theme) -> None:
+        expected = TileGlyphAtlas.for_theme(theme)
+
+        result = TileGlyphAtlas.for_theme(theme)
+
+        assert result is expected
+
+    def test_when_different_theme__returns_different_atlas(self, theme) -> None:
+        other = TileGlyphAtlas.for_theme(Theme())
+
+        result = TileGlyphAtlas.for_theme(theme)
+
+        assert result is not other
+
+    def test_atlas_is_released_with_theme(self) -> None:
+        expected = len(_ATLASES)
+        TileGlyphAtlas.for_theme(Theme())
+
+        gc.collect()
+
+        assert len(_ATLASES) == expected
+
+
+class TestGlyphs:
+    def test_returns_rows_of_viewmodel_content(self, sut, theme, tile_vm) -> None:
+        viewmodel = tile_vm(7, is_selected=True, is_highlighted=True, is_new=True)
+        expected = tuple(
+            tuple(_CHAR_CACHE[char, style] for style, text, *_ in line for char in text)
+            for line in split_lines(
+                viewmodel.content(parent_background=Color.BG2, theme=theme)
+            )
+        )
+
+        result = sut.glyphs(viewmodel=viewmodel, parent_background=Color.BG2)
+
+        assert result == expected
+
+    def test_when_equal_viewmodel__returns_same_glyphs(self, sut, tile_vm) -> None:
+        expected = sut.glyphs(viewmodel=tile_vm(1), parent_background=Color.BG2)
+
+        result = sut.glyphs(viewmodel=tile_vm(1), parent_background=Color.BG2)
+
+        assert result is expected
+        assert len(sut) == 1
+
+    def test_when_virtual_tile__returns_virtual_tile_glyphs(
+        self, sut, tile, tile_vm
+    ) -> None:
+        viewmodel = VirtualTileViewModel(
+            tile=tile(1), is_selected=False, is_highlighted=False, is_new=False
+        )
+        regular = sut.glyphs(viewmodel=tile_vm(1), parent_background=Color.BG2)
+
+        result = sut.glyphs(viewmodel=viewmodel, parent_background=Color.BG2)
+
+        assert result != regular
+
+    def test_when_parent_background_differs__returns_different_glyphs(
+        self, sut, tile_vm
+    ) -> None:
+        rack = sut.glyphs(viewmodel=tile_vm(1), parent_background=Color.BG3)
+
+        result = sut.glyphs(viewmodel=tile_vm(1), parent_background=Color.BG2)
+
+        assert result != rack
+
+    def test_when_reduced_profile__returns_ascii_glyphs(self, tile_vm) -> None:
+        expected = ".--."
+        theme = Theme(profile=RenderProfile.COLORS_16)
+        sut = TileGlyphAtlas(theme=theme)
+
+        result = sut.glyphs(viewmodel=tile_vm(1), parent_background=Color.BG2)
+
+        assert "".join(char.char for char in result[0]) == expected
@@ -0,0 +1,47 @@
+from src.tuicub.common.views import Color
+from src.tuicub.game.widgets.overflow import OverflowDirection, OverflowWidget
+
+
+class TestRender:
+    def test_writes_up_indicator_with_hidden_rows_count(
+        self, theme, renderer, screen, frame
+    ) -> None:
+        sut = OverflowWidget(count=2, direction=OverflowDirection.UP, theme=theme)
+
+        sut.render(renderer=renderer, screen=screen, frame=frame)
+
+        renderer.blit_text.assert_called_once_with(
+            "▲ 2 more rows ▲", theme.style.return_value, 0, 0, frame, screen
+        )
+        theme.style.assert_called_once_with(fg=Color.FG4, bg=Color.BG2)
+
+    def test_when_single_row_down__writes_down_indicator_in_singular(
+        self, theme, renderer, screen, frame
+    ) -> None:
+        sut = OverflowWidget(count=1, direction=OverflowDirection.DOWN, theme=theme)
+
+        sut.render(renderer=renderer, screen=screen, frame=frame)
+
+        renderer.blit_text.assert_called_once_with(
+            "▼ 1 more row ▼", theme.style.return_value, 0, 0, frame, screen
+        )
+
+
+class TestWidth:
+    def test_returns_length_of_text(self, theme) -> None:
+        expected = 15
+        sut = OverflowWidget(count=2, direction=OverflowDirection.UP, theme=theme)
+
+        result = sut.width
+
+        assert result == expected
+
+
+class TestHeight:
+    def test_returns_one(self, theme) -> None:
+        expected = 1
+        sut = OverflowWidget(count=2, direction=OverflowDirection.UP, theme=theme)
+
+        result = sut.height
+
+        assert result == expected
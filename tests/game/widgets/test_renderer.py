@@ -6,7 +6,7 @@ import pytest
 from prompt_toolkit.layout.screen import _CHAR_CACHE, Char, Screen, Transparent
 
 from src.tuicub.common.strings import BOTTOM_BORDER, TOP_BORDER
-from src.tuicub.common.views import Color
+from src.tuicub.common.views import Color, RenderProfile
 from src.tuicub.game.widgets.base import BaseWidget
 from src.tuicub.game.widgets.frame import Frame
 from src.tuicub.game.widgets.renderer import (
@@ -91,6 +91,25 @@ class TestWriteContent:
         assert screen.data_buffer == expected
 
 
+class TestWriteGlyphs:
+    def test_screen_data_buffer_has_rows_at_frame_offset(self, sut, screen) -> None:
+        expected = {
+            2: {1: Char("a", style="foo"), 2: Char("b", style="foo")},
+            3: {1: Char("c", style="bar")},
+        }
+
+        sut.write_glyphs(
+            (
+                (Char("a", style="foo"), Char("b", style="foo")),
+                (Char("c", style="bar"),),
+            ),
+            frame=Frame(x=1, y=2, width=80, height=24),
+            screen=screen,
+        )
+
+        assert screen.data_buffer == expected
+
+
 class TestWriteCenteredContent:
     def test_when_single_line__screen_data_buffer_has_single_dict_with_correct_offset(
         self, sut, screen
@@ -137,6 +156,61 @@ class TestWriteCenteredContent:
         assert screen.data_buffer == expected
 
 
+class TestBlit:
+    def test_writes_chars_at_frame_offset(self, sut, screen) -> None:
+        expected = {3: {2: Char("a", style="foo"), 3: Char("b", style="foo")}}
+
+        sut.blit(
+            chars=(Char("a", style="foo"), Char("b", style="foo")),
+            x_offset=1,
+            y_offset=1,
+            frame=Frame(x=1, y=2, width=4, height=4),
+            screen=screen,
+        )
+
+        assert screen.data_buffer == expected
+
+    def test_when_run_exceeds_frame__clips_run_to_frame(self, sut, screen) -> None:
+        expected = {0: {1: Char("b", style="foo"), 2: Char("c", style="foo")}}
+
+        sut.blit(
+            chars=tuple(Char(char, style="foo") for char in "abcd"),
+            x_offset=-1,
+            y_offset=0,
+            frame=Frame(x=1, y=0, width=2, height=1),
+            screen=screen,
+        )
+
+        assert screen.data_buffer == expected
+
+    def test_when_row_outside_frame__writes_nothing(self, sut, screen) -> None:
+        sut.blit(
+            chars=(Char("a", style="foo"),),
+            x_offset=0,
+            y_offset=1,
+            frame=Frame(x=0, y=0, width=2, height=1),
+            screen=screen,
+        )
+
+        assert screen.data_buffer == {}
+
+
+class TestBlitText:
+    def test_writes_text_with_style(self, sut, screen) -> None:
+        expected = {0: {0: Char("h", style="foo"), 1: Char("i", style="foo")}}
+
+        sut.blit_text(
+            text="hi",
+            style="foo",
+            x_offset=0,
+            y_offset=0,
+            frame=Frame(x=0, y=0, width=2, height=1),
+            screen=screen,
+        )
+
+        assert screen.data_buffer == expected
+
+
 class TestDrawBorder:
     def test_screen_data_buffer_contains_bordered_square(
         self, sut, screen, theme
@@ -225,6 +299,16 @@ class TestSetBackgroundColor:
 
         screen.fill_area.assert_called_once_with(write_position, style=background_color)
 
+    def test_when_reduced_profile__does_not_fill_screen_area(
+        self, screen, theme, frame
+    ) -> None:
+        theme.profile = RenderProfile.COLORS_16
+        sut = Renderer(theme=theme)
+
+        sut.set_background_color(Color.BG2, screen=screen, frame=frame)
+
+        screen.fill_area.assert_not_called()
+
 
 class TestRenderHorizontally:
     def test_when_position_left__renders_widgets_from_left_to_right(
@@ -479,3 +563,123 @@ class TestRenderWidget:
         widget.render.assert_called_once_with(
             renderer=sut, screen=screen, frame=Frame(x=30, y=15, width=10, height=10)
         )
+
+
+class _Label(BaseWidget):
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.render_count = 0
+
+    @property
+    def width(self) -> int:
+        return len(self.text)
+
+    @property
+    def height(self) -> int:
+        return 1
+
+    def render(self, renderer: Renderer, screen: Screen, frame: Frame) -> None:
+        self.render_count += 1
+        renderer.write_content([("fg:#fff", self.text)], frame, screen)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _Label):
+            return NotImplemented
+        return self.text == other.text
+
+
+class _Row(BaseWidget):
+    def __init__(self, *labels: _Label) -> None:
+        self.labels = labels
+
+    def is_frame_damaged(self, previous: BaseWidget) -> bool:
+        return False
+
+    def render(self, renderer: Renderer, screen: Screen, frame: Frame) -> None:
+        renderer.render_horizontally(
+            self.labels, HorizontalPosition.LEFT, frame, screen, spacing=1
+        )
+        renderer.set_background_color(Color.BG2, screen, frame)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _Row):
+            return NotImplemented
+        return self.labels == other.labels
+
+
+class TestRenderRoot:
+    @pytest.fixture()
+    def root_frame(self) -> Frame:
+        return Frame(x=0, y=0, width=12, height=1)
+
+    @pytest.fixture(autouse=True)
+    def _theme_bg(self, theme) -> None:
+        theme.to_framework_bg.return_value = "bg:#000"
+
+    def test_first_render__paints_all_widgets(self, sut, root_frame) -> None:
+        screen = Screen()
+        root = _Row(_Label("foo"), _Label("bar"))
+
+        sut.render_root(widget=root, screen=screen, frame=root_frame)
+
+        assert screen.data_buffer[0][4] == Char("b", style="bg:#000 fg:#fff")
+        assert screen.data_buffer[0][11] == Char(" ", style="bg:#000 [transparent]")
+
+    def test_when_tree_unchanged__repaints_nothing_and_copies_back_buffer(
+        self, sut, root_frame
+    ) -> None:
+        sut.render_root(
+            widget=_Row(_Label("foo"), _Label("bar")), screen=Screen(), frame=root_frame
+        )
+        screen = Screen()
+        root = _Row(_Label("foo"), _Label("bar"))
+
+        damage = sut.render_root(widget=root, screen=screen, frame=root_frame)
+
+        assert len(damage) == 0
+        assert root.labels[0].render_count == 0
+        assert root.labels[1].render_count == 0
+        assert screen.data_buffer[0][0] == Char("f", style="bg:#000 fg:#fff")
+
+    def test_when_single_widget_changed__repaints_only_that_widget(
+        self, sut, root_frame
+    ) -> None:
+        sut.render_root(
+            widget=_Row(_Label("foo"), _Label("bar")), screen=Screen(), frame=root_frame
+        )
+        screen = Screen()
+        root = _Row(_Label("foo"), _Label("baz"))
+
+        damage = sut.render_root(widget=root, screen=screen, frame=root_frame)
+
+        assert len(damage) == 3
+        assert root.labels[0].render_count == 0
+        assert root.labels[1].render_count == 1
+        assert screen.data_buffer[0][0] == Char("f", style="bg:#000 fg:#fff")
+        assert screen.data_buffer[0][6] == Char("z", style="bg:#000 fg:#fff")
+
+    def test_when_widget_disappeared__repaints_its_frame_with_background(
+        self, sut, root_frame
+    ) -> None:
+        sut.render_root(
+            widget=_Row(_Label("foo"), _Label("bar")), screen=Screen(), frame=root_frame
+        )
+        screen = Screen()
+
+        sut.render_root(widget=_Row(_Label("foo")), screen=screen, frame=root_frame)
+
+        assert screen.data_buffer[0][5] == Char(" ", style="bg:#000 [transparent]")
+
+    def test_when_frame_changed__repaints_all_widgets(self, sut, root_frame) -> None:
+        sut.render_root(
+            widget=_Row(_Label("foo"), _Label("bar")), screen=Screen(), frame=root_frame
+        )
+        root = _Row(_Label("foo"), _Label("bar"))
+
+        damage = sut.render_root(
+            widget=root, screen=Screen(), frame=Frame(x=0, y=0, width=20, height=1)
+        )
+
+        assert len(damage) == 20
+        assert root.labels[0].render_count == 1
+        assert root.labels[1].render_count == 1
@@ -34,3 +34,37 @@ class TestHeight:
         result = sut.height
 
         assert result == expected
+
+
+class TestIsHighlighted:
+    def test_when_tileset_highlighted__returns_true(
+        self, theme, tileset_vm, tile_vm
+    ) -> None:
+        sut = RowWidget(
+            tilesets=(tileset_vm(tile_vm(1), is_highlighted=True),), theme=theme
+        )
+
+        result = sut.is_highlighted
+
+        assert result is True
+
+    def test_when_tile_highlighted__returns_true(
+        self, theme, tileset_vm, tile_vm
+    ) -> None:
+        sut = RowWidget(
+            tilesets=(tileset_vm(tile_vm(1), tile_vm(2, is_highlighted=True)),),
+            theme=theme,
+        )
+
+        result = sut.is_highlighted
+
+        assert result is True
+
+    def test_when_nothing_highlighted__returns_false(
+        self, theme, tileset_vm, tile_vm
+    ) -> None:
+        sut = RowWidget(tilesets=(tileset_vm(tile_vm(1), tile_vm(2)),), theme=theme)
+
+        result = sut.is_highlighted
+
+        assert result is False
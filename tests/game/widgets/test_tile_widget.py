@@ -1,4 +1,4 @@
-from unittest.mock import Mock, create_autospec
+from unittest.mock import Mock, create_autospec, patch
 
 import pytest
 
@@ -26,18 +26,21 @@ def sut(viewmodel, theme, parent_background) -> TileWidget:
 
 
 class TestRender:
-    def test_writes_viewmodel_content(
+    def test_writes_glyphs_from_theme_atlas(
         self, sut, theme, renderer, screen, viewmodel, frame, parent_background
     ) -> None:
-        content = Mock()
-        viewmodel.content.return_value = content
+        glyphs = Mock()
 
-        sut.render(renderer=renderer, screen=screen, frame=frame)
+        with patch("src.tuicub.game.widgets.tile.TileGlyphAtlas") as mocked_atlas:
+            mocked_atlas.for_theme.return_value.glyphs.return_value = glyphs
 
-        renderer.write_content.assert_called_once_with(content, frame, screen)
-        viewmodel.content.assert_called_once_with(
-            parent_background=parent_background, theme=theme
-        )
+            sut.render(renderer=renderer, screen=screen, frame=frame)
+
+            renderer.write_glyphs.assert_called_once_with(glyphs, frame, screen)
+            mocked_atlas.for_theme.assert_called_once_with(theme)
+            mocked_atlas.for_theme.return_value.glyphs.assert_called_once_with(
+                viewmodel=viewmodel, parent_background=parent_background
+            )
 
 
 class TestHeight:
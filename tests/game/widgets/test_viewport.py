@@ -0,0 +1,61 @@
+import pytest
+
+from src.tuicub.game.widgets.viewport import BoardViewport
+
+
+@pytest.fixture()
+def sut() -> BoardViewport:
+    return BoardViewport()
+
+
+class TestScroll:
+    def test_when_target_visible__keeps_offset(self, sut) -> None:
+        expected = 0
+
+        result = sut.scroll(target=2, visible_rows=3, total_rows=10)
+
+        assert result == expected
+
+    def test_when_target_below__scrolls_until_target_is_last_visible_row(
+        self, sut
+    ) -> None:
+        expected = 3
+
+        result = sut.scroll(target=5, visible_rows=3, total_rows=10)
+
+        assert result == expected
+        assert sut.offset == expected
+
+    def test_when_target_above__scrolls_until_target_is_first_visible_row(
+        self, sut
+    ) -> None:
+        sut.scroll(target=8, visible_rows=3, total_rows=10)
+        expected = 4
+
+        result = sut.scroll(target=4, visible_rows=3, total_rows=10)
+
+        assert result == expected
+
+    def test_when_no_target__keeps_offset(self, sut) -> None:
+        sut.scroll(target=5, visible_rows=3, total_rows=10)
+        expected = 3
+
+        result = sut.scroll(target=None, visible_rows=3, total_rows=10)
+
+        assert result == expected
+
+    def test_when_rows_removed__clamps_offset_to_last_page(self, sut) -> None:
+        sut.scroll(target=9, visible_rows=3, total_rows=10)
+        expected = 2
+
+        result = sut.scroll(target=None, visible_rows=3, total_rows=5)
+
+        assert result == expected
+
+    def test_when_all_rows_visible__returns_zero(self, sut) -> None:
+        sut.scroll(target=9, visible_rows=3, total_rows=10)
+        expected = 0
+
+        result = sut.scroll(target=None, visible_rows=5, total_rows=3)
+
+        assert result == expected